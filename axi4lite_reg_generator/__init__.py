@@ -15,15 +15,31 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
-import importlib.metadata
-from .regdef import RegDef as RegDef
+# RegDef and __version__ are loaded on first access so that the command line
+# tools can start without importing Jinja2 or the package metadata machinery.
+__all__ = ['RegDef', '__version__']
 
 
 def get_version():
+    import importlib.metadata
+
     try:
         return importlib.metadata.version('axi4lite_reg_generator')
     except importlib.metadata.PackageNotFoundError:
         return '0.0.0'
 
 
-__version__ = get_version()
+def __getattr__(name):
+    if name == 'RegDef':
+        from .regdef import RegDef
+
+        return RegDef
+    if name == '__version__':
+        global __version__
+        __version__ = get_version()
+        return __version__
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -15,10 +15,41 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
 import argparse
 import os
 import sys
+from typing import TYPE_CHECKING
 import axi4lite_reg_generator
+import axi4lite_reg_generator.build_cache as build_cache
+from axi4lite_reg_generator.phases import Phase, PhaseCallback, Timings
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+# Output file extension, description, and RegDef output target for each file
+TARGETS = (
+    ('.vhd', 'VHDL', 'vhdl'),
+    ('.v', 'Verilog', 'verilog'),
+    ('.sv', 'SystemVerilog', 'systemverilog'),
+    ('.md', 'Documentation', 'md'),
+)
+
+
+class VersionAction(argparse.Action):
+    """Print the package version and exit.
+
+    The version is looked up only when the option is given, because reading the
+    package metadata is slow compared to the rest of startup.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message=f'{parser.prog} {axi4lite_reg_generator.__version__}\n')
 
 
 def report_file_exists(file: str) -> bool:
@@ -38,22 +69,58 @@ def main():
     parser.add_argument(
         '-o', '--output', type=str, required=True, help='Output save base file name'
     )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of output files to render in parallel (default: 1)',
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip generation when the inputs are unchanged since the last run',
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate the outputs that change whenever the JSON '
+        'file or a file it includes changes',
+    )
+    parser.add_argument(
+        '--reproducible',
+        action='store_const',
+        const=True,
+        help='Generate byte-identical output for identical inputs by leaving the '
+        'username, hostname, and time out of the headers. The time from '
+        'SOURCE_DATE_EPOCH is used if set. Also enabled by setting SOURCE_DATE_EPOCH.',
+    )
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Print the time spent in each phase of generation',
+    )
+    parser.add_argument(
+        '--profile',
+        type=str,
+        metavar='FILE',
+        help='Write cProfile data for generation to FILE (renders in --jobs worker '
+        'processes are not included)',
+    )
     parser.add_argument(
         '--version',
-        action='version',
-        version=f'%(prog)s {axi4lite_reg_generator.__version__}',
+        action=VersionAction,
+        help="show program's version number and exit",
     )
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error('argument -j/--jobs: must be at least 1')
+
     if not report_file_exists(args.json_input):
         exit(-1)
 
-    output_entity_name = os.path.split(args.output)[1]
-    regs = axi4lite_reg_generator.regdef.RegDef.from_json_file(
-        args.json_input, entity_name=output_entity_name
-    )
-
     if os.path.splitext(args.output)[1] in ('.vhd', '.v', '.md'):
         print(
             'ERROR: Output file name should not include an extension. Continuing...',
@@ -62,18 +129,112 @@ def main():
         args.output = os.path.splitext(args.output)[0]
         exit(-1)
 
-    with open(fname := (args.output + '.vhd'), 'w') as f_out:
-        print(f'Writing VHDL to: {fname}')
-        f_out.write(regs.to_vhdl())
-    with open(fname := (args.output + '.v'), 'w') as f_out:
-        print(f'Writing Verilog to: {fname}')
-        f_out.write(regs.to_verilog())
-    with open(fname := (args.output + '.sv'), 'w') as f_out:
-        print(f'Writing SystemVerilog to: {fname}')
-        f_out.write(regs.to_systemverilog())
-    with open(fname := (args.output + '.md'), 'w') as f_out:
-        print(f'Writing Documentation to: {fname}')
-        f_out.write(regs.to_md())
+    output_entity_name = os.path.split(args.output)[1]
+
+    if args.watch:
+        from axi4lite_reg_generator.watch import Watcher
+
+        watcher = Watcher(
+            args.json_input,
+            {target: args.output + ext for ext, _, target in TARGETS},
+            entity_name=output_entity_name,
+            reproducible=args.reproducible,
+        )
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    timings = Timings() if args.timings else None
+    profiler = None
+    if args.profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        generate(args, output_entity_name, timings)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f'Profile written to: {args.profile}')
+    if timings is not None:
+        print(timings.report())
+
+
+def generate(
+    args: argparse.Namespace,
+    output_entity_name: str,
+    on_phase: PhaseCallback | None = None,
+) -> None:
+    if args.incremental:
+        output_files = [args.output + ext for ext, _, _ in TARGETS]
+        try:
+            key = build_cache.compute_key(
+                args.json_input,
+                axi4lite_reg_generator.__version__,
+                dict(
+                    entity_name=output_entity_name,
+                    reproducible=args.reproducible,
+                    source_date_epoch=os.environ.get('SOURCE_DATE_EPOCH'),
+                ),
+            )
+        except (OSError, ValueError):
+            # Let normal generation report problems with the inputs
+            key = None
+        if key is not None and build_cache.is_up_to_date(
+            args.output, key, output_files
+        ):
+            print(f'Outputs are up to date: {args.output}')
+            return
+
+    # Imported here so that --version and --incremental do not load Jinja2
+    from axi4lite_reg_generator.regdef import RegDef
+
+    regs = RegDef.from_json_file(
+        args.json_input,
+        entity_name=output_entity_name,
+        on_phase=on_phase,
+        reproducible=args.reproducible,
+    )
+
+    if args.jobs > 1:
+        import concurrent.futures
+
+        # Render every target in its own process from the same flattened RegDef.
+        # Workers do not report phases, so the renders are timed as one phase.
+        with Phase(on_phase, 'render') as phase:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(args.jobs, len(TARGETS))
+            ) as pool:
+                rendered = [
+                    pool.submit(regs.render_to_file, target, args.output + ext)
+                    for ext, _, target in TARGETS
+                ]
+                write_outputs(args.output, regs, rendered)
+            phase.registers = len(regs._cfg)
+    else:
+        write_outputs(args.output, regs)
+
+    if args.incremental and key is not None:
+        build_cache.save(args.output, key, output_files)
+
+
+def write_outputs(
+    output: str,
+    regs: axi4lite_reg_generator.RegDef,
+    rendered: list[concurrent.futures.Future] | None = None,
+) -> None:
+    for ext, desc, _ in TARGETS:
+        print(f'Writing {desc} to: {output + ext}')
+    if rendered is None:
+        # Render every target from one shared template context
+        regs.render_all_to_files({target: output + ext for ext, _, target in TARGETS})
+    else:
+        for future in rendered:
+            future.result()
 
 
 if __name__ == '__main__':
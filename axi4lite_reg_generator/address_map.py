@@ -0,0 +1,210 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import bisect
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+
+class Interval(NamedTuple):
+    """Address range used by a register, block, or reserved hole.
+
+    Attributes:
+        start: First byte address
+        end: Byte address after the last byte
+        name: Full name of the register or block, or RESERVED
+        kind: One of 'register', 'block', or 'reserved'
+    """
+
+    start: int
+    end: int
+    name: str
+    kind: str
+
+
+RESERVED = '<reserved>'
+
+
+class AddressAllocator:
+    """Assigns addresses in a hierarchical register map and tracks their ranges.
+
+    Registers and blocks without an explicit address are placed at the running
+    next address, moved past any reserved hole they would cover. Blocks can also
+    be aligned. Every placed item is recorded as an interval in the level of the
+    hierarchy it belongs to. When a block ends, its range is the span of its
+    contents, and the ranges of its contents are checked for overlaps by sorting
+    them, so the whole map is checked in O(n log n).
+    """
+
+    def __init__(self, word_size: int) -> None:
+        """Create allocator starting at address 0.
+
+        Args:
+            word_size: Number of bytes used by each register
+        """
+        self.word_size = word_size
+        self.next_address = 0
+        # Reserved holes, merged and sorted by start address
+        self._hole_starts: list[int] = []
+        self._hole_ends: list[int] = []
+        # Intervals of each open hierarchy level, starting with the top level.
+        # They are stored as plain tuples, which are much faster to create, and
+        # converted to Interval when reported.
+        self._levels: list[list[tuple]] = [[]]
+        self._names: list[str | None] = [None]
+        self._overlaps: list[tuple[tuple, tuple]] = []
+        self.misaligned: list[tuple[str, int, int]] = []
+
+    def reserve(self, holes: Iterable[Mapping], base: int = 0) -> None:
+        """Reserve address ranges in the current level.
+
+        Args:
+            holes: Ranges with an 'addr_offset' and a 'size' in bytes
+            base: Address that offsets are relative to
+        """
+        for hole in holes:
+            start = base + hole['addr_offset']
+            end = start + hole['size']
+            self._levels[-1].append((start, end, RESERVED, 'reserved'))
+
+            # Merge with the holes it touches
+            lo = bisect.bisect_left(self._hole_ends, start)
+            hi = bisect.bisect_right(self._hole_starts, end)
+            if lo < hi:
+                start = min(start, self._hole_starts[lo])
+                end = max(end, self._hole_ends[hi - 1])
+            self._hole_starts[lo:hi] = [start]
+            self._hole_ends[lo:hi] = [end]
+
+    def place_register(self, name: str, force: int | None = None, base: int = 0) -> int:
+        """Assign the address of a register.
+
+        Args:
+            name: Full register name
+            force: Explicit address relative to base, or None to use the next
+              free address
+            base: Address that force is relative to
+
+        Returns:
+            Register address
+        """
+        if force is not None:
+            address = base + force
+        elif self._hole_starts:
+            address = self._skip_holes(self.next_address, self.word_size, 1)
+        else:
+            address = self.next_address
+        self.next_address = address + self.word_size
+        self._levels[-1].append((address, self.next_address, name, 'register'))
+        return address
+
+    def begin_block(
+        self,
+        name: str,
+        force: int | None = None,
+        base: int = 0,
+        align: int | None = None,
+    ) -> int:
+        """Assign the base address of a block and open a level for its contents.
+
+        Args:
+            name: Full block name
+            force: Explicit address relative to base, or None to use the next
+              free address
+            base: Address that force is relative to
+            align: Optional alignment of the block address in bytes. An explicit
+              address that is not aligned is recorded in misaligned.
+
+        Returns:
+            Block base address
+        """
+        if force is not None:
+            address = base + force
+            if align is not None and address % align:
+                self.misaligned.append((name, address, align))
+        else:
+            address = self._skip_holes(self.next_address, self.word_size, align or 1)
+        self.next_address = address
+        self._levels.append([])
+        self._names.append(name)
+        return address
+
+    def end_block(self) -> None:
+        """Close the current block level and record its range in its parent."""
+        level = self._levels.pop()
+        name = self._names.pop()
+        self._overlaps.extend(find_overlaps(level))
+        if level:
+            start = min(i[0] for i in level)
+            end = max(i[1] for i in level)
+            self._levels[-1].append((start, end, name, 'block'))
+
+    def overlaps(self) -> list[tuple[Interval, Interval]]:
+        """Find overlapping ranges in the map.
+
+        Registers at the same address are not included, since they are reported
+        as duplicate addresses, and neither are reserved holes that overlap each
+        other.
+
+        Returns:
+            Pairs of overlapping intervals, from the innermost levels out
+        """
+        overlaps = self._overlaps + find_overlaps(self._levels[0])
+        return [
+            (Interval._make(a), Interval._make(b))
+            for a, b in overlaps
+            if not (a[3] == b[3] == 'reserved')
+            and not (a[3] == b[3] == 'register' and a[0] == b[0])
+        ]
+
+    def _skip_holes(self, address: int, size: int, align: int) -> int:
+        """Find the first aligned address at or after address clear of holes."""
+        while True:
+            address += -address % align
+            # Holes are sorted and disjoint, so only the last one starting before
+            # the end of the range can overlap it
+            idx = bisect.bisect_left(self._hole_starts, address + size) - 1
+            if idx < 0 or self._hole_ends[idx] <= address:
+                return address
+            address = self._hole_ends[idx]
+
+
+def find_overlaps(intervals: Iterable[tuple]) -> list[tuple[tuple, tuple]]:
+    """Find overlapping intervals.
+
+    Intervals are sorted by start address and swept while keeping the interval
+    that reaches furthest, so each overlapping interval is reported once with the
+    interval it runs into.
+
+    Args:
+        intervals: Interval tuples of (start, end, name, kind) to check
+
+    Returns:
+        Pairs of overlapping intervals in address order
+    """
+    overlaps = []
+    furthest = None
+    for interval in sorted(intervals):
+        if furthest is not None and interval[0] < furthest[1]:
+            overlaps.append((furthest, interval))
+            if interval[1] <= furthest[1]:
+                continue
+        furthest = interval
+    return overlaps
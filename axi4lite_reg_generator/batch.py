@@ -0,0 +1,220 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import time
+from axi4lite_reg_generator.__main__ import TARGETS
+
+# Keys allowed in each manifest entry
+MANIFEST_KEYS = frozenset(('input', 'output', 'entity_name'))
+
+
+def load_manifest(file: str) -> list[dict]:
+    """Load a batch manifest.
+
+    A manifest is a JSON list of entries, or a JSON or TOML table with the list
+    under the "maps" key. Each entry has an "input" JSON configuration file, an
+    "output" base file name, and an optional "entity_name" that defaults to the
+    base name of the output. Relative paths are resolved against the directory of
+    the manifest.
+
+    Example TOML manifest:
+        [[maps]]
+        input = "regs/uart.json"
+        output = "build/uart_regs"
+
+    Args:
+        file: Path to JSON or TOML manifest. Files ending in .toml are read as
+          TOML and all others as JSON.
+
+    Returns:
+        List of entries with "input", "output", and "entity_name" keys
+
+    Raises:
+        FileNotFoundError: If manifest not found
+        ValueError: If the manifest cannot be parsed or an entry is invalid
+    """
+    if os.path.splitext(file)[1].lower() == '.toml':
+        data = _load_toml(file)
+    else:
+        with open(file, 'r') as f:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('maps')
+    if not isinstance(data, list):
+        raise ValueError(f'{file}: manifest must be a list of maps or a "maps" list')
+
+    base_dir = os.path.dirname(file)
+    items = []
+    for idx, entry in enumerate(data):
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(key), str) for key in ('input', 'output')
+        ):
+            raise ValueError(f'{file}: map {idx} needs "input" and "output" paths')
+        unknown = set(entry) - MANIFEST_KEYS
+        if unknown:
+            raise ValueError(f'{file}: map {idx} has unknown keys: {sorted(unknown)}')
+        items.append(
+            dict(
+                input=os.path.join(base_dir, entry['input']),
+                output=os.path.join(base_dir, entry['output']),
+                entity_name=entry.get('entity_name')
+                or os.path.split(entry['output'])[1],
+            )
+        )
+    return items
+
+
+def _load_toml(file: str):
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ValueError(
+                f'{file}: TOML manifests need Python 3.11 or the tomli package'
+            ) from None
+    with open(file, 'rb') as f:
+        return tomllib.load(f)
+
+
+def generate(item: dict, reproducible: bool | None = None) -> dict:
+    """Generate the outputs of one manifest entry.
+
+    Errors are caught and returned in the result so that one bad register map
+    does not stop the rest of the batch. Templates and included files are cached
+    per process, so entries generated by the same process share them.
+
+    Args:
+        item: Manifest entry returned by load_manifest
+        reproducible: Passed to RegDef
+
+    Returns:
+        Dictionary with the entry's "input" and "output", a "status" of "ok" or
+        "error", the "error" message if any, and the "time" taken in seconds
+    """
+    # Imported here so that manifest errors are reported without loading Jinja2
+    from axi4lite_reg_generator.regdef import RegDef
+
+    start = time.perf_counter()
+    result = dict(input=item['input'], output=item['output'], status='ok')
+    try:
+        if os.path.splitext(item['output'])[1] in [ext for ext, _, _ in TARGETS]:
+            raise ValueError('output file name should not include an extension')
+        regs = RegDef.from_json_file(
+            item['input'], entity_name=item['entity_name'], reproducible=reproducible
+        )
+        regs.render_all_to_files(
+            {target: item['output'] + ext for ext, _, target in TARGETS}
+        )
+    except Exception as e:
+        result.update(status='error', error=f'{type(e).__name__}: {e}')
+    result['time'] = time.perf_counter() - start
+    return result
+
+
+def run(
+    items: list[dict], jobs: int | None = 1, reproducible: bool | None = None
+) -> list[dict]:
+    """Generate the outputs of every manifest entry.
+
+    With jobs=1, or a single entry, everything is generated in this process.
+    Otherwise entries are spread over a pool of worker processes. Each worker
+    keeps its template and include caches between entries, so a file included by
+    several register maps is parsed once per worker.
+
+    Args:
+        items: Manifest entries returned by load_manifest
+        jobs: Number of worker processes. Defaults to the number of CPUs.
+        reproducible: Passed to RegDef
+
+    Returns:
+        Result of each entry, in manifest order, as returned by generate
+    """
+    if len(items) <= 1 or jobs == 1:
+        return [generate(item, reproducible) for item in items]
+
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(jobs or os.cpu_count() or 1, len(items))
+    ) as pool:
+        futures = [pool.submit(generate, item, reproducible) for item in items]
+        return [future.result() for future in futures]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='AXI4Lite Register Generator Batch',
+        description='Generate the outputs of every register map in a manifest',
+    )
+    parser.add_argument('manifest', type=str, help='JSON or TOML manifest file')
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: number of CPUs)',
+    )
+    parser.add_argument(
+        '--reproducible',
+        action='store_const',
+        const=True,
+        help='Generate byte-identical output for identical inputs, as in '
+        'axi4lite_reg_generator --reproducible',
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print a machine-readable JSON summary',
+    )
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('argument -j/--jobs: must be at least 1')
+
+    try:
+        items = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f'ERROR: {e}', file=sys.stderr)
+        return 1
+
+    results = run(items, args.jobs, args.reproducible)
+    failed = sum(r['status'] != 'ok' for r in results)
+
+    if args.json:
+        print(json.dumps(dict(failed=failed, maps=results), indent=2))
+        return 1 if failed else 0
+
+    for r in results:
+        if r['status'] == 'ok':
+            print(f'Generated {r["output"]} from {r["input"]} ({r["time"]:.3f} s)')
+        else:
+            print(f'ERROR: {r["input"]}: {r["error"]}')
+    print(f'{len(results) - failed} of {len(results)} register maps generated')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import hashlib
+import json
+import os
+from axi4lite_reg_generator.template_cache import TEMPLATE_DIR
+
+
+def find_includes(json_file: str) -> list[str]:
+    """Find every file reached through 'file' entries of a register configuration.
+
+    Relative paths are resolved the same way as RegDef, against the directory of
+    the top level JSON file.
+
+    Args:
+        json_file: Path to top level JSON configuration file
+
+    Returns:
+        Paths of included files in the order they are first reached
+
+    Raises:
+        FileNotFoundError: If a referenced JSON file is not found
+        JSONDecodeError: If a JSON file is invalid
+    """
+    path_to_cfg = os.path.split(json_file)[0]
+    includes = []
+    seen = {os.path.abspath(json_file)}
+
+    def visit(file: str) -> None:
+        with open(file, 'r') as f:
+            cfg = json.load(f)
+        for item in cfg if isinstance(cfg, list) else []:
+            if not isinstance(item, dict) or not isinstance(item.get('file'), str):
+                continue
+            path = os.path.join(path_to_cfg, item['file'])
+            if os.path.abspath(path) not in seen:
+                seen.add(os.path.abspath(path))
+                includes.append(path)
+                visit(path)
+
+    visit(json_file)
+    return includes
+
+
+def compute_key(json_file: str, version: str, options: dict | None = None) -> str:
+    """Compute the content hash of everything that affects generated outputs.
+
+    The key covers the top level JSON file, every included JSON file, the
+    generator version, the template contents, and any generation options.
+
+    Args:
+        json_file: Path to top level JSON configuration file
+        version: Generator version
+        options: Additional options that change the generated outputs
+
+    Returns:
+        SHA-256 hex digest of the inputs
+
+    Raises:
+        FileNotFoundError: If a referenced JSON file is not found
+        JSONDecodeError: If a JSON file is invalid
+    """
+    h = hashlib.sha256()
+
+    def update(*values: str) -> None:
+        for value in values:
+            h.update(value.encode('utf-8'))
+            h.update(b'\0')
+
+    update('version', version)
+    update('options', json.dumps(options or {}, sort_keys=True))
+    for file in (json_file, *find_includes(json_file)):
+        with open(file, 'rb') as f:
+            update('input', file)
+            h.update(f.read())
+    for template in sorted(os.listdir(TEMPLATE_DIR)):
+        with open(os.path.join(TEMPLATE_DIR, template), 'rb') as f:
+            update('template', template)
+            h.update(f.read())
+
+    return h.hexdigest()
+
+
+def stamp_path(output: str) -> str:
+    """Get the path of the stamp file that records the last build of an output.
+
+    Args:
+        output: Output base file name
+
+    Returns:
+        Path to hidden stamp file next to the outputs
+    """
+    head, tail = os.path.split(output)
+    return os.path.join(head, f'.{tail}.regcache')
+
+
+def is_up_to_date(output: str, key: str, files: list[str]) -> bool:
+    """Check whether outputs were generated from the same inputs.
+
+    Outputs are up to date when the stamp file records the same key and every
+    output file still has the size and modification time recorded at build time.
+
+    Args:
+        output: Output base file name
+        key: Current content hash of the inputs
+        files: Output file paths
+
+    Returns:
+        True if generation can be skipped
+    """
+    try:
+        with open(stamp_path(output), 'r') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if not isinstance(stamp, dict) or stamp.get('key') != key:
+        return False
+    try:
+        return stamp.get('files') == {file: _file_stat(file) for file in files}
+    except OSError:
+        return False
+
+
+def save(output: str, key: str, files: list[str]) -> None:
+    """Record the inputs and outputs of a successful build.
+
+    Args:
+        output: Output base file name
+        key: Content hash of the inputs
+        files: Output file paths
+    """
+    stamp = dict(key=key, files={file: _file_stat(file) for file in files})
+    with open(stamp_path(output), 'w') as f:
+        json.dump(stamp, f, indent=2)
+
+
+def _file_stat(file: str) -> list[int]:
+    """Get the size and modification time of a file.
+
+    Args:
+        file: File path
+
+    Returns:
+        List of size in bytes and modification time in nanoseconds
+    """
+    st = os.stat(file)
+    return [st.st_size, st.st_mtime_ns]
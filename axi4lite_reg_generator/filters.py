@@ -16,13 +16,17 @@
 #
 # See LICENSE file for full license details.
 import math
+from collections.abc import Mapping
 
 
 def count_bits(bits):
     if isinstance(bits, int):
         return bits
-    elif isinstance(bits, dict):
+    elif isinstance(bits, Mapping):
         return bits['num_bits']
+    elif isinstance(bits, tuple):
+        # Compact Field records are read by attribute, which is much faster
+        return sum(field.num_bits for field in bits)
     elif isinstance(bits, list):
         num_bits = 0
         for field in bits:
@@ -33,8 +37,14 @@ def count_bits(bits):
 
 
 def get_offset(bits, field_name):
-    if isinstance(bits, int) or isinstance(bits, dict):
+    if isinstance(bits, int) or isinstance(bits, Mapping):
         return 0
+    elif isinstance(bits, tuple):
+        offset = 0
+        for field in reversed(bits):
+            if field.field_name == field_name:
+                return offset
+            offset += field.num_bits
     else:
         offset = 0
         for field in reversed(bits):
@@ -47,16 +57,14 @@ def default_val(reg):
     num_bits = count_bits(reg['bits'])
     if isinstance(reg['bits'], int):
         default = f'"{0:0{num_bits}b}"'
-    elif isinstance(reg['bits'], dict):
+    elif isinstance(reg['bits'], Mapping):
         v = reg['bits']['default_value']
         default = f'"{v:0{num_bits}b}"'
-    elif isinstance(reg['bits'], list):
-        default = '"'
-        for field in reg['bits']:
-            field_bits = field['num_bits']
-            v = field['default_value']
-            default += f'{v:0{field_bits}b}'
-        default += '"'
+    elif isinstance(reg['bits'], (list, tuple)):
+        default = ''.join(
+            f'{field["default_value"]:0{field["num_bits"]}b}' for field in reg['bits']
+        )
+        default = f'"{default}"'
     else:
         raise TypeError('Unknown data type')
 
@@ -0,0 +1,94 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import json
+import os
+import threading
+from axi4lite_reg_generator.schema import validate as validate_schema
+
+
+class IncludeCache:
+    """Cache of parsed and validated hierarchy files.
+
+    Each included JSON file is loaded and validated once and then reused by every
+    instance that references it. Entries are keyed by resolved path and are
+    reloaded when the file's modification time or size changes. Cached
+    configurations are shared, so callers must copy items before modifying them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty include cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[tuple[int, int], list]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, file: str) -> list:
+        """Load and validate a hierarchy file, using the cached result if current.
+
+        Args:
+            file: Path to JSON configuration file
+
+        Returns:
+            Validated configuration list. Must not be modified.
+
+        Raises:
+            FileNotFoundError: If JSON file not found
+            JSONDecodeError: If JSON is invalid
+            SchemaError: If configuration doesn't match schema
+        """
+        path = os.path.realpath(file)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+
+        with open(path, 'r') as f:
+            cfg = validate_schema(json.load(f))
+
+        with self._lock:
+            self.misses += 1
+            self._entries[path] = (stamp, cfg)
+        return cfg
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        # Cached files are not sent to other processes, which start empty
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+
+
+# Process-wide cache used when a RegDef is not given its own
+default_cache = IncludeCache()
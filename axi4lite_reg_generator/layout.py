@@ -0,0 +1,314 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import functools
+from collections.abc import Iterable
+from axi4lite_reg_generator.register import Bits, Field, Register
+
+
+# Number of address bits each level of a read mux tree selects on, which makes
+# every node a 4:1 mux
+READ_MUX_SELECT_BITS = 2
+
+
+class FieldLayout:
+    """Bit field of a register with its position resolved."""
+
+    __slots__ = (
+        'field_name',
+        'num_bits',
+        'default_value',
+        'description',
+        'low',
+        'high',
+    )
+
+    def __init__(self, field: Field, low: int) -> None:
+        """Create field layout.
+
+        Args:
+            field: Register bit field
+            low: Lowest bit of field in register
+        """
+        self.field_name = field.field_name
+        self.num_bits = field.num_bits
+        self.default_value = field.default_value
+        self.description = field.description
+        self.low = low
+        self.high = low + self.num_bits - 1
+
+
+class RegisterLayout:
+    """Register with everything the templates derive from it computed once.
+
+    Attributes:
+        width: Number of bits in register
+        padding: Number of unused bits above the register in a data word
+        default_value: Reset value of a register without fields
+        fields: Field layouts from most to least significant, or None if the
+          register has no fields
+        default_vhdl: VHDL bit string literal of the reset value
+        default_verilog: Verilog sized binary literal of the reset value
+        strobes: Tuple of (strobe index, high bit, low bit) for every write strobe
+          that covers part of the register
+        has_input: Register is read from an input port (ro or custom)
+        has_output: Register drives an output port (rw or custom)
+    """
+
+    __slots__ = (
+        'name',
+        'description',
+        'reg_type',
+        'use_upd_pulse',
+        'addr_offset',
+        'width',
+        'padding',
+        'default_value',
+        'fields',
+        'default_vhdl',
+        'default_verilog',
+        'strobes',
+        'has_input',
+        'has_output',
+    )
+
+    def __init__(self, reg: Register, data_size: int) -> None:
+        """Create register layout.
+
+        Args:
+            reg: Flattened register
+            data_size: Number of bits in a data word
+        """
+        bits = reg.bits
+        self.name = reg.name
+        self.description = getattr(reg, 'description', '')
+        self.reg_type = reg.reg_type
+        self.use_upd_pulse = reg.use_upd_pulse
+        self.addr_offset = reg.addr_offset
+        self.has_input = self.reg_type != 'rw'
+        self.has_output = self.reg_type != 'ro'
+
+        if isinstance(bits, int):
+            self.width = bits
+            self.default_value = 0
+            self.fields = None
+            self.default_vhdl, self.default_verilog = _literals(bits, 0)
+        elif isinstance(bits, Bits):
+            self.width = bits.num_bits
+            self.default_value = bits.default_value
+            self.fields = None
+            self.default_vhdl, self.default_verilog = _literals(
+                self.width, self.default_value
+            )
+        else:
+            self.fields = _field_layouts(bits)
+            self.width = sum(f.num_bits for f in self.fields)
+            self.default_value = None
+            literal = ''.join(f'{f.default_value:0{f.num_bits}b}' for f in self.fields)
+            self.default_vhdl = f'"{literal}"'
+            self.default_verilog = f"{self.width}'b{literal}"
+        self.padding = data_size - self.width
+        self.strobes = _strobes(self.width, data_size)
+
+
+class ReadMuxNode:
+    """Multiplexer in the read mux tree.
+
+    Attributes:
+        name: Name of the node, unique in the tree
+        level: Level of the node, 0 for nodes that select registers
+        key: Address bits above the selecting bits, shared by all inputs
+        stage: Pipeline stage of the address that selects the inputs
+        low: Lowest address bit that selects the inputs
+        bits: Number of address bits that select the inputs
+        inputs: Tuple of (select value, input) for each input, where the input
+          is a register layout at level 0 and a child node above it
+        registered: Output is registered before the next level
+    """
+
+    __slots__ = (
+        'name',
+        'level',
+        'key',
+        'stage',
+        'low',
+        'bits',
+        'inputs',
+        'registered',
+    )
+
+    def __init__(self, level: int, key: int, low: int, bits: int, inputs: list) -> None:
+        """Create read mux node.
+
+        Args:
+            level: Level of the node
+            key: Address bits above the selecting bits, shared by all inputs
+            low: Lowest address bit that selects the inputs
+            bits: Number of address bits that select the inputs
+            inputs: List of (select value, input) for each input
+        """
+        self.name = f'{level}_{key}'
+        self.level = level
+        self.key = key
+        self.stage = 0
+        self.low = low
+        self.bits = bits
+        self.inputs = tuple(sorted(inputs, key=lambda i: i[0]))
+        self.registered = False
+
+
+class ReadMuxTree:
+    """Balanced read mux that selects registers on a few address bits per level.
+
+    Attributes:
+        width: Number of address bits decoded by the tree. Higher address bits
+          must be zero.
+        low: Number of low address bits that must be zero, as every register
+          address is aligned to them
+        levels: Tuple of the nodes at each level, from the registers to the root
+        root: Node at the last level, which drives the read data
+        stages: Number of pipeline stages between levels
+    """
+
+    __slots__ = ('width', 'low', 'levels', 'root', 'stages')
+
+    def __init__(self, regs: list[RegisterLayout], data_size: int, stages: int) -> None:
+        """Build read mux tree.
+
+        Pipeline stages are spread evenly between the levels, so the logic
+        between stages is balanced. At most one stage is placed between two
+        levels.
+
+        Args:
+            regs: Register layouts
+            data_size: Number of bits in a data word
+            stages: Number of pipeline stages wanted in the tree
+        """
+        incr = data_size // 8
+        # Register addresses are aligned to the data size
+        self.low = (incr & -incr).bit_length() - 1
+        self.width = max(
+            [self.low + READ_MUX_SELECT_BITS]
+            + [reg.addr_offset.bit_length() for reg in regs]
+        )
+
+        levels = []
+        inputs = [(reg.addr_offset >> self.low, reg) for reg in regs]
+        low = self.low
+        while low < self.width:
+            bits = min(READ_MUX_SELECT_BITS, self.width - low)
+            groups = {}
+            for index, item in inputs:
+                groups.setdefault(index >> bits, []).append(
+                    (index & ((1 << bits) - 1), item)
+                )
+            if not groups:
+                # A map without registers still has a root that reads as zero
+                groups[0] = []
+            nodes = tuple(
+                ReadMuxNode(len(levels), key, low, bits, group)
+                for key, group in sorted(groups.items())
+            )
+            levels.append(nodes)
+            inputs = [(node.key, node) for node in nodes]
+            low += bits
+        self.levels = tuple(levels)
+        self.root = levels[-1][0]
+
+        self.stages = min(stages, len(levels) - 1)
+        for stage in range(1, self.stages + 1):
+            # Registers go after this level, rounded to the nearest level
+            last = (2 * stage * len(levels) + self.stages + 1) // (
+                2 * (self.stages + 1)
+            ) - 1
+            for node in levels[last]:
+                node.registered = True
+            for nodes in levels[last + 1 :]:
+                for node in nodes:
+                    node.stage = stage
+
+    @property
+    def registered(self) -> list[ReadMuxNode]:
+        """Nodes whose output is registered."""
+        return [node for nodes in self.levels for node in nodes if node.registered]
+
+
+@functools.lru_cache(maxsize=1024)
+def _literals(width: int, value: int) -> tuple[str, str]:
+    """Format a reset value as VHDL and Verilog literals, shared between registers."""
+    literal = f'{value:0{width}b}'
+    return f'"{literal}"', f"{width}'b{literal}"
+
+
+@functools.lru_cache(maxsize=None)
+def _strobes(width: int, data_size: int) -> tuple[tuple[int, int, int], ...]:
+    """Find the bits of a register covered by each write strobe."""
+    return tuple(
+        (s, min(width - 1, 8 * s + 7), 8 * s)
+        for s in range(data_size // 8)
+        if 8 * s < width
+    )
+
+
+def _field_layouts(bits: tuple[Field, ...]) -> tuple[FieldLayout, ...]:
+    """Resolve the position of each field in a register.
+
+    Fields are placed from the most significant bit down. A field that shares its
+    name with a later field is given the later field's low bit, matching the
+    get_offset filter.
+
+    Args:
+        bits: Register bit fields
+
+    Returns:
+        Field layouts in the same order
+    """
+    lows = {}
+    low = 0
+    for field in reversed(bits):
+        lows.setdefault(field.field_name, low)
+        low += field.num_bits
+    return tuple(FieldLayout(field, lows[field.field_name]) for field in bits)
+
+
+def build(regs: Iterable[Register], data_size: int) -> dict:
+    """Build the register layouts and subsets used by every template.
+
+    Args:
+        regs: Flattened registers
+        data_size: Number of bits in a data word
+
+    Returns:
+        Template variables:
+            - regs: Layouts of all registers
+            - regs_in: Registers read from an input port (ro and custom)
+            - regs_out: Registers that drive an output port (rw and custom)
+            - regs_rw: Read/write registers
+            - regs_upd: Output registers with an update pulse
+    """
+    layouts = [RegisterLayout(reg, data_size) for reg in regs]
+    regs_out = [reg for reg in layouts if reg.has_output]
+    return dict(
+        regs=layouts,
+        regs_in=[reg for reg in layouts if reg.has_input],
+        regs_out=regs_out,
+        regs_rw=[reg for reg in layouts if reg.reg_type == 'rw'],
+        regs_upd=[reg for reg in regs_out if reg.use_upd_pulse],
+    )
@@ -0,0 +1,161 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import time
+from typing import Callable, NamedTuple
+
+
+class PhaseEvent(NamedTuple):
+    """Start or end of a generator phase.
+
+    Phases are 'load', 'validate', 'flatten', 'include', 'checks', 'layout',
+    'render', 'template', and 'write'. Include phases are nested in the flatten
+    phase. Template phases, which load and compile templates, and write phases
+    are nested in the render phase of their target.
+
+    Attributes:
+        phase: Phase name
+        end: False for the start event and True for the end event
+        time: Time of the event from time.perf_counter, in seconds
+        target: Output target of render and write phases, or the included file of
+          include phases
+        registers: Number of registers handled by the phase, set on end events
+          when known
+        bytes: Number of bytes read or written by the phase, set on end events
+          when known
+    """
+
+    phase: str
+    end: bool
+    time: float
+    target: str | None = None
+    registers: int | None = None
+    bytes: int | None = None
+
+
+PhaseCallback = Callable[[PhaseEvent], None]
+
+
+class Phase:
+    """Context manager that reports the start and end of a phase to a callback.
+
+    The registers and bytes attributes can be set inside the block and are
+    reported with the end event. Nothing is reported when the callback is None.
+    """
+
+    __slots__ = ('callback', 'phase', 'target', 'registers', 'bytes')
+
+    def __init__(
+        self,
+        callback: PhaseCallback | None,
+        phase: str,
+        target: str | None = None,
+    ) -> None:
+        """Create phase.
+
+        Args:
+            callback: Function called with the start and end events, or None
+            phase: Phase name
+            target: Output target or included file the phase works on
+        """
+        self.callback = callback
+        self.phase = phase
+        self.target = target
+        self.registers: int | None = None
+        self.bytes: int | None = None
+
+    def __enter__(self) -> Phase:
+        if self.callback is not None:
+            self.callback(
+                PhaseEvent(self.phase, False, time.perf_counter(), self.target)
+            )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.callback is not None:
+            self.callback(
+                PhaseEvent(
+                    self.phase,
+                    True,
+                    time.perf_counter(),
+                    self.target,
+                    self.registers,
+                    self.bytes,
+                )
+            )
+
+
+class Timings:
+    """Phase callback that totals the time, registers, and bytes of each phase.
+
+    Times are exclusive: the time of a nested phase, such as writing a chunk of
+    output while rendering, is not counted in the phase that contains it.
+    Include phases are totalled under 'include' rather than per file.
+    """
+
+    def __init__(self) -> None:
+        """Create empty timings."""
+        # Phase name and target mapped to time, count, registers, and bytes
+        self.totals: dict[tuple[str, str | None], dict] = {}
+        self._stack: list[list] = []
+
+    def __call__(self, event: PhaseEvent) -> None:
+        target = None if event.phase == 'include' else event.target
+        total = self.totals.setdefault(
+            (event.phase, target), dict(time=0.0, count=0, registers=None, bytes=None)
+        )
+        if not event.end:
+            self._stack.append([event.time, 0.0])
+            return
+
+        start, nested = self._stack.pop()
+        elapsed = event.time - start
+        if self._stack:
+            self._stack[-1][1] += elapsed
+        total['time'] += elapsed - nested
+        total['count'] += 1
+        for key in ('registers', 'bytes'):
+            value = getattr(event, key)
+            if value is not None:
+                total[key] = (total[key] or 0) + value
+
+    def report(self) -> str:
+        """Format the totals as a table in the order the phases first started.
+
+        Returns:
+            Table with one line per phase and a total line
+        """
+        lines = [
+            f'{"phase":<10} {"target":<14} {"time (ms)":>10} {"count":>6} '
+            f'{"registers":>10} {"bytes":>12}'
+        ]
+        for (phase, target), total in self.totals.items():
+            lines.append(
+                f'{phase:<10} {target or "":<14} {total["time"] * 1e3:>10.1f} '
+                f'{total["count"]:>6} {_optional(total["registers"]):>10} '
+                f'{_optional(total["bytes"]):>12}'
+            )
+        elapsed = sum(total['time'] for total in self.totals.values())
+        lines.append(f'{"total":<25} {elapsed * 1e3:>10.1f}')
+        return '\n'.join(lines)
+
+
+def _optional(value: int | None) -> str:
+    return '' if value is None else str(value)
@@ -18,16 +18,42 @@
 #
 # future import required for 3.8 and 3.9 support
 from __future__ import annotations
+from collections.abc import Iterable, Mapping
+from typing import BinaryIO, Callable
 import json
 import os
-import jinja2
 import datetime
 import hashlib
 import axi4lite_reg_generator
 import axi4lite_reg_generator.filters as filters
-from axi4lite_reg_generator.schema import SCHEMA as Schema
+import axi4lite_reg_generator.layout as layout
+import axi4lite_reg_generator.template_cache as template_cache
+from axi4lite_reg_generator.address_map import AddressAllocator
+from axi4lite_reg_generator.regmap import RegMap
+from axi4lite_reg_generator.register import Register
+from axi4lite_reg_generator.include_cache import IncludeCache, default_cache
+from axi4lite_reg_generator.phases import Phase, PhaseCallback
+from axi4lite_reg_generator.schema import validate as validate_schema
+from axi4lite_reg_generator.validate import read_hash
 
-template_dir = os.path.join(os.path.dirname(__file__), 'templates')
+template_dir = template_cache.TEMPLATE_DIR
+
+# Template file and SHA-256 trailer format for each output target
+TARGETS = {
+    'vhdl': ('axi4lite_template.vhd', '\n-- SHA-256: {}'),
+    'verilog': ('axi4lite_template.v', '\n// SHA-256: {}'),
+    'systemverilog': ('axi4lite_template.sv', '\n// SHA-256: {}'),
+    'md': ('doc.md', '\n<!-- SHA-256: {} -->'),
+}
+
+# Number of characters buffered before streamed output is hashed and written
+STREAM_BUFFER_SIZE = 1 << 16
+
+# Environment variable with the build time for reproducible output, in seconds
+# since the Unix epoch (https://reproducible-builds.org/specs/source-date-epoch/)
+SOURCE_DATE_EPOCH_ENV = 'SOURCE_DATE_EPOCH'
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S %Z'
 
 
 class RegDef:
@@ -42,7 +68,13 @@ class RegDef:
     """
 
     def __init__(
-        self, cfg: dict, path_to_cfg: str = '.', entity_name: str | None = None
+        self,
+        cfg: dict,
+        path_to_cfg: str = '.',
+        entity_name: str | None = None,
+        include_cache: IncludeCache | None = None,
+        on_phase: PhaseCallback | None = None,
+        reproducible: bool | None = None,
     ) -> None:
         """Initialize register definition from configuration dictionary.
 
@@ -51,19 +83,34 @@ class RegDef:
             path_to_cfg: Base path for resolving relative file paths in configuration
             entity_name: Optional override name for HDL entity name. If not specified,
               value from JSON configuration is used.
+            include_cache: Optional cache of parsed hierarchy files. If not specified,
+              the process-wide cache is used.
+            on_phase: Optional function called with a PhaseEvent at the start and
+              end of each phase of loading and rendering. Stored as the on_phase
+              attribute, which can be changed before rendering.
+            reproducible: Generate byte-identical output for identical inputs. The
+              username and hostname are left out of the headers, the timestamp is
+              taken from SOURCE_DATE_EPOCH or left out if it is not set, and a hash
+              of the register map is added. If not specified, reproducible output
+              is generated when SOURCE_DATE_EPOCH is set.
 
         Raises:
-            ValueError: If configuration is invalid or contains duplicates
+            ValueError: If configuration is invalid or contains duplicates. All
+              duplicate and oversized registers are reported in a single error.
+              Also raised if SOURCE_DATE_EPOCH is not an integer.
             SchemaError: If configuration doesn't match required schema
         """
         # Validate the configuration data
-        self._next_address = 0
+        self.on_phase = on_phase
+        self._include_cache = default_cache if include_cache is None else include_cache
 
-        self._reg_cfg, self._cfg = self._split_config(cfg)
-        self._cfg = Schema.validate(self._cfg)
-        if entity_name is not None:
-            self._reg_cfg['entity_name'] = entity_name
-        self._reg_cfg = Schema.validate([dict(config=self._reg_cfg)])[0]['config']
+        with Phase(on_phase, 'validate') as phase:
+            self._reg_cfg, self._cfg = self._split_config(cfg)
+            self._cfg = validate_schema(self._cfg)
+            if entity_name is not None:
+                self._reg_cfg['entity_name'] = entity_name
+            self._reg_cfg = validate_schema([dict(config=self._reg_cfg)])[0]['config']
+            phase.registers = len(self._cfg)
 
         try:
             self.id_username = os.getlogin()
@@ -72,18 +119,61 @@ class RegDef:
             self.id_username = 'unknown'
         self.id_hostname = os.uname().nodename
         self.id_timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
-            '%Y-%m-%d %H:%M:%S %Z'
+            TIMESTAMP_FORMAT
         )
         self.id_version = axi4lite_reg_generator.__version__
+        self.id_input_hash = ''
 
-        self._addr_incr = int(self._reg_cfg['data_size'] / 8)
-
-        self._cfg = self._flatten_heirarchy(self._cfg, path_to_cfg)
+        epoch = os.environ.get(SOURCE_DATE_EPOCH_ENV)
+        self.reproducible = epoch is not None if reproducible is None else reproducible
+        if self.reproducible:
+            self._reg_cfg['include_username'] = False
+            self._reg_cfg['include_hostname'] = False
+            if epoch is None:
+                self._reg_cfg['include_timestamp'] = False
+            else:
+                try:
+                    epoch = int(epoch)
+                except ValueError:
+                    raise ValueError(
+                        f'{SOURCE_DATE_EPOCH_ENV} must be an integer: {epoch!r}'
+                    ) from None
+                self.id_timestamp = datetime.datetime.fromtimestamp(
+                    epoch, datetime.timezone.utc
+                ).strftime(TIMESTAMP_FORMAT)
 
-        # _calculate_address(self._cfg, self._addr_incr)
-        self._find_duplicate_addresses()
-        self._find_duplicate_names()
-        self._check_regs_too_large()
+        self._addr_incr = int(self._reg_cfg['data_size'] / 8)
+        self._allocator = AddressAllocator(self._addr_incr)
+        self._allocator.reserve(self._reg_cfg.get('reserved', ()))
+
+        with Phase(on_phase, 'flatten') as phase:
+            self._cfg = RegMap(self._flatten_heirarchy(self._cfg, path_to_cfg))
+            phase.registers = len(self._cfg)
+
+        # Collect every conflict before failing so they can be fixed at once
+        with Phase(on_phase, 'checks') as phase:
+            errors = [
+                *self._find_duplicate_addresses(),
+                *self._find_duplicate_names(),
+                *self._check_regs_too_large(),
+                *self._check_address_ranges(),
+                *self._check_interface_options(),
+            ]
+            phase.registers = len(self._cfg)
+        # The recorded ranges are only needed for the checks
+        self._allocator = None
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+        if self.reproducible:
+            self.id_input_hash = self._input_hash()
+
+    def __getstate__(self) -> dict:
+        # Phase callbacks are often not picklable, so copies sent to other
+        # processes do not report phases
+        state = self.__dict__.copy()
+        state['on_phase'] = None
+        return state
 
     def __str__(self) -> str:
         """Convert register configuration to string.
@@ -102,10 +192,29 @@ class RegDef:
         Returns:
             JSON string representation of complete register configuration
         """
-        full_cfg = self._cfg.copy()
+        full_cfg = [reg.to_dict() for reg in self._cfg]
         full_cfg.insert(0, dict(config=self._reg_cfg))
         return json.dumps(full_cfg, indent=indent)
 
+    def _input_hash(self) -> str:
+        """Hash the configuration and flattened register map.
+
+        The hash is independent of key order, whitespace, how the map is split
+        across included files, and the header options.
+
+        Returns:
+            SHA-256 hex digest
+        """
+        config = {
+            key: value
+            for key, value in self._reg_cfg.items()
+            if not key.startswith('include_')
+        }
+        full_cfg = [reg.to_dict() for reg in self._cfg]
+        full_cfg.insert(0, dict(config=config))
+        canonical = json.dumps(full_cfg, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     def _flatten_heirarchy(
         self,
         cfg: list,
@@ -115,47 +224,63 @@ class RegDef:
     ) -> list:
         """Flatten hierarchical register configuration into flat list.
 
+        Included files are loaded through the include cache, so each file is only
+        parsed and validated once. Every instance gets its own compact Register
+        records with its name prefix and address offset applied.
+
         Args:
-            cfg: List of register configurations
+            cfg: List of validated register configurations
             path_to_cfg: Base path for resolving relative paths
             instance: Current hierarchy instance name
             rel_addr: Relative base address for current hierarchy
 
         Returns:
-            Flattened list of register configurations
+            Flattened list of registers
 
         Raises:
             FileNotFoundError: If referenced JSON file not found
             JSONDecodeError: If JSON file is invalid
             SchemaError: If configuration doesn't match schema
         """
-        cfg = Schema.validate(cfg)
-        reg_cfg, cfg = RegDef._split_config(cfg, False)
+        reg_cfg, cfg = RegDef._split_config(list(cfg), False)
         if reg_cfg is not None:
             assert reg_cfg['data_size'] == self._reg_cfg['data_size']
+            # Holes reserved by an included file are relative to its base address
+            self._allocator.reserve(reg_cfg.get('reserved', ()), rel_addr)
+
+        allocator = self._allocator
 
         full_cfg = []
         for item in cfg:
             if 'file' in item:
-                with open(os.path.join(path_to_cfg, item['file']), 'r') as f:
-                    new_cfg = json.load(f)
+                with Phase(self.on_phase, 'include', item['file']) as phase:
+                    new_cfg = self._include_cache.load(
+                        os.path.join(path_to_cfg, item['file'])
+                    )
+                    phase.registers = sum('config' not in c for c in new_cfg)
                 new_instance = self._get_full_name(item['name'], instance)
 
-                self._set_next_address(item.get('addr_offset', None), rel_addr)
+                base = allocator.begin_block(
+                    new_instance,
+                    item.get('addr_offset', None),
+                    rel_addr,
+                    item.get('addr_align', None),
+                )
                 full_cfg.extend(
-                    self._flatten_heirarchy(
-                        new_cfg,
-                        path_to_cfg,
-                        new_instance,
-                        self._next_address,
-                    )
+                    self._flatten_heirarchy(new_cfg, path_to_cfg, new_instance, base)
                 )
+                allocator.end_block()
             else:
-                item['addr_offset'] = self._take_next_address(
-                    item.get('addr_offset', None), rel_addr
+                name = self._get_full_name(item['name'], instance)
+                full_cfg.append(
+                    Register.from_dict(
+                        item,
+                        addr_offset=allocator.place_register(
+                            name, item.get('addr_offset', None), rel_addr
+                        ),
+                        name=name,
+                    )
                 )
-                item['name'] = self._get_full_name(item['name'], instance)
-                full_cfg.append(item)
 
         return full_cfg
 
@@ -173,41 +298,26 @@ class RegDef:
             return name
         return self._reg_cfg['instance_separator'].join((instance, name))
 
-    def _take_next_address(self, force: int | None = None, offset: int = 0) -> int:
-        """Get next available register address.
-
-        Args:
-            force: Force specific address value
-            offset: Additional offset to apply
-
-        Returns:
-            Next register address
-        """
-        if force is not None:
-            self._next_address = force + offset
-
-        next_addr = self._next_address
-        self._next_address += self._addr_incr
-        return next_addr
-
-    def _set_next_address(self, addr: int | None, offset: int = 0) -> None:
-        """Set next available register address.
-
-        Args:
-            addr: Address to set as next
-            offset: Additional offset to apply
-        """
-        if addr is not None:
-            self._next_address = addr + offset
-
     @staticmethod
-    def from_json_file(json_file: str, entity_name: str | None = None) -> 'RegDef':
+    def from_json_file(
+        json_file: str,
+        entity_name: str | None = None,
+        include_cache: IncludeCache | None = None,
+        on_phase: PhaseCallback | None = None,
+        reproducible: bool | None = None,
+    ) -> 'RegDef':
         """Create RegDef instance from JSON configuration file.
 
         Args:
             json_file: Path to JSON configuration file
             entity_name: Optional override name for HDL entity name. If not specified,
               value from JSON configuration is used.
+            include_cache: Optional cache of parsed hierarchy files. If not specified,
+              the process-wide cache is used.
+            on_phase: Optional function called with a PhaseEvent at the start and
+              end of each phase, starting with loading the JSON file
+            reproducible: Generate byte-identical output for identical inputs. If
+              not specified, enabled when SOURCE_DATE_EPOCH is set.
 
         Returns:
             New RegDef instance
@@ -218,10 +328,19 @@ class RegDef:
             SchemaError: If configuration doesn't match schema
         """
         path_to_cfg = os.path.split(json_file)[0]
-        with open(json_file, 'r') as f:
-            cfg = json.load(f)
-
-        return RegDef(cfg, path_to_cfg=path_to_cfg, entity_name=entity_name)
+        with Phase(on_phase, 'load') as phase:
+            with open(json_file, 'r') as f:
+                phase.bytes = os.fstat(f.fileno()).st_size
+                cfg = json.load(f)
+
+        return RegDef(
+            cfg,
+            path_to_cfg=path_to_cfg,
+            entity_name=entity_name,
+            include_cache=include_cache,
+            on_phase=on_phase,
+            reproducible=reproducible,
+        )
 
     @staticmethod
     def _split_config(cfg: list, require_config: bool = True) -> tuple:
@@ -258,8 +377,7 @@ class RegDef:
         Returns:
             Generated VHDL code as string
         """
-        code = self._render_template('axi4lite_template.vhd')
-        return code[0] + '\n-- SHA-256: ' + code[1]
+        return self._render_target('vhdl')
 
     def to_verilog(self) -> str:
         """Generate Verilog code for register file.
@@ -267,8 +385,7 @@ class RegDef:
         Returns:
             Generated Verilog code as string
         """
-        code = self._render_template('axi4lite_template.v')
-        return code[0] + '\n// SHA-256: ' + code[1]
+        return self._render_target('verilog')
 
     def to_systemverilog(self) -> str:
         """Generate SystemVerilog code for register file.
@@ -276,8 +393,7 @@ class RegDef:
         Returns:
             Generated SystemVerilog code as string
         """
-        code = self._render_template('axi4lite_template.sv')
-        return code[0] + '\n// SHA-256: ' + code[1]
+        return self._render_target('systemverilog')
 
     def to_md(self) -> str:
         """Generate Markdown documentation for register file.
@@ -285,17 +401,206 @@ class RegDef:
         Returns:
             Generated Markdown documentation as string
         """
-        code = self._render_template('doc.md')
-        return code[0] + '\n<!-- SHA-256: ' + code[1] + ' -->'
+        return self._render_target('md')
+
+    def render_to_file(self, target: str, file: str | os.PathLike | BinaryIO) -> str:
+        """Stream generated output for a target into a file.
+
+        The template is rendered in chunks that are written to the file and fed to
+        an incremental SHA-256 as they are produced, so memory use does not grow
+        with the size of the register map. The output is byte-identical to the
+        UTF-8 encoding of the matching to_* method.
+
+        Output written to a path is written with write_file, so an existing file
+        with the same hash is left untouched.
+
+        Args:
+            target: Output target, one of 'vhdl', 'verilog', 'systemverilog', or 'md'
+            file: Path of file to write or binary file object to write to
+
+        Returns:
+            SHA-256 hash of the generated output, as written in its trailer
+
+        Raises:
+            KeyError: If target is unknown
+            TemplateError: If template rendering fails
+        """
+        return self._stream_target(target, file, self._template_context())
+
+    def render_all(
+        self, targets: Iterable[str] = TARGETS
+    ) -> dict[str, tuple[str, str]]:
+        """Generate output for several targets from one shared template context.
+
+        Register layouts and the other template variables are built once and
+        reused by every target, instead of once per to_* call.
+
+        Args:
+            targets: Output targets to render. Defaults to every target.
+
+        Returns:
+            Dictionary mapping each target to a tuple containing:
+                - Generated output as string, identical to the matching to_* method
+                - SHA-256 hash of the generated output, as written in its trailer
+
+        Raises:
+            KeyError: If a target is unknown
+            TemplateError: If template rendering fails
+        """
+        targets = _check_targets(targets)
+        context = self._template_context()
+        rendered = {}
+        for target in targets:
+            with Phase(self.on_phase, 'render', target) as phase:
+                with Phase(self.on_phase, 'template', target):
+                    template_cache.get_template(TARGETS[target][0])
+                code, hash = self._render_template(TARGETS[target][0], context=context)
+                phase.registers = len(self._cfg)
+            rendered[target] = (code + TARGETS[target][1].format(hash), hash)
+        return rendered
+
+    def render_all_to_files(
+        self, files: Mapping[str, str | os.PathLike | BinaryIO]
+    ) -> dict[str, str]:
+        """Stream generated output for several targets from one shared context.
+
+        Each output is streamed the same way as render_to_file, with the template
+        context built once for all of them.
+
+        Args:
+            files: Dictionary mapping each output target to the path of the file
+              to write or a binary file object to write to
+
+        Returns:
+            Dictionary mapping each target to the SHA-256 hash of its output
+
+        Raises:
+            KeyError: If a target is unknown
+            TemplateError: If template rendering fails
+        """
+        _check_targets(files)
+        context = self._template_context()
+        return {
+            target: self._stream_target(target, file, context)
+            for target, file in files.items()
+        }
+
+    def _stream_target(
+        self, target: str, file: str | os.PathLike | BinaryIO, context: dict
+    ) -> str:
+        """Stream generated output for a target into a file.
+
+        Args:
+            target: Output target
+            file: Path of file to write or binary file object to write to
+            context: Template variables from _template_context
+
+        Returns:
+            SHA-256 hash of the generated output
+        """
+        template_file, trailer = TARGETS[target]
+        if not hasattr(file, 'write'):
+            return write_file(file, lambda f: self._stream_target(target, f, context))[
+                0
+            ]
+
+        with Phase(self.on_phase, 'render', target) as phase:
+            with Phase(self.on_phase, 'template', target):
+                template = template_cache.get_template(template_file)
+            h = hashlib.sha256()
+            written = 0
+
+            def write(data: bytes) -> None:
+                nonlocal written
+                with Phase(self.on_phase, 'write', target) as write_phase:
+                    file.write(data)
+                    write_phase.bytes = len(data)
+                written += len(data)
+
+            buffer = []
+            buffer_size = 0
+            for chunk in template.generate(context):
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+                if buffer_size >= STREAM_BUFFER_SIZE:
+                    data = ''.join(buffer).encode()
+                    h.update(data)
+                    write(data)
+                    buffer.clear()
+                    buffer_size = 0
+            data = ''.join(buffer).encode()
+            h.update(data)
+            write(data)
+
+            hash = h.hexdigest()
+            write(trailer.format(hash).encode())
+            phase.registers = len(self._cfg)
+            phase.bytes = written
+        return hash
+
+    def _render_target(self, target: str) -> str:
+        """Generate output for a target with its SHA-256 trailer.
+
+        Args:
+            target: Output target, one of 'vhdl', 'verilog', 'systemverilog', or 'md'
+
+        Returns:
+            Generated output as string
+        """
+        return self.render_all((target,))[target][0]
+
+    def _template_context(self) -> dict:
+        """Build the variables passed to every template.
+
+        Register widths, field positions, reset literals, and the register subsets
+        used by each backend are computed here once per render, so templates do
+        not derive them with repeated filter calls.
+
+        Returns:
+            Dictionary of template variables
+        """
+        with Phase(self.on_phase, 'layout') as phase:
+            context = dict(
+                strobe_size=self._reg_cfg['data_size'] // 8,
+                id_username=self.id_username,
+                id_hostname=self.id_hostname,
+                id_timestamp=self.id_timestamp,
+                id_version=self.id_version,
+                id_input_hash=self.id_input_hash,
+                **layout.build(self._cfg, self._reg_cfg['data_size']),
+                **self._reg_cfg,
+            )
+            # Each interface mode has its own default read latency
+            full = self._reg_cfg.get('throughput') == 'full'
+            context['read_latency'] = self._reg_cfg.get('read_latency') or (
+                1 if full else 2
+            )
+            if self._reg_cfg.get('read_mux') == 'tree':
+                # Read latency above two cycles is spent between tree levels
+                context['read_tree'] = layout.ReadMuxTree(
+                    context['regs'],
+                    self._reg_cfg['data_size'],
+                    max(context['read_latency'] - 2, 0),
+                )
+            phase.registers = len(self._cfg)
+        return context
 
     def _render_template(
-        self, template_file: str, template_dir: str = template_dir
+        self,
+        template_file: str,
+        template_dir: str = template_dir,
+        context: dict | None = None,
     ) -> tuple[str, str]:
         """Render Jinja2 template with register configuration.
 
+        Templates are loaded through the process-wide template cache so the
+        environment and compiled template are shared across renders.
+
         Args:
             template_file: Name of template file
             template_dir: Directory containing templates
+            context: Optional template variables from _template_context. If not
+              specified, they are built for this render.
 
         Returns:
             Tuple containing:
@@ -306,84 +611,206 @@ class RegDef:
             TemplateNotFound: If template file not found
             TemplateError: If template rendering fails
         """
-        j2env = jinja2.Environment(loader=jinja2.FileSystemLoader(template_dir))
-        j2env.filters['count_bits'] = filters.count_bits
-        j2env.filters['get_offset'] = filters.get_offset
-        j2env.filters['default_val'] = filters.default_val
-        j2env.filters['default_val_v'] = filters.default_val_v
-        j2env.filters['addr_bits_from_data'] = filters.addr_bits_from_data
-
-        template = j2env.get_template(template_file)
-
-        _tmp = dict(
-            strobe_size=self._reg_cfg['data_size'] // 8,
-            id_username=self.id_username,
-            id_hostname=self.id_hostname,
-            id_timestamp=self.id_timestamp,
-            id_version=self.id_version,
-            regs=self._cfg,
-            **self._reg_cfg,
-        )
-        rendered_template = template.render(_tmp)
+        template = template_cache.get_template(template_file, template_dir)
+        if context is None:
+            context = self._template_context()
+        rendered_template = template.render(context)
         hash = hashlib.sha256(rendered_template.encode()).hexdigest()
         return rendered_template, hash
 
-    def _check_regs_too_large(self) -> None:
+    def _check_regs_too_large(self) -> list[str]:
         """Check if any registers exceed maximum bit width.
 
-        Raises:
-            ValueError: If any register exceeds configured data size
+        Returns:
+            List of error messages, one per register exceeding configured data size
         """
         reg_size = self._reg_cfg['data_size']
+        errors = []
         for reg in self._cfg:
             num_bits = filters.count_bits(reg['bits'])
             if num_bits > reg_size:
-                raise ValueError(
+                errors.append(
                     f'Register contains too many bits (name: {reg["name"]}, bits: {num_bits} > {reg_size})'
                 )
+        return errors
 
-    def _find_duplicate_addresses(self) -> None:
+    def _check_interface_options(self) -> list[str]:
+        """Check that the bus interface options can be used together.
+
+        Returns:
+            List of error messages, one per conflicting option
+        """
+        errors = []
+        if (
+            self._reg_cfg.get('throughput') == 'full'
+            and self._reg_cfg.get('write_channels') == 'ordered'
+        ):
+            errors.append(
+                'Write channels are always independent with full throughput '
+                "(write_channels: 'ordered')"
+            )
+        return errors
+
+    def _check_address_ranges(self) -> list[str]:
+        """Check register and block address ranges.
+
+        Registers must be aligned to the data size and fit in the address
+        aperture if one is configured. Blocks with an alignment must be placed on
+        it. Registers, blocks, and reserved holes at the same level of the
+        hierarchy must not overlap. Registers at the same address are reported by
+        _find_duplicate_addresses instead.
+
+        Returns:
+            List of error messages, one per kind of problem found
+        """
+        errors = []
+        misaligned = [
+            reg.name for reg in self._cfg if reg.addr_offset % self._addr_incr
+        ]
+        if misaligned:
+            errors.append(
+                f'Register addresses are not aligned to the data size (names: {misaligned})'
+            )
+        if self._allocator.misaligned:
+            errors.append(
+                'Block addresses are not aligned (blocks: '
+                + ', '.join(
+                    f'{name} at {address} not aligned to {align}'
+                    for name, address, align in self._allocator.misaligned
+                )
+                + ')'
+            )
+        aperture = self._reg_cfg.get('address_aperture')
+        if aperture is not None:
+            limit = 1 << aperture
+            outside = [
+                reg.name
+                for reg in self._cfg
+                if reg.addr_offset + self._addr_incr > limit
+            ]
+            if outside:
+                errors.append(
+                    f'Register addresses are outside the {aperture} bit address aperture (names: {outside})'
+                )
+        overlaps = self._allocator.overlaps()
+        if overlaps:
+            errors.append(
+                'Address ranges overlap ('
+                + ', '.join(
+                    f'{a.name} {a.start}-{a.end - 1} and {b.name} {b.start}-{b.end - 1}'
+                    for a, b in overlaps
+                )
+                + ')'
+            )
+        return errors
+
+    def _find_duplicate_addresses(self) -> list[str]:
         """Check for duplicate register addresses.
 
-        Raises:
-            ValueError: If multiple registers share same address
+        Returns:
+            List of error messages, empty if all register addresses are unique
         """
-        addresses = [reg['addr_offset'] for reg in self._cfg]
-        duplicates = set([x for x in addresses if addresses.count(x) > 1])
+        duplicates = self._cfg.duplicate_addresses()
 
-        if len(duplicates) > 0:
-            print('ERROR: Multiple registers have the same address')
+        if len(duplicates) == 0:
+            return []
 
-        for d in duplicates:
+        print('ERROR: Multiple registers have the same address')
+        for d, regs in duplicates.items():
             print(f'Address {d}:')
-            for reg in self._cfg:
-                if reg['addr_offset'] == d:
-                    print(f'\t{reg["name"]}')
+            for reg in regs:
+                print(f'\t{reg["name"]}')
 
-        if len(duplicates) > 0:
-            raise ValueError(
-                f'Multiple registers have the same address (addresses: {list(duplicates)})'
-            )
+        return [
+            f'Multiple registers have the same address (addresses: {list(duplicates)})'
+        ]
 
-    def _find_duplicate_names(self) -> None:
+    def _find_duplicate_names(self) -> list[str]:
         """Check for duplicate register names.
 
-        Raises:
-            ValueError: If multiple registers share same name
+        Returns:
+            List of error messages, empty if all register names are unique
         """
-        names = [reg['name'] for reg in self._cfg]
-        duplicates = set([x for x in names if names.count(x) > 1])
+        duplicates = self._cfg.duplicate_names()
 
-        if len(duplicates) > 0:
-            print('ERROR: Multiple registers have the same name')
+        if len(duplicates) == 0:
+            return []
 
-        for d in duplicates:
+        print('ERROR: Multiple registers have the same name')
+        for d, regs in duplicates.items():
             print(f'Name {d}:')
-            for reg in self._cfg:
-                if reg['name'] == d:
-                    print(f'\t{reg["name"]}')
+            for reg in regs:
+                print(f'\t{reg["name"]}')
 
-        if len(duplicates) > 0:
-            raise ValueError(
-                f'Multiple registers have the same name (names: {list(duplicates)})'
-            )
+        return [f'Multiple registers have the same name (names: {list(duplicates)})']
+
+
+def _check_targets(targets: Iterable[str]) -> tuple[str, ...]:
+    """Check that every output target is known.
+
+    Args:
+        targets: Output targets
+
+    Returns:
+        Output targets as a tuple
+
+    Raises:
+        KeyError: If a target is unknown
+    """
+    targets = tuple(targets)
+    for target in targets:
+        if target not in TARGETS:
+            raise KeyError(target)
+    return targets
+
+
+def write_file(
+    file: str | os.PathLike, write: Callable[[BinaryIO], str]
+) -> tuple[str, bool]:
+    """Write a generated file atomically, keeping an identical existing file.
+
+    The output is written to a temporary file next to the destination. If the
+    existing file has the same SHA-256 trailer, the temporary file is removed and
+    the existing file, including its modification time, is left untouched.
+    Otherwise the temporary file is renamed over the destination, so readers
+    never see a partly written file.
+
+    Args:
+        file: Path of file to write
+        write: Function that writes the output to a binary file object and returns
+          its SHA-256 hash
+
+    Returns:
+        Tuple containing:
+            - SHA-256 hash returned by write
+            - True if the file was written, False if it was unchanged
+    """
+    file = os.fspath(file)
+    head, tail = os.path.split(file)
+    while True:
+        tmp = os.path.join(head, f'.{tail}.{os.urandom(4).hex()}.tmp')
+        try:
+            # Created like a regular file, so the mode follows the umask
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            hash = write(f)
+        if read_hash(file) == hash:
+            os.remove(tmp)
+            return hash, False
+        try:
+            os.chmod(tmp, os.stat(file).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return hash, True
@@ -0,0 +1,179 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import sys
+from collections.abc import Iterator, Mapping
+
+
+class _Record(Mapping):
+    """Read-only mapping view over the slots of a compact record.
+
+    Records store their values in slots instead of a per-instance dictionary. A
+    slot that was never set is treated as a missing key, so optional keys behave
+    the same as in the validated dictionaries the records replace.
+    """
+
+    __slots__ = ()
+    _keys: frozenset = frozenset()
+
+    def __getitem__(self, key: str):
+        if key in self._keys:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dictionary.
+
+        Returns:
+            Dictionary with the same keys and values
+        """
+        return {key: _to_plain(value) for key, value in self.items()}
+
+
+class Bits(_Record):
+    """Register bits given as a single value with a default."""
+
+    __slots__ = ('num_bits', 'default_value')
+    _keys = frozenset(__slots__)
+
+    def __init__(self, num_bits: int, default_value: int = 0) -> None:
+        """Create register bits.
+
+        Args:
+            num_bits: Number of bits
+            default_value: Reset value
+        """
+        self.num_bits = num_bits
+        self.default_value = default_value
+
+
+class Field(_Record):
+    """Named bit field of a register."""
+
+    __slots__ = ('field_name', 'num_bits', 'default_value', 'description')
+    _keys = frozenset(__slots__)
+
+    def __init__(
+        self,
+        field_name: str,
+        num_bits: int,
+        default_value: int = 0,
+        description: str = '',
+    ) -> None:
+        """Create bit field.
+
+        Field names and descriptions are interned because the same fields are
+        often repeated across many registers.
+
+        Args:
+            field_name: Field name
+            num_bits: Number of bits in field
+            default_value: Reset value of field
+            description: Field description
+        """
+        self.field_name = sys.intern(field_name)
+        self.num_bits = num_bits
+        self.default_value = default_value
+        self.description = sys.intern(description)
+
+
+class Register(_Record):
+    """Flattened register definition.
+
+    Registers behave as read-only mappings with the same keys as the validated
+    register dictionaries, so filters and callers can use them unchanged. Bits
+    are stored as an int, a Bits record, or a tuple of Field records.
+    """
+
+    __slots__ = (
+        'name',
+        'description',
+        'reg_type',
+        'use_upd_pulse',
+        'addr_offset',
+        'instance',
+        'bits',
+    )
+    _keys = frozenset(__slots__)
+
+    @classmethod
+    def from_dict(cls, reg: Mapping, **changes) -> Register:
+        """Create register from a validated register dictionary.
+
+        Args:
+            reg: Validated register dictionary
+            **changes: Values that replace those in the dictionary
+
+        Returns:
+            New register
+
+        Raises:
+            AttributeError: If a key is not a register key
+        """
+        self = cls.__new__(cls)
+        # Slots reject unknown keys with an AttributeError
+        for key, value in reg.items():
+            setattr(self, key, value)
+        for key, value in changes.items():
+            setattr(self, key, value)
+        self.reg_type = sys.intern(self.reg_type)
+        self.bits = compact_bits(self.bits)
+        return self
+
+
+def compact_bits(bits: int | Mapping | list) -> int | Bits | tuple[Field, ...]:
+    """Convert validated register bits to their compact form.
+
+    Args:
+        bits: Number of bits, bits dictionary, or list of field dictionaries
+
+    Returns:
+        Number of bits, Bits record, or tuple of Field records
+    """
+    if isinstance(bits, (int, _Record)):
+        return bits
+    if isinstance(bits, Mapping):
+        return Bits(bits['num_bits'], bits['default_value'])
+    return tuple(
+        f
+        if isinstance(f, Field)
+        else Field(f['field_name'], f['num_bits'], f['default_value'], f['description'])
+        for f in bits
+    )
+
+
+def _to_plain(value):
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(v) for v in value]
+    return value
@@ -0,0 +1,143 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+
+class RegMap(Sequence):
+    """Flattened register map with hash indexes by name and address.
+
+    Registers keep their insertion order so the map can be iterated like the list
+    it replaces. Each register is indexed by name and address as it is added, so
+    lookups and duplicate detection are linear in the number of registers.
+    Registers must not be renamed or moved after they are added to the map.
+    """
+
+    def __init__(self, regs: Iterable[Mapping] = ()) -> None:
+        """Create register map.
+
+        Args:
+            regs: Flattened register definitions to add to the map
+        """
+        self._regs: list[Mapping] = []
+        # Indexes hold the first register with each key. Lists are only kept for
+        # keys shared by several registers, so unique maps stay compact.
+        self._by_name: dict[str, Mapping] = {}
+        self._by_address: dict[int, Mapping] = {}
+        self._dup_names: dict[str, list[Mapping]] = {}
+        self._dup_addresses: dict[int, list[Mapping]] = {}
+        self.extend(regs)
+
+    def append(self, reg: Mapping) -> None:
+        """Add a register to the end of the map.
+
+        Args:
+            reg: Flattened register definition
+        """
+        self._regs.append(reg)
+        _index(self._by_name, self._dup_names, reg['name'], reg)
+        _index(self._by_address, self._dup_addresses, reg['addr_offset'], reg)
+
+    def extend(self, regs: Iterable[Mapping]) -> None:
+        """Add registers to the end of the map.
+
+        Args:
+            regs: Flattened register definitions
+        """
+        for reg in regs:
+            self.append(reg)
+
+    def by_name(self, name: str) -> list[Mapping]:
+        """Find registers by full name.
+
+        Args:
+            name: Full register name including hierarchy
+
+        Returns:
+            Registers with the given name
+        """
+        return _lookup(self._by_name, self._dup_names, name)
+
+    def by_address(self, address: int) -> list[Mapping]:
+        """Find registers by address.
+
+        Args:
+            address: Register byte address
+
+        Returns:
+            Registers at the given address
+        """
+        return _lookup(self._by_address, self._dup_addresses, address)
+
+    def duplicate_names(self) -> dict[str, list[Mapping]]:
+        """Find names shared by more than one register.
+
+        Returns:
+            Dictionary mapping each duplicate name to its registers, in the order
+            the names first appear
+        """
+        return {k: self._dup_names[k] for k in self._by_name if k in self._dup_names}
+
+    def duplicate_addresses(self) -> dict[int, list[Mapping]]:
+        """Find addresses shared by more than one register.
+
+        Returns:
+            Dictionary mapping each duplicate address to its registers, in the
+            order the addresses first appear
+        """
+        return {
+            k: self._dup_addresses[k]
+            for k in self._by_address
+            if k in self._dup_addresses
+        }
+
+    def __getitem__(self, idx):
+        return self._regs[idx]
+
+    def __len__(self) -> int:
+        return len(self._regs)
+
+    def __iter__(self) -> Iterator[Mapping]:
+        return iter(self._regs)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RegMap):
+            return self._regs == other._regs
+        if isinstance(other, list):
+            return self._regs == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._regs)
+
+
+def _index(index: dict, duplicates: dict, key, reg: Mapping) -> None:
+    if key in index:
+        duplicates.setdefault(key, [index[key]]).append(reg)
+    else:
+        index[key] = reg
+
+
+def _lookup(index: dict, duplicates: dict, key) -> list[Mapping]:
+    if key in duplicates:
+        return list(duplicates[key])
+    if key in index:
+        return [index[key]]
+    return []
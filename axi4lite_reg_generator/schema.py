@@ -15,9 +15,6 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
-from schema import Schema, And, Or, Optional, Use
-
-PositiveInt = And(int, lambda x: x >= 1)
 
 
 def anyToInt(v):
@@ -36,48 +33,293 @@ def anyToInt(v):
     return v
 
 
-SCHEMA = Schema(
-    [
-        Or(
-            {
-                'config': {
-                    'data_size': And(PositiveInt, lambda x: x % 8 == 0),
-                    Optional('entity_name', default='reg_file'): str,
-                    Optional('instance_separator', default='_'): str,
-                    Optional('include_username', default=True): bool,
-                    Optional('include_hostname', default=True): bool,
-                    Optional('include_timestamp', default=True): bool,
-                }
-            },
-            {
-                'name': str,
-                Optional('description'): str,
-                Optional('reg_type', default='ro'): Or('rw', 'ro', 'custom'),
-                Optional('use_upd_pulse', default=False): bool,
-                Optional('addr_offset'): int,
-                Optional('instance'): str,
-                'bits': Or(
-                    PositiveInt,
-                    {
-                        'num_bits': PositiveInt,
-                        Optional('default_value', default=0): Use(anyToInt),
-                    },
-                    [
+def _build_schema():
+    """Build the schema library definition of a register configuration."""
+    from schema import Schema, And, Or, Optional, Use
+
+    PositiveInt = And(int, lambda x: x >= 1)
+
+    return Schema(
+        [
+            Or(
+                {
+                    'config': {
+                        'data_size': And(PositiveInt, lambda x: x % 8 == 0),
+                        Optional('entity_name', default='reg_file'): str,
+                        Optional('instance_separator', default='_'): str,
+                        Optional('include_username', default=True): bool,
+                        Optional('include_hostname', default=True): bool,
+                        Optional('include_timestamp', default=True): bool,
+                        Optional('address_aperture'): PositiveInt,
+                        Optional('reserved'): [
+                            {'addr_offset': int, 'size': PositiveInt}
+                        ],
+                        Optional('throughput'): Or('basic', 'full'),
+                        Optional('write_channels'): Or('ordered', 'independent'),
+                        Optional('read_latency'): PositiveInt,
+                        Optional('read_mux'): Or('flat', 'tree'),
+                        Optional('write_decode'): Or('priority', 'onehot'),
+                    }
+                },
+                {
+                    'name': str,
+                    Optional('description'): str,
+                    Optional('reg_type', default='ro'): Or('rw', 'ro', 'custom'),
+                    Optional('use_upd_pulse', default=False): bool,
+                    Optional('addr_offset'): int,
+                    Optional('instance'): str,
+                    'bits': Or(
+                        PositiveInt,
                         {
-                            'field_name': str,
                             'num_bits': PositiveInt,
                             Optional('default_value', default=0): Use(anyToInt),
-                            Optional('description', default=''): str,
-                        }
-                    ],
-                ),
-            },
-            {
-                'name': str,
-                'file': str,
-                Optional('description'): str,
-                Optional('addr_offset'): int,
-            },
+                        },
+                        [
+                            {
+                                'field_name': str,
+                                'num_bits': PositiveInt,
+                                Optional('default_value', default=0): Use(anyToInt),
+                                Optional('description', default=''): str,
+                            }
+                        ],
+                    ),
+                },
+                {
+                    'name': str,
+                    'file': str,
+                    Optional('description'): str,
+                    Optional('addr_offset'): int,
+                    Optional('addr_align'): PositiveInt,
+                },
+            )
+        ]
+    )
+
+
+def __getattr__(name):
+    # The schema library is only imported when SCHEMA is used or a validation
+    # error is raised, which keeps it off the command line startup path
+    if name == 'SCHEMA':
+        global SCHEMA
+        SCHEMA = _build_schema()
+        return SCHEMA
+    if name == 'SchemaError':
+        from schema import SchemaError
+
+        return SchemaError
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Keys allowed in each kind of configuration item. Keys mapped to a value are
+# optional and get that default when missing, keys mapped to None are optional
+# without a default, and keys not listed here are required.
+_CONFIG_OPTIONAL = {
+    'entity_name': 'reg_file',
+    'instance_separator': '_',
+    'include_username': True,
+    'include_hostname': True,
+    'include_timestamp': True,
+    'address_aperture': None,
+    'reserved': None,
+    'throughput': None,
+    'write_channels': None,
+    'read_latency': None,
+    'read_mux': None,
+    'write_decode': None,
+}
+_REGISTER_OPTIONAL = {
+    'description': None,
+    'reg_type': 'ro',
+    'use_upd_pulse': False,
+    'addr_offset': None,
+    'instance': None,
+}
+_FILE_OPTIONAL = {'description': None, 'addr_offset': None, 'addr_align': None}
+_FIELD_OPTIONAL = {'default_value': 0, 'description': ''}
+_REG_TYPES = ('rw', 'ro', 'custom')
+_THROUGHPUTS = ('basic', 'full')
+_WRITE_CHANNELS = ('ordered', 'independent')
+_READ_MUXES = ('flat', 'tree')
+_WRITE_DECODES = ('priority', 'onehot')
+
+
+def validate(cfg: list) -> list:
+    """Validate a register configuration list against SCHEMA.
+
+    This is a specialized equivalent of SCHEMA.validate that avoids the overhead
+    of the generic schema library. It applies the same defaults and coercions and
+    raises SchemaError for the same inputs.
+
+    Args:
+        cfg: List of configuration, register, and file items
+
+    Returns:
+        New list of validated items with defaults applied
+
+    Raises:
+        SchemaError: If configuration doesn't match schema
+    """
+    if not isinstance(cfg, list):
+        raise _error(f"{cfg!r} should be instance of 'list'")
+    return [_validate_item(item) for item in cfg]
+
+
+def _validate_item(item: object) -> dict:
+    if not isinstance(item, dict):
+        raise _error(f"{item!r} should be instance of 'dict'")
+
+    # Each kind of item has a key that the other kinds do not allow
+    if 'config' in item:
+        _check_keys(item, ('config',), {}, item)
+        return dict(config=_validate_config(item['config']))
+    if 'file' in item:
+        out = _check_keys(item, ('name', 'file'), _FILE_OPTIONAL, item)
+        _check_type(out, 'name', str, item)
+        _check_type(out, 'file', str, item)
+        _check_type(out, 'description', str, item)
+        _check_int(out, 'addr_offset', item)
+        _check_int(out, 'addr_align', item, positive=True)
+        return out
+
+    out = _check_keys(item, ('name', 'bits'), _REGISTER_OPTIONAL, item)
+    _check_type(out, 'name', str, item)
+    _check_type(out, 'description', str, item)
+    _check_type(out, 'use_upd_pulse', bool, item)
+    _check_int(out, 'addr_offset', item)
+    _check_type(out, 'instance', str, item)
+    _check_choice(out, 'reg_type', _REG_TYPES, item)
+    out['bits'] = _validate_bits(out['bits'], item)
+    return out
+
+
+def _validate_config(config: object) -> dict:
+    if not isinstance(config, dict):
+        raise _error(f"Key 'config' error:\n{config!r} should be instance of 'dict'")
+    out = _check_keys(config, ('data_size',), _CONFIG_OPTIONAL, config)
+    _check_int(out, 'data_size', config, positive=True)
+    if out['data_size'] % 8 != 0:
+        raise _error(
+            f"Key 'data_size' error:\n{out['data_size']} should be a multiple of 8"
+        )
+    _check_type(out, 'entity_name', str, config)
+    _check_type(out, 'instance_separator', str, config)
+    _check_type(out, 'include_username', bool, config)
+    _check_type(out, 'include_hostname', bool, config)
+    _check_type(out, 'include_timestamp', bool, config)
+    _check_int(out, 'address_aperture', config, positive=True)
+    if 'reserved' in out:
+        out['reserved'] = _validate_reserved(out['reserved'], config)
+    _check_choice(out, 'throughput', _THROUGHPUTS, config)
+    _check_choice(out, 'write_channels', _WRITE_CHANNELS, config)
+    _check_int(out, 'read_latency', config, positive=True)
+    _check_choice(out, 'read_mux', _READ_MUXES, config)
+    _check_choice(out, 'write_decode', _WRITE_DECODES, config)
+    return out
+
+
+def _validate_reserved(reserved: object, config: dict) -> list:
+    if not isinstance(reserved, list):
+        raise _error(
+            f"Key 'reserved' error:\n{reserved!r} should be instance of 'list' in {config!r}"
+        )
+    holes = []
+    for hole in reserved:
+        if not isinstance(hole, dict):
+            raise _error(
+                f"Key 'reserved' error:\n{hole!r} should be instance of 'dict'"
+            )
+        out = _check_keys(hole, ('addr_offset', 'size'), {}, config)
+        _check_int(out, 'addr_offset', config)
+        _check_int(out, 'size', config, positive=True)
+        holes.append(out)
+    return holes
+
+
+def _validate_bits(bits: object, item: dict) -> int | dict | list:
+    if isinstance(bits, dict):
+        out = _check_keys(bits, ('num_bits',), {'default_value': 0}, item)
+        _check_int(out, 'num_bits', item, positive=True)
+        out['default_value'] = _to_int(out['default_value'], item)
+        return out
+    if isinstance(bits, list):
+        fields = []
+        for field in bits:
+            if not isinstance(field, dict):
+                raise _error(
+                    f"Key 'bits' error:\n{field!r} should be instance of 'dict'"
+                )
+            out = _check_keys(field, ('field_name', 'num_bits'), _FIELD_OPTIONAL, item)
+            _check_type(out, 'field_name', str, item)
+            _check_int(out, 'num_bits', item, positive=True)
+            out['default_value'] = _to_int(out['default_value'], item)
+            _check_type(out, 'description', str, item)
+            fields.append(out)
+        return fields
+    if isinstance(bits, int) and not isinstance(bits, bool) and bits >= 1:
+        return bits
+    raise _error(
+        f"Key 'bits' error:\n{bits!r} should be a positive int, dict, or list in {item!r}"
+    )
+
+
+def _check_keys(data: dict, required: tuple, optional: dict, item: object) -> dict:
+    """Copy a dictionary, checking its keys and applying defaults."""
+    for key in data:
+        if key not in required and key not in optional:
+            raise _error(f'Wrong key {key!r} in {item!r}')
+    missing = [key for key in required if key not in data]
+    if missing:
+        raise _error(
+            f'Missing key{"s" if len(missing) > 1 else ""}: '
+            + ', '.join(repr(key) for key in missing)
+        )
+
+    out = dict(data)
+    for key, default in optional.items():
+        if default is not None and key not in out:
+            out[key] = default
+    return out
+
+
+def _check_type(data: dict, key: str, type_: type, item: object) -> None:
+    if key in data and not isinstance(data[key], type_):
+        raise _error(
+            f"Key {key!r} error:\n{data[key]!r} should be instance of '{type_.__name__}' in {item!r}"
+        )
+
+
+def _check_choice(data: dict, key: str, choices: tuple, item: object) -> None:
+    if key in data and (not isinstance(data[key], str) or data[key] not in choices):
+        raise _error(
+            f'Key {key!r} error:\n{data[key]!r} should be one of {choices} in {item!r}'
+        )
+
+
+def _check_int(data: dict, key: str, item: object, positive: bool = False) -> None:
+    # bool is a subclass of int but is not accepted where an int is expected
+    if key not in data:
+        return
+    value = data[key]
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise _error(
+            f"Key {key!r} error:\n{value!r} should be instance of 'int' in {item!r}"
+        )
+    if positive and value < 1:
+        raise _error(
+            f'Key {key!r} error:\n{value!r} should be a positive int in {item!r}'
         )
-    ]
-)
+
+
+def _to_int(value: object, item: object) -> int:
+    try:
+        return anyToInt(value)
+    except Exception as e:
+        raise _error(
+            f"Key 'default_value' error:\nanyToInt({value!r}) raised {e!r} in {item!r}"
+        ) from None
+
+
+def _error(message: str) -> Exception:
+    from schema import SchemaError
+
+    return SchemaError(message)
@@ -0,0 +1,200 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import os
+import threading
+from typing import TYPE_CHECKING
+import axi4lite_reg_generator.filters as filters
+
+if TYPE_CHECKING:
+    import jinja2
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Templates compiled to Python modules when the wheel is built. The manifest
+# records the Jinja2 version and template hashes they were compiled from.
+COMPILED_DIR = os.path.join(os.path.dirname(__file__), 'templates_compiled')
+COMPILED_MANIFEST = 'manifest.json'
+
+# Environment variable used to enable the on-disk bytecode cache by default
+BYTECODE_CACHE_ENV = 'AXI4LITE_REG_GENERATOR_CACHE_DIR'
+
+_lock = threading.Lock()
+_environments: dict[tuple[str, str | None], jinja2.Environment] = {}
+
+
+def get_environment(
+    template_dir: str = TEMPLATE_DIR, bytecode_cache_dir: str | None = None
+) -> jinja2.Environment:
+    """Get the shared Jinja2 environment for a template directory.
+
+    Environments are created once per process with all filters installed and are
+    reused by every render. Compiled templates are kept in the environment's
+    in-memory cache and are reloaded automatically when the template file changes
+    on disk. The package templates are loaded from the modules compiled when the
+    wheel was built, if they match the installed templates and Jinja2 version.
+
+    Args:
+        template_dir: Directory containing templates
+        bytecode_cache_dir: Optional directory for the on-disk bytecode cache. If not
+          specified, the value of the AXI4LITE_REG_GENERATOR_CACHE_DIR environment
+          variable is used. The on-disk cache is disabled when neither is set, and
+          is not needed for precompiled package templates.
+
+    Returns:
+        Shared Jinja2 environment
+    """
+    if bytecode_cache_dir is None:
+        bytecode_cache_dir = os.environ.get(BYTECODE_CACHE_ENV) or None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir = os.path.abspath(bytecode_cache_dir)
+    key = (os.path.abspath(template_dir), bytecode_cache_dir)
+
+    # Fast path without taking the lock once the environment exists
+    j2env = _environments.get(key)
+    if j2env is None:
+        with _lock:
+            j2env = _environments.get(key)
+            if j2env is None:
+                j2env = _environments[key] = _create_environment(*key)
+    return j2env
+
+
+def get_template(
+    template_file: str,
+    template_dir: str = TEMPLATE_DIR,
+    bytecode_cache_dir: str | None = None,
+) -> jinja2.Template:
+    """Get a compiled template from the shared environment.
+
+    Args:
+        template_file: Name of template file
+        template_dir: Directory containing templates
+        bytecode_cache_dir: Optional directory for the on-disk bytecode cache
+
+    Returns:
+        Compiled template
+
+    Raises:
+        TemplateNotFound: If template file not found
+    """
+    return get_environment(template_dir, bytecode_cache_dir).get_template(template_file)
+
+
+def clear() -> None:
+    """Drop all cached environments and compiled templates."""
+    with _lock:
+        _environments.clear()
+
+
+def compile_templates(target_dir: str) -> None:
+    """Compile the package templates into Python modules.
+
+    Used by the wheel build hook. The modules are loaded with a Jinja2
+    ModuleLoader instead of parsing and compiling the templates at runtime.
+
+    Args:
+        target_dir: Directory to write the compiled modules and manifest to
+    """
+    import json
+    import jinja2
+
+    os.makedirs(target_dir, exist_ok=True)
+    j2env = _create_environment(TEMPLATE_DIR, None, precompiled=False)
+    j2env.compile_templates(target_dir, zip=None, ignore_errors=False)
+    manifest = dict(jinja2=jinja2.__version__, templates=_template_hashes())
+    with open(os.path.join(target_dir, COMPILED_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _template_hashes() -> dict[str, str]:
+    """Hash every package template.
+
+    Returns:
+        Dictionary mapping each template name to the SHA-256 of its content
+    """
+    import hashlib
+
+    hashes = {}
+    for name in sorted(os.listdir(TEMPLATE_DIR)):
+        with open(os.path.join(TEMPLATE_DIR, name), 'rb') as f:
+            hashes[name] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def _compiled_loader() -> jinja2.BaseLoader | None:
+    """Get a loader for the precompiled package templates.
+
+    Returns:
+        Module loader, or None if there are no compiled templates or they were
+        compiled from other templates or for another Jinja2 version
+    """
+    import json
+    import jinja2
+
+    try:
+        with open(os.path.join(COMPILED_DIR, COMPILED_MANIFEST), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest != dict(jinja2=jinja2.__version__, templates=_template_hashes()):
+        return None
+    return jinja2.ModuleLoader(COMPILED_DIR)
+
+
+def _create_environment(
+    template_dir: str, bytecode_cache_dir: str | None, precompiled: bool = True
+) -> jinja2.Environment:
+    """Create a Jinja2 environment with the register filters installed.
+
+    Args:
+        template_dir: Directory containing templates
+        bytecode_cache_dir: Directory for the on-disk bytecode cache or None
+        precompiled: Load the package templates from their compiled modules when
+          they are available
+
+    Returns:
+        New Jinja2 environment
+    """
+    # Jinja2 is imported on first use to keep command line startup fast
+    import jinja2
+
+    loader = None
+    if precompiled and template_dir == os.path.abspath(TEMPLATE_DIR):
+        loader = _compiled_loader()
+
+    bytecode_cache = None
+    if loader is None:
+        loader = jinja2.FileSystemLoader(template_dir)
+        if bytecode_cache_dir is not None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+
+    j2env = jinja2.Environment(
+        loader=loader,
+        bytecode_cache=bytecode_cache,
+        auto_reload=True,
+    )
+    j2env.filters['count_bits'] = filters.count_bits
+    j2env.filters['get_offset'] = filters.get_offset
+    j2env.filters['default_val'] = filters.default_val
+    j2env.filters['default_val_v'] = filters.default_val_v
+    j2env.filters['addr_bits_from_data'] = filters.addr_bits_from_data
+    return j2env
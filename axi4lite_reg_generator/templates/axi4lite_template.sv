@@ -18,7 +18,8 @@
 *
 * This code was automatically generated by:
 *   axi4lite_reg_generator v{{ id_version }}
-*{% if include_username or include_hostname %} generated by: {% if include_username %}{{ id_username }}{% endif %}{% if include_hostname %}@{{ id_hostname }}{% endif %}{% endif %}{% if include_timestamp %} at {{ id_timestamp }}{% endif %}
+*{% if include_username or include_hostname %} generated by: {% if include_username %}{{ id_username }}{% endif %}{% if include_hostname %}@{{ id_hostname }}{% endif %}{% endif %}{% if include_timestamp %} at {{ id_timestamp }}{% endif %}{% if id_input_hash %}
+*   register map SHA-256: {{ id_input_hash }}{% endif %}
 */
 
 // Data Size = {{ data_size }}
@@ -33,13 +34,13 @@ module {{ entity_name }} #(
   input  logic                        regs_aresetn,
   // Registers
   {% for reg in regs -%}
-  {% if reg['reg_type'] == 'ro' or reg['reg_type'] == 'custom' -%}
-  input logic [{{ reg['bits']|count_bits - 1 }}:0] R_{{ reg['name'] }}_I,
+  {% if reg.has_input -%}
+  input logic [{{ reg.width - 1 }}:0] R_{{ reg.name }}_I,
   {% endif -%}
-  {% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-  output logic [{{ reg['bits']|count_bits - 1 }}:0] R_{{ reg['name'] }}_O,
-  {% if reg['use_upd_pulse'] -%}
-  output logic R_{{ reg['name'] }}_O_upd,
+  {% if reg.has_output -%}
+  output logic [{{ reg.width - 1 }}:0] R_{{ reg.name }}_O,
+  {% if reg.use_upd_pulse -%}
+  output logic R_{{ reg.name }}_O_upd,
   {% endif -%}
   {% endif -%}
   {% endfor %}  
@@ -77,18 +78,23 @@ localparam [1:0] AXI_RESP_DECERR = 2'b11;
 
 // Register addresses
 {% for reg in regs -%}
-localparam [ADDRESS_APERTURE-1:0] REG_{{ reg['name'] }}_ADDR = {{ reg['addr_offset'] }};
+localparam [ADDRESS_APERTURE-1:0] REG_{{ reg.name }}_ADDR = {{ reg.addr_offset }};
 {% endfor %}
 
 // Register signal declarations
 {% for reg in regs -%}
-logic [{{ reg['bits']|count_bits-1}}:0] REG_{{ reg['name'] }}_R;
-{% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-logic [{{ reg['bits']|count_bits-1 }}:0] REG_{{ reg['name'] }}_W;
+logic [{{ reg.width-1}}:0] REG_{{ reg.name }}_R;
+{% if reg.has_output -%}
+logic [{{ reg.width-1 }}:0] REG_{{ reg.name }}_W;
 {% endif %}
 {% endfor %}
 
 // Internal AXI support signals
+{% set independent_writes = throughput == 'full' or write_channels == 'independent' -%}
+{% set read_pipeline = read_latency > (1 if throughput == 'full' else 2) -%}
+{% set read_data_stages = read_latency - 2 - (read_tree.stages if read_tree else 0) -%}
+{% set write_onehot = write_decode == 'onehot' and regs_out -%}
+{% if not independent_writes -%}
 // Write state machine states
 typedef enum logic [1:0] {
     W_STATE_RST,
@@ -97,6 +103,8 @@ typedef enum logic [1:0] {
     W_STATE_WAIT4RESP
 } write_state_t;
 
+{% endif -%}
+{% if throughput != 'full' -%}
 // Read state machine states
 typedef enum logic [1:0] {
     R_STATE_RST,
@@ -105,12 +113,79 @@ typedef enum logic [1:0] {
     R_STATE_WAIT4DATA
 } read_state_t;
 
+{% endif -%}
+{% if not independent_writes -%}
 write_state_t state_w;
+{% endif -%}
+{% if throughput != 'full' -%}
 read_state_t state_r;
 
+{% endif -%}
 logic [ADDRESS_APERTURE-1:0] address_wr;
 logic [ADDRESS_APERTURE-1:0] address_rd;
 
+{% if independent_writes -%}
+// Write channel holding registers, used when the address or data of a write
+// arrives before the other or while the write response is stalled
+logic aw_held;
+logic w_held;
+logic [{{ data_size-1 }}:0] wdata_held;
+logic [{{ strobe_size-1 }}:0] wstrb_held;
+
+logic wr_en;
+logic [ADDRESS_APERTURE-1:0] wr_addr;
+logic [{{ data_size-1 }}:0] wr_data;
+logic [{{ strobe_size-1 }}:0] wr_strb;
+
+{% endif -%}
+{% if throughput == 'full' -%}
+// Read address holding register, used while the read data is stalled
+logic ar_held;
+
+logic rd_en;
+logic rd_advance;
+logic [ADDRESS_APERTURE-1:0] rd_addr;
+
+{% endif -%}
+{% if read_pipeline -%}
+// Read pipeline registers, with a valid bit for each stage
+logic [{{ read_latency-2 }}:0] rd_valid;
+{% if throughput == 'full' -%}
+logic [ADDRESS_APERTURE-1:0] rd_mux_addr;
+{% else -%}
+logic rd_start;
+{% endif -%}
+{% for i in range(1, read_data_stages+1) -%}
+logic [{{ data_size-1 }}:0] rd_data_{{ i }};
+logic [1:0] rd_resp_{{ i }};
+{% endfor %}
+{% endif -%}
+{% if read_tree -%}
+// Read mux tree nodes, with the address used at each pipeline stage
+logic [ADDRESS_APERTURE+{{ read_tree.width-1 }}:0] rd_tree_addr_ext;
+logic [{{ read_tree.width-1 }}:0] rd_tree_addr_0;
+{% for stage in range(1, read_tree.stages+1) -%}
+logic [{{ read_tree.width-1 }}:0] rd_tree_addr_{{ stage }};
+{% endfor -%}
+logic rd_in_range;
+{% for nodes in read_tree.levels -%}
+{% for node in nodes -%}
+logic [{{ data_size-1 }}:0] rd_mux_{{ node.name }};
+logic rd_hit_{{ node.name }};
+{% if node.registered -%}
+logic [{{ data_size-1 }}:0] rd_mux_{{ node.name }}_q;
+logic rd_hit_{{ node.name }}_q;
+{% endif -%}
+{% endfor -%}
+{% endfor %}
+{% endif -%}
+{% if write_onehot -%}
+// One-hot write decode, with an enable bit for each writable register
+logic [{{ regs_out|length-1 }}:0] wr_sel_in;
+logic [{{ regs_out|length-1 }}:0] wr_sel_q;
+logic [{{ regs_out|length-1 }}:0] wr_sel;
+
+{% endif -%}
 logic w_ready;
 logic r_valid;
 
@@ -120,43 +195,83 @@ logic [1:0] rd_resp;
 // Handle inputs
 
 always_comb begin
-{% for reg in regs -%}
-{% if reg['reg_type'] == 'rw' -%}
-  REG_{{ reg['name'] }}_R = REG_{{ reg['name'] }}_W;
-{% endif -%}
+{% for reg in regs_rw -%}
+  REG_{{ reg.name }}_R = REG_{{ reg.name }}_W;
 {% endfor %}
 end
 
 generate
   if (REGISTER_INPUTS > 0) begin : reg_inputs_g
     always_ff @(posedge regs_aclk) begin
-      {% for reg in regs -%}
-      {% if reg['reg_type'] == 'ro' or reg['reg_type'] == 'custom' -%}
-        REG_{{ reg['name'] }}_R <= R_{{ reg['name'] }}_I; 
-      {% endif -%}
+      {% for reg in regs_in -%}
+        REG_{{ reg.name }}_R <= R_{{ reg.name }}_I; 
       {% endfor %}
     end
   end else begin : con_inputs_g
     always_comb begin
-      {% for reg in regs -%}
-      {% if reg['reg_type'] != 'rw' -%}
-        REG_{{ reg['name'] }}_R = R_{{ reg['name'] }}_I;
-      {% endif -%}
+      {% for reg in regs_in -%}
+        REG_{{ reg.name }}_R = R_{{ reg.name }}_I;
       {% endfor %}
     end
   end
 endgenerate
 
 // Connect outputs
-{% for reg in regs -%}
-{% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-  assign R_{{ reg['name'] }}_O = REG_{{ reg['name'] }}_W;
-{% endif -%}
+{% for reg in regs_out -%}
+  assign R_{{ reg.name }}_O = REG_{{ reg.name }}_W;
 {% endfor %}
 // Connect AXI-Lite ready/valid control signals
 assign regs_wready = w_ready;
 assign regs_rvalid = r_valid;
 
+{% if independent_writes -%}
+// Write channels
+// AW and W are each accepted while their holding register is empty. A write is
+// performed as soon as its address and data are both available and the write
+// response channel is free, so one write can complete every clock cycle.
+assign wr_en = (aw_held || (regs_awvalid && regs_awready)) &&
+               (w_held || (regs_wvalid && w_ready)) &&
+               (!regs_bvalid || regs_bready);
+assign wr_addr = aw_held ? address_wr : regs_awaddr[ADDRESS_APERTURE-1:0];
+assign wr_data = w_held ? wdata_held : regs_wdata;
+assign wr_strb = w_held ? wstrb_held : regs_wstrb;
+
+always_ff @(posedge regs_aclk) begin
+  if (!regs_aresetn) begin
+    aw_held <= '0;
+    w_held <= '0;
+    regs_awready <= '0;
+    w_ready <= '0;
+    regs_bvalid <= '0;
+  end
+  else begin
+    if (wr_en) begin
+      aw_held <= '0;
+      w_held <= '0;
+    end
+    else begin
+      if (regs_awvalid && regs_awready) begin
+        aw_held <= '1;
+        address_wr <= regs_awaddr[ADDRESS_APERTURE-1:0];
+      end
+      if (regs_wvalid && w_ready) begin
+        w_held <= '1;
+        wdata_held <= regs_wdata;
+        wstrb_held <= regs_wstrb;
+      end
+    end
+    regs_awready <= wr_en || !(aw_held || (regs_awvalid && regs_awready));
+    w_ready <= wr_en || !(w_held || (regs_wvalid && w_ready));
+    if (wr_en) begin
+      regs_bvalid <= '1;
+    end
+    else if (regs_bready) begin
+      regs_bvalid <= '0;
+    end
+  end
+end
+
+{% else -%}
 // Write FSM
 always_ff @(posedge regs_aclk) begin
   if (!regs_aresetn) begin
@@ -200,6 +315,37 @@ always_ff @(posedge regs_aclk) begin
   end
 end
 
+{% endif -%}
+{% if throughput == 'full' -%}
+// Read channels
+// A read address is used as soon as it arrives unless the read data channel is
+// stalled, in which case it is held, so one read can complete every clock cycle.
+assign rd_advance = !r_valid || regs_rready;
+assign rd_en = (ar_held || (regs_arvalid && regs_arready)) && rd_advance;
+assign rd_addr = ar_held ? address_rd : regs_araddr[ADDRESS_APERTURE-1:0];
+
+always_ff @(posedge regs_aclk) begin
+  if (!regs_aresetn) begin
+    ar_held <= '0;
+    regs_arready <= '0;
+    r_valid <= '0;
+  end
+  else begin
+    if (rd_en) begin
+      ar_held <= '0;
+    end
+    else if (regs_arvalid && regs_arready) begin
+      ar_held <= '1;
+      address_rd <= regs_araddr[ADDRESS_APERTURE-1:0];
+    end
+    regs_arready <= rd_en || !(ar_held || (regs_arvalid && regs_arready));
+    if (rd_advance) begin
+      r_valid <= {{ 'rd_valid[%d]' % (read_latency-2) if read_pipeline else 'rd_en' }};
+    end
+  end
+end
+
+{% else -%}
 // Read FSM
 always_ff @(posedge regs_aclk) begin
   if (!regs_aresetn) begin
@@ -215,14 +361,27 @@ always_ff @(posedge regs_aclk) begin
       end
       R_STATE_WAIT4ADDR: begin
         if (regs_arvalid) begin
+          {%- if read_latency == 1 %}
+          state_r <= R_STATE_WAIT4DATA;
+          regs_arready <= '0;
+          r_valid <= '1;
+          {%- else %}
           state_r <= R_STATE_WAITREG;
           regs_arready <= '0;
           address_rd <= regs_araddr[ADDRESS_APERTURE-1:0];
+          {%- endif %}
         end
       end
       R_STATE_WAITREG: begin
+        {%- if read_pipeline %}
+        if (rd_valid[{{ read_latency-2 }}]) begin
+          state_r <= R_STATE_WAIT4DATA;
+          r_valid <= '1;
+        end
+        {%- else %}
         state_r <= R_STATE_WAIT4DATA;
         r_valid <= '1;
+        {%- endif %}
       end
       R_STATE_WAIT4DATA: begin
         if (regs_rready) begin
@@ -238,56 +397,193 @@ always_ff @(posedge regs_aclk) begin
   end
 end
 
-// Write process
+{% endif -%}
+{% if read_pipeline -%}
+// Read pipeline
+// The read mux decodes a registered address, and each cycle of read latency
+// above two adds a register stage, between the levels of a read mux tree or
+// after the read mux. The stages only advance while the read data is not stalled.
+{% if throughput == 'full' -%}
+{% set rd_start = 'rd_en' -%}
+{% else -%}
+{% set rd_start = 'rd_start' -%}
+assign rd_start = state_r == R_STATE_WAIT4ADDR && regs_arvalid;
+
+{% endif -%}
 always_ff @(posedge regs_aclk) begin
   if (!regs_aresetn) begin
-    {%- for reg in regs -%}
-    {%- if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' %}
-    REG_{{ reg['name'] }}_W <= {{ reg|default_val_v }};
-    {%- if reg['use_upd_pulse'] %}
-    R_{{ reg['name'] }}_O_upd <= '0;
+    rd_valid <= '0;
+  end
+  else {% if throughput == 'full' %}if (rd_advance) {% endif %}begin
+    {%- if read_latency == 2 %}
+    rd_valid <= {{ rd_start }};
+    {%- else %}
+    rd_valid <= {rd_valid[{{ read_latency-3 }}:0], {{ rd_start }}};
     {%- endif %}
+    {%- if throughput == 'full' %}
+    rd_mux_addr <= rd_addr;
     {%- endif %}
+    {%- if read_tree %}
+    {%- for stage in range(1, read_tree.stages+1) %}
+    rd_tree_addr_{{ stage }} <= rd_tree_addr_{{ stage-1 }};
+    {%- endfor %}
+    {%- for node in read_tree.registered %}
+    rd_mux_{{ node.name }}_q <= rd_mux_{{ node.name }};
+    rd_hit_{{ node.name }}_q <= rd_hit_{{ node.name }};
     {%- endfor %}
-  end
-  else begin
-    {%- for reg in regs -%}
-    {%- if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' %}
-    {%- if reg['use_upd_pulse'] %}
-    R_{{ reg['name'] }}_O_upd <= '0;
     {%- endif %}
+    {%- for i in range(1, read_data_stages+1) %}
+    rd_data_{{ i }} <= {{ 'rd_data_%d' % (i-1) if i > 1 else 'rd_mux' }};
+    rd_resp_{{ i }} <= {{ 'rd_resp_%d' % (i-1) if i > 1 else 'rd_resp' }};
+    {%- endfor %}
+  end
+end
+
+{% endif -%}
+{% if independent_writes -%}
+{% set wr_en, wr_addr, wr_strb, wr_data = 'wr_en', 'wr_addr', 'wr_strb', 'wr_data' -%}
+{% else -%}
+{% set wr_en, wr_addr, wr_strb, wr_data = 'regs_wvalid && w_ready', 'address_wr', 'regs_wstrb', 'regs_wdata' -%}
+{% endif -%}
+{% if throughput == 'full' and read_pipeline -%}
+{% set rd_addr, rd_en = 'rd_mux_addr', 'rd_advance && rd_valid[%d]' % (read_latency-2) -%}
+{% elif throughput == 'full' -%}
+{% set rd_addr, rd_en = 'rd_addr', 'rd_en' -%}
+{% elif read_latency == 1 -%}
+{% set rd_addr, rd_en = 'regs_araddr[ADDRESS_APERTURE-1:0]', 'state_r == R_STATE_WAIT4ADDR && regs_arvalid' -%}
+{% elif read_pipeline -%}
+{% set rd_addr, rd_en = 'address_rd', 'rd_valid[%d]' % (read_latency-2) -%}
+{% else -%}
+{% set rd_addr, rd_en = 'address_rd', 'state_r == R_STATE_WAITREG' -%}
+{% endif -%}
+{% if read_data_stages > 0 -%}
+{% set rd_data, rd_resp = 'rd_data_%d' % read_data_stages, 'rd_resp_%d' % read_data_stages -%}
+{% else -%}
+{% set rd_data, rd_resp = 'rd_mux', 'rd_resp' -%}
+{% endif -%}
+{% if write_onehot -%}
+// One-hot write decode
+// The write address is compared against every writable register in parallel as
+// it is accepted, and the result is registered with the address. The write
+// process then only checks the enable bit of each register.
+always_comb begin
+  {%- for reg in regs_out %}
+  wr_sel_in[{{ loop.index0 }}] = regs_awaddr[ADDRESS_APERTURE-1:0] == REG_{{ reg.name }}_ADDR;
+  {%- endfor %}
+end
+
+always_ff @(posedge regs_aclk) begin
+  if (regs_awvalid && regs_awready) begin
+    wr_sel_q <= wr_sel_in;
+  end
+end
+
+{% if independent_writes -%}
+// A write that uses the address in the cycle it arrives uses its decode directly
+assign wr_sel = aw_held ? wr_sel_q : wr_sel_in;
+{% else -%}
+assign wr_sel = wr_sel_q;
+{% endif %}
+{% endif -%}
+// Write process
+always_ff @(posedge regs_aclk) begin
+  if (!regs_aresetn) begin
+    {%- for reg in regs_out %}
+    REG_{{ reg.name }}_W <= {{ reg.default_verilog }};
+    {%- if reg.use_upd_pulse %}
+    R_{{ reg.name }}_O_upd <= '0;
     {%- endif %}
     {%- endfor %}
-    if (regs_wvalid && w_ready) begin
-      {% for reg in regs -%}
-      {% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-      if (address_wr == REG_{{ reg['name'] }}_ADDR) begin
-        {%- if reg['use_upd_pulse'] %}
-        R_{{ reg['name'] }}_O_upd <= '1;
+  end
+  else begin
+    {%- for reg in regs_upd %}
+    R_{{ reg.name }}_O_upd <= '0;
+    {%- endfor %}
+    if ({{ wr_en }}) begin
+      {% if write_onehot -%}
+      {% for reg in regs_out -%}
+      if (wr_sel[{{ loop.index0 }}]) begin
+        {%- if reg.use_upd_pulse %}
+        R_{{ reg.name }}_O_upd <= '1;
         {%- endif %}
-        regs_bresp <= AXI_RESP_OKAY;
-        {%- for s in range(strobe_size) %}
-        {%- if 8*s < reg['bits']|count_bits %}
-        if (regs_wstrb[{{s}}]) begin
-          REG_{{ reg['name'] }}_W[{{ [reg['bits']|count_bits-1, 8*(s+1)-1]|min }}:{{ 8*s }}] <= regs_wdata[{{ [reg['bits']|count_bits-1, 8*(s+1)-1]|min }}:{{ 8*s }}];
+        {%- for s, high, low in reg.strobes %}
+        if ({{ wr_strb }}[{{s}}]) begin
+          REG_{{ reg.name }}_W[{{ high }}:{{ low }}] <= {{ wr_data }}[{{ high }}:{{ low }}];
         end
+        {%- endfor %}
+      end
+      {% endfor -%}
+      regs_bresp <= |wr_sel ? AXI_RESP_OKAY : AXI_RESP_SLVERR;
+    {% else -%}
+      {% for reg in regs_out -%}
+      if ({{ wr_addr }} == REG_{{ reg.name }}_ADDR) begin
+        {%- if reg.use_upd_pulse %}
+        R_{{ reg.name }}_O_upd <= '1;
         {%- endif %}
+        regs_bresp <= AXI_RESP_OKAY;
+        {%- for s, high, low in reg.strobes %}
+        if ({{ wr_strb }}[{{s}}]) begin
+          REG_{{ reg.name }}_W[{{ high }}:{{ low }}] <= {{ wr_data }}[{{ high }}:{{ low }}];
+        end
         {%- endfor %}
-      end else {% endif -%}{% endfor -%} begin
+      end else {% endfor -%} begin
         regs_bresp <= AXI_RESP_SLVERR;
       end
+    {% endif -%}
     end
   end
 end
 
+{% if read_tree -%}
+// Read mux tree
+// Each node selects one of its inputs on a few address bits. Addresses that no
+// register decodes read as zero with an error response.
+assign rd_tree_addr_ext = { {{ read_tree.width }}'d0, {{ rd_addr }} };
+assign rd_tree_addr_0 = rd_tree_addr_ext[{{ read_tree.width-1 }}:0];
+assign rd_in_range = ({{ rd_addr }} >> {{ read_tree.width }}) == 0{% if read_tree.low %} &&
+                     rd_tree_addr_0[{{ read_tree.low-1 }}:0] == 0{% endif %};
+
+{% for nodes in read_tree.levels -%}
+{% for node in nodes -%}
 always_comb begin
-  case (address_rd)
+  case (rd_tree_addr_{{ node.stage }}[{{ node.low+node.bits-1 }}:{{ node.low }}])
+    {%- for sel, input in node.inputs %}
+    {{ node.bits }}'d{{ sel }}: begin
+      {%- if node.level %}
+      rd_mux_{{ node.name }} = rd_mux_{{ input.name }}{{ '_q' if input.registered }};
+      rd_hit_{{ node.name }} = rd_hit_{{ input.name }}{{ '_q' if input.registered }};
+      {%- elif input.padding %}
+      rd_mux_{{ node.name }} = {{'{ {'}}{{ input.padding }}{1'b0{{'}}'}}, REG_{{ input.name }}_R };
+      rd_hit_{{ node.name }} = rd_in_range;
+      {%- else %}
+      rd_mux_{{ node.name }} = REG_{{ input.name }}_R;
+      rd_hit_{{ node.name }} = rd_in_range;
+      {%- endif %}
+    end
+    {%- endfor %}
+    default: begin
+      rd_mux_{{ node.name }} = '0;
+      rd_hit_{{ node.name }} = '0;
+    end
+  endcase
+end
+
+{% endfor -%}
+{% endfor -%}
+always_comb begin
+  rd_mux = rd_mux_{{ read_tree.root.name }};
+  rd_resp = rd_hit_{{ read_tree.root.name }} ? AXI_RESP_OKAY : AXI_RESP_SLVERR;
+end
+
+{% else -%}
+always_comb begin
+  case ({{ rd_addr }})
     {% for reg in regs -%}
-    REG_{{ reg['name'] }}_ADDR: begin
-      {% if reg['bits']|count_bits < data_size %}
-      rd_mux = {{'{ {'}}{{ data_size - reg['bits']|count_bits }}{1'b0{{'}}'}}, REG_{{ reg['name'] }}_R };
+    REG_{{ reg.name }}_ADDR: begin
+      {% if reg.padding %}
+      rd_mux = {{'{ {'}}{{ reg.padding }}{1'b0{{'}}'}}, REG_{{ reg.name }}_R };
       {% else %}
-      rd_mux = REG_{{ reg['name'] }}_R;
+      rd_mux = REG_{{ reg.name }}_R;
       {% endif %}
       rd_resp = AXI_RESP_OKAY;
     end
@@ -299,13 +595,14 @@ always_comb begin
   endcase
 end
 
+{% endif -%}
 // Read process
 always_ff @(posedge regs_aclk) begin
   if (!regs_aresetn) begin
   end else begin
-    if (state_r == R_STATE_WAITREG) begin
-      regs_rdata <= rd_mux;
-      regs_rresp <= rd_resp;
+    if ({{ rd_en }}) begin
+      regs_rdata <= {{ rd_data }};
+      regs_rresp <= {{ rd_resp }};
     end
   end
 end
@@ -18,7 +18,8 @@
 --
 -- This code was automatically generated by:
 --   axi4lite_reg_generator v{{ id_version }}
---{% if include_username or include_hostname %} generated by: {% if include_username %}{{ id_username }}{% endif %}{% if include_hostname %}@{{ id_hostname }}{% endif %}{% endif %}{% if include_timestamp %} at {{ id_timestamp }}{% endif %}
+--{% if include_username or include_hostname %} generated by: {% if include_username %}{{ id_username }}{% endif %}{% if include_hostname %}@{{ id_hostname }}{% endif %}{% endif %}{% if include_timestamp %} at {{ id_timestamp }}{% endif %}{% if id_input_hash %}
+--   register map SHA-256: {{ id_input_hash }}{% endif %}
 --
 library ieee;
 use ieee.std_logic_1164.all;
@@ -39,13 +40,13 @@ port (
   REGS_ARESETN :  in std_logic;
   -- Registers
   {% for reg in regs -%}
-  {% if reg['reg_type'] == 'ro' or reg['reg_type'] == 'custom' -%}
-  R_{{ reg['name'] }}_I :  in std_logic_vector({{ reg['bits']|count_bits - 1 }} downto 0);
+  {% if reg.has_input -%}
+  R_{{ reg.name }}_I :  in std_logic_vector({{ reg.width - 1 }} downto 0);
   {% endif -%}
-  {% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-  R_{{ reg['name'] }}_O :  out std_logic_vector({{ reg['bits']|count_bits - 1 }} downto 0);
-  {% if reg['use_upd_pulse'] -%}
-  R_{{ reg['name'] }}_O_upd : out std_logic;
+  {% if reg.has_output -%}
+  R_{{ reg.name }}_O :  out std_logic_vector({{ reg.width - 1 }} downto 0);
+  {% if reg.use_upd_pulse -%}
+  R_{{ reg.name }}_O_upd : out std_logic;
   {% endif -%}
   {% endif -%}
   {% endfor %}
@@ -85,26 +86,99 @@ architecture rtl of {{ entity_name }} is
 
   -- Register addresses
   {% for reg in regs -%}
-  constant REG_{{ reg['name'] }}_ADDR : std_logic_vector(ADDRESS_APERTURE-1 downto 0) := std_logic_vector(to_unsigned({{ reg['addr_offset'] }}, ADDRESS_APERTURE));
+  constant REG_{{ reg.name }}_ADDR : std_logic_vector(ADDRESS_APERTURE-1 downto 0) := std_logic_vector(to_unsigned({{ reg.addr_offset }}, ADDRESS_APERTURE));
   {% endfor %}
   
   -- Register signal declarations
   {% for reg in regs -%}
-  signal REG_{{ reg['name'] }}_R : std_logic_vector({{ reg['bits']|count_bits-1 }} downto 0);
-  {% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-  signal REG_{{ reg['name'] }}_W : std_logic_vector({{ reg['bits']|count_bits-1 }} downto 0);
+  signal REG_{{ reg.name }}_R : std_logic_vector({{ reg.width-1 }} downto 0);
+  {% if reg.has_output -%}
+  signal REG_{{ reg.name }}_W : std_logic_vector({{ reg.width-1 }} downto 0);
   {% endif -%}
   {% endfor %}
   -- internal AXI support signals
+  {% set independent_writes = throughput == 'full' or write_channels == 'independent' -%}
+  {% set read_pipeline = read_latency > (1 if throughput == 'full' else 2) -%}
+  {% set read_data_stages = read_latency - 2 - (read_tree.stages if read_tree else 0) -%}
+  {% set write_onehot = write_decode == 'onehot' and regs_out -%}
+  {% if not independent_writes -%}
   type STATE_WR_T is (RST, WAIT4ADDR, WAIT4DATA, WAIT4RESP);
   signal state_w : STATE_WR_T;
 
+  {% endif -%}
+  {% if throughput != 'full' -%}
   type STATE_RD_T is (RST, WAIT4ADDR, WAITREG, WAIT4DATA);
   signal state_r : STATE_RD_T;
 
+  {% endif -%}
   signal address_wr : std_logic_vector(ADDRESS_APERTURE-1 downto 0);
   signal address_rd : std_logic_vector(ADDRESS_APERTURE-1 downto 0);
 
+  {% if independent_writes -%}
+  -- Write channel holding registers, used when the address or data of a write
+  -- arrives before the other or while the write response is stalled
+  signal aw_held    : std_logic;
+  signal w_held     : std_logic;
+  signal wdata_held : std_logic_vector({{ data_size-1 }} downto 0);
+  signal wstrb_held : std_logic_vector({{ strobe_size-1 }} downto 0);
+
+  signal wr_en   : std_logic;
+  signal wr_addr : std_logic_vector(ADDRESS_APERTURE-1 downto 0);
+  signal wr_data : std_logic_vector({{ data_size-1 }} downto 0);
+  signal wr_strb : std_logic_vector({{ strobe_size-1 }} downto 0);
+
+  signal aw_ready : std_logic;
+  signal b_valid  : std_logic;
+
+  {% endif -%}
+  {% if throughput == 'full' -%}
+  -- Read address holding register, used while the read data is stalled
+  signal ar_held : std_logic;
+
+  signal rd_en      : std_logic;
+  signal rd_advance : std_logic;
+  signal rd_addr    : std_logic_vector(ADDRESS_APERTURE-1 downto 0);
+
+  signal ar_ready : std_logic;
+
+  {% endif -%}
+  {% if read_pipeline -%}
+  -- Read pipeline registers, with a valid bit for each stage
+  signal rd_valid    : std_logic_vector({{ read_latency-2 }} downto 0);
+  {% if throughput == 'full' -%}
+  signal rd_mux_addr : std_logic_vector(ADDRESS_APERTURE-1 downto 0);
+  {% else -%}
+  signal rd_start    : std_logic;
+  {% endif -%}
+  {% for i in range(1, read_data_stages+1) -%}
+  signal rd_data_{{ i }}   : std_logic_vector({{ data_size-1 }} downto 0);
+  signal rd_resp_{{ i }}   : std_logic_vector(1 downto 0);
+  {% endfor %}
+  {% endif -%}
+  {% if read_tree -%}
+  -- Read mux tree nodes, with the address used at each pipeline stage
+  {% for stage in range(read_tree.stages+1) -%}
+  signal rd_tree_addr_{{ stage }} : std_logic_vector({{ read_tree.width-1 }} downto 0);
+  {% endfor -%}
+  signal rd_in_range : std_logic;
+  {% for nodes in read_tree.levels -%}
+  {% for node in nodes -%}
+  signal rd_mux_{{ node.name }} : std_logic_vector({{ data_size-1 }} downto 0);
+  signal rd_hit_{{ node.name }} : std_logic;
+  {% if node.registered -%}
+  signal rd_mux_{{ node.name }}_q : std_logic_vector({{ data_size-1 }} downto 0);
+  signal rd_hit_{{ node.name }}_q : std_logic;
+  {% endif -%}
+  {% endfor -%}
+  {% endfor %}
+  {% endif -%}
+  {% if write_onehot -%}
+  -- One-hot write decode, with an enable bit for each writable register
+  signal wr_sel_in : std_logic_vector({{ regs_out|length-1 }} downto 0);
+  signal wr_sel_q  : std_logic_vector({{ regs_out|length-1 }} downto 0);
+  signal wr_sel    : std_logic_vector({{ regs_out|length-1 }} downto 0);
+
+  {% endif -%}
   signal w_ready : std_logic;
   signal r_valid : std_logic;
 
@@ -114,42 +188,88 @@ begin
 
   -- Handle inputs
 
-  {% for reg in regs -%}
-  {% if reg['reg_type'] == 'rw' -%}
-    REG_{{ reg['name'] }}_R <= REG_{{ reg['name'] }}_W;
-  {% endif -%}
+  {% for reg in regs_rw -%}
+    REG_{{ reg.name }}_R <= REG_{{ reg.name }}_W;
   {% endfor %}
 
   reg_inputs_g : if REGISTER_INPUTS generate
     process(REGS_ACLK) is
     begin
       if rising_edge(REGS_ACLK) then
-        {% for reg in regs -%}
-        {% if reg['reg_type'] == 'ro' or reg['reg_type'] == 'custom' -%}
-          REG_{{ reg['name'] }}_R <= R_{{ reg['name'] }}_I; 
-        {% endif -%}
+        {% for reg in regs_in -%}
+          REG_{{ reg.name }}_R <= R_{{ reg.name }}_I; 
         {% endfor %}
       end if;
     end process;
   end generate;
 
   con_inputs_g : if not REGISTER_INPUTS generate
-    {% for reg in regs -%}
-    {% if reg['reg_type'] != 'rw' -%}
-      REG_{{ reg['name'] }}_R <= R_{{ reg['name'] }}_I;
-    {% endif -%}
+    {% for reg in regs_in -%}
+      REG_{{ reg.name }}_R <= R_{{ reg.name }}_I;
     {% endfor %}
   end generate;
 
   -- Connect outputs
-  {% for reg in regs -%}
-  {% if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-    R_{{ reg['name'] }}_O <= REG_{{ reg['name'] }}_W;
-  {% endif -%}
+  {% for reg in regs_out -%}
+    R_{{ reg.name }}_O <= REG_{{ reg.name }}_W;
   {% endfor %}
   -- Connect AXI-Lite ready/valid control signals
   REGS_WREADY <= w_ready;
   REGS_RVALID <= r_valid;
+  {%- if independent_writes %}
+  REGS_AWREADY <= aw_ready;
+  REGS_BVALID <= b_valid;
+  {%- endif %}
+  {%- if throughput == 'full' %}
+  REGS_ARREADY <= ar_ready;
+  {%- endif %}
+  {%- if independent_writes %}
+
+  -- AW and W are each accepted while their holding register is empty. A write
+  -- is performed as soon as its address and data are both available and the
+  -- write response channel is free, so one write can complete every clock cycle.
+  wr_en <= (aw_held or (REGS_AWVALID and aw_ready)) and
+           (w_held or (REGS_WVALID and w_ready)) and
+           (not b_valid or REGS_BREADY);
+  wr_addr <= address_wr when aw_held = '1' else REGS_AWADDR(wr_addr'range);
+  wr_data <= wdata_held when w_held = '1' else REGS_WDATA;
+  wr_strb <= wstrb_held when w_held = '1' else REGS_WSTRB;
+
+  write_channels_p : process(REGS_ACLK) is
+  begin
+    if rising_edge(REGS_ACLK) then
+      if REGS_ARESETN = '0' then
+        aw_held <= '0';
+        w_held <= '0';
+        aw_ready <= '0';
+        w_ready <= '0';
+        b_valid <= '0';
+      else
+        if wr_en = '1' then
+          aw_held <= '0';
+          w_held <= '0';
+        else
+          if REGS_AWVALID = '1' and aw_ready = '1' then
+            aw_held <= '1';
+            address_wr <= REGS_AWADDR(address_wr'range);
+          end if;
+          if REGS_WVALID = '1' and w_ready = '1' then
+            w_held <= '1';
+            wdata_held <= REGS_WDATA;
+            wstrb_held <= REGS_WSTRB;
+          end if;
+        end if;
+        aw_ready <= wr_en or not (aw_held or (REGS_AWVALID and aw_ready));
+        w_ready <= wr_en or not (w_held or (REGS_WVALID and w_ready));
+        if wr_en = '1' then
+          b_valid <= '1';
+        elsif REGS_BREADY = '1' then
+          b_valid <= '0';
+        end if;
+      end if;
+    end if;
+  end process;
+  {%- else %}
 
   write_fsm_p : process(REGS_ACLK) is
   begin
@@ -189,6 +309,38 @@ begin
       end if;
     end if;
   end process;
+  {%- endif %}
+  {%- if throughput == 'full' %}
+
+  -- A read address is used as soon as it arrives unless the read data channel
+  -- is stalled, in which case it is held, so one read can complete every clock
+  -- cycle.
+  rd_advance <= not r_valid or REGS_RREADY;
+  rd_en <= (ar_held or (REGS_ARVALID and ar_ready)) and rd_advance;
+  rd_addr <= address_rd when ar_held = '1' else REGS_ARADDR(rd_addr'range);
+
+  read_channels_p : process(REGS_ACLK) is
+  begin
+    if rising_edge(REGS_ACLK) then
+      if REGS_ARESETN = '0' then
+        ar_held <= '0';
+        ar_ready <= '0';
+        r_valid <= '0';
+      else
+        if rd_en = '1' then
+          ar_held <= '0';
+        elsif REGS_ARVALID = '1' and ar_ready = '1' then
+          ar_held <= '1';
+          address_rd <= REGS_ARADDR(address_rd'range);
+        end if;
+        ar_ready <= rd_en or not (ar_held or (REGS_ARVALID and ar_ready));
+        if rd_advance = '1' then
+          r_valid <= {{ 'rd_valid(%d)' % (read_latency-2) if read_pipeline else 'rd_en' }};
+        end if;
+      end if;
+    end if;
+  end process;
+  {%- else %}
 
   read_fsm_p : process (REGS_ACLK) is
   begin
@@ -204,13 +356,26 @@ begin
             REGS_ARREADY <= '1';
           when WAIT4ADDR =>
             if REGS_ARVALID = '1' then
+              {%- if read_latency == 1 %}
+              state_r <= WAIT4DATA;
+              REGS_ARREADY <= '0';
+              r_valid <= '1';
+              {%- else %}
               state_r <= WAITREG;
               REGS_ARREADY <= '0';
               address_rd   <= REGS_ARADDR(address_rd'range);
+              {%- endif %}
             end if;
           when WAITREG =>
+            {%- if read_pipeline %}
+            if rd_valid({{ read_latency-2 }}) = '1' then
+              state_r <= WAIT4DATA;
+              r_valid <= '1';
+            end if;
+            {%- else %}
             state_r <= WAIT4DATA;
             r_valid <= '1';
+            {%- endif %}
           when WAIT4DATA =>
             if REGS_RREADY = '1' then
               state_r <= WAIT4ADDR;
@@ -223,67 +388,202 @@ begin
       end if;
     end if;
   end process;
+  {%- endif %}
+  {%- if read_pipeline %}
 
-  write_p : process (REGS_ACLK) is
+  -- The read mux decodes a registered address, and each cycle of read latency
+  -- above two adds a register stage, between the levels of a read mux tree or
+  -- after the read mux. The stages only advance while the read data is not stalled.
+  {%- if throughput == 'full' %}
+  {%- set rd_start = 'rd_en' %}
+  {%- else %}
+  {%- set rd_start = 'rd_start' %}
+  rd_start <= REGS_ARVALID when state_r = WAIT4ADDR else '0';
+  {%- endif %}
+
+  read_pipeline_p : process(REGS_ACLK) is
   begin
     if rising_edge(REGS_ACLK) then
       if REGS_ARESETN = '0' then
-        {%- for reg in regs -%}
-        {%- if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' %}
-        REG_{{ reg['name'] }}_W <= {{ reg|default_val }};
-        {%- if reg['use_upd_pulse'] %}
-        R_{{ reg['name'] }}_O_upd <= '0';
+        rd_valid <= (others => '0');
+      {% if throughput == 'full' %}elsif rd_advance = '1' then{% else %}else{% endif %}
+        {%- if read_latency == 2 %}
+        rd_valid(0) <= {{ rd_start }};
+        {%- else %}
+        rd_valid <= rd_valid({{ read_latency-3 }} downto 0) & {{ rd_start }};
         {%- endif %}
+        {%- if throughput == 'full' %}
+        rd_mux_addr <= rd_addr;
         {%- endif %}
+        {%- if read_tree %}
+        {%- for stage in range(1, read_tree.stages+1) %}
+        rd_tree_addr_{{ stage }} <= rd_tree_addr_{{ stage-1 }};
+        {%- endfor %}
+        {%- for node in read_tree.registered %}
+        rd_mux_{{ node.name }}_q <= rd_mux_{{ node.name }};
+        rd_hit_{{ node.name }}_q <= rd_hit_{{ node.name }};
         {%- endfor %}
-      else
-        {%- for reg in regs -%}
-        {%- if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' %}
-        {%- if reg['use_upd_pulse'] %}
-        R_{{ reg['name'] }}_O_upd <= '0';
         {%- endif %}
+        {%- for i in range(1, read_data_stages+1) %}
+        rd_data_{{ i }} <= {{ 'rd_data_%d' % (i-1) if i > 1 else 'rd_mux' }};
+        rd_resp_{{ i }} <= {{ 'rd_resp_%d' % (i-1) if i > 1 else 'rd_resp' }};
+        {%- endfor %}
+      end if;
+    end if;
+  end process;
+  {%- endif %}
+  {%- if independent_writes %}
+  {%- set wr_en, wr_addr, wr_strb, wr_data = "wr_en = '1'", 'wr_addr', 'wr_strb', 'wr_data' %}
+  {%- else %}
+  {%- set wr_en, wr_addr, wr_strb, wr_data = "REGS_WVALID = '1' and w_ready = '1'", 'address_wr', 'REGS_WSTRB', 'REGS_WDATA' %}
+  {%- endif %}
+  {%- if throughput == 'full' and read_pipeline %}
+  {%- set rd_addr, rd_en = 'rd_mux_addr', "rd_advance = '1' and rd_valid(%d) = '1'" % (read_latency-2) %}
+  {%- elif throughput == 'full' %}
+  {%- set rd_addr, rd_en = 'rd_addr', "rd_en = '1'" %}
+  {%- elif read_latency == 1 %}
+  {%- set rd_addr, rd_en = "REGS_ARADDR(address_rd'range)", "state_r = WAIT4ADDR and REGS_ARVALID = '1'" %}
+  {%- elif read_pipeline %}
+  {%- set rd_addr, rd_en = 'address_rd', "rd_valid(%d) = '1'" % (read_latency-2) %}
+  {%- else %}
+  {%- set rd_addr, rd_en = 'address_rd', 'state_r = WAITREG' %}
+  {%- endif %}
+  {%- if read_data_stages > 0 %}
+  {%- set rd_data, rd_resp = 'rd_data_%d' % read_data_stages, 'rd_resp_%d' % read_data_stages %}
+  {%- else %}
+  {%- set rd_data, rd_resp = 'rd_mux', 'rd_resp' %}
+  {%- endif %}
+  {%- if write_onehot %}
+
+  -- The write address is compared against every writable register in parallel as
+  -- it is accepted, and the result is registered with the address. A write that
+  -- uses the address in the cycle it arrives uses its decode directly. The write
+  -- process then only checks the enable bit of each register.
+  {%- for reg in regs_out %}
+  wr_sel_in({{ loop.index0 }}) <= '1' when REGS_AWADDR(address_wr'range) = REG_{{ reg.name }}_ADDR else '0';
+  {%- endfor %}
+  {%- if independent_writes %}
+  wr_sel <= wr_sel_q when aw_held = '1' else wr_sel_in;
+  {%- else %}
+  wr_sel <= wr_sel_q;
+  {%- endif %}
+
+  write_decode_p : process(REGS_ACLK) is
+  begin
+    if rising_edge(REGS_ACLK) then
+      if {{ "REGS_AWVALID = '1' and aw_ready = '1'" if independent_writes else "state_w = WAIT4ADDR and REGS_AWVALID = '1'" }} then
+        wr_sel_q <= wr_sel_in;
+      end if;
+    end if;
+  end process;
+  {%- endif %}
+
+  write_p : process (REGS_ACLK) is
+  begin
+    if rising_edge(REGS_ACLK) then
+      if REGS_ARESETN = '0' then
+        {%- for reg in regs_out %}
+        REG_{{ reg.name }}_W <= {{ reg.default_vhdl }};
+        {%- if reg.use_upd_pulse %}
+        R_{{ reg.name }}_O_upd <= '0';
         {%- endif %}
         {%- endfor %}
-        if REGS_WVALID = '1' and w_ready = '1' then
-          {% for reg in regs -%}
-          {%- if reg['reg_type'] == 'rw' or reg['reg_type'] == 'custom' -%}
-          if address_wr = REG_{{ reg['name'] }}_ADDR then
-            {%- if reg['use_upd_pulse'] %}
-            R_{{ reg['name'] }}_O_upd <= '1';
+      else
+        {%- for reg in regs_upd %}
+        R_{{ reg.name }}_O_upd <= '0';
+        {%- endfor %}
+        if {{ wr_en }} then
+          {% if write_onehot -%}
+          {% for reg in regs_out -%}
+          if wr_sel({{ loop.index0 }}) = '1' then
+            {%- if reg.use_upd_pulse %}
+            R_{{ reg.name }}_O_upd <= '1';
             {%- endif %}
-            REGS_BRESP <= AXI_RESP_OKAY;
-            {%- for s in range(strobe_size) %}
-            {%- if 8*s < reg['bits']|count_bits %}
-            if REGS_WSTRB({{s}}) = '1' then
-              REG_{{ reg['name'] }}_W({{ [reg['bits']|count_bits-1, 8*(s+1)-1]|min }} downto {{ 8*s }}) <= REGS_WDATA({{ [reg['bits']|count_bits-1, 8*(s+1)-1]|min }} downto {{ 8*s }});
+            {%- for s, high, low in reg.strobes %}
+            if {{ wr_strb }}({{s}}) = '1' then
+              REG_{{ reg.name }}_W({{ high }} downto {{ low }}) <= {{ wr_data }}({{ high }} downto {{ low }});
             end if;
+            {%- endfor %}
+          end if;
+          {% endfor -%}
+          if unsigned(wr_sel) /= 0 then
+            REGS_BRESP <= AXI_RESP_OKAY;
+          else
+            REGS_BRESP <= AXI_RESP_SLVERR;
+          end if;
+        {% else -%}
+          {% for reg in regs_out -%}
+          if {{ wr_addr }} = REG_{{ reg.name }}_ADDR then
+            {%- if reg.use_upd_pulse %}
+            R_{{ reg.name }}_O_upd <= '1';
             {%- endif %}
+            REGS_BRESP <= AXI_RESP_OKAY;
+            {%- for s, high, low in reg.strobes %}
+            if {{ wr_strb }}({{s}}) = '1' then
+              REG_{{ reg.name }}_W({{ high }} downto {{ low }}) <= {{ wr_data }}({{ high }} downto {{ low }});
+            end if;
             {%- endfor %}
-          els{%- endif -%}{%- endfor -%}e
+          els{%- endfor -%}e
             REGS_BRESP <= AXI_RESP_SLVERR;
           end if;
+        {% endif -%}
         end if;
       end if;
     end if;
   end process;
 
+  {%- if read_tree %}
+
+  -- Read mux tree
+  -- Each node selects one of its inputs on a few address bits. Addresses that no
+  -- register decodes read as zero with an error response.
+  rd_tree_addr_0 <= std_logic_vector(resize(unsigned({{ rd_addr }}), {{ read_tree.width }}));
+  rd_in_range <= '1' when shift_right(unsigned({{ rd_addr }}), {{ read_tree.width }}) = 0{% if read_tree.low %} and
+                 rd_tree_addr_0({{ read_tree.low-1 }} downto 0) = "{{ '0' * read_tree.low }}"{% endif %} else '0';
+  {%- for nodes in read_tree.levels %}
+  {%- for node in nodes %}
+  {%- set sel_bits = 'rd_tree_addr_%d(%d downto %d)' % (node.stage, node.low+node.bits-1, node.low) %}
+
+  with {{ sel_bits }} select rd_mux_{{ node.name }} <=
+    {%- for sel, input in node.inputs %}
+    {%- if node.level %}
+    rd_mux_{{ input.name }}{{ '_q' if input.registered }} when "{{ '{0:0{1}b}'.format(sel, node.bits) }}",
+    {%- else %}
+    {% if input.padding %}"{{ '0' * input.padding }}" & {% endif %}REG_{{ input.name }}_R when "{{ '{0:0{1}b}'.format(sel, node.bits) }}",
+    {%- endif %}
+    {%- endfor %}
+    (others=>'0') when others;
+
+  with {{ sel_bits }} select rd_hit_{{ node.name }} <=
+    {%- for sel, input in node.inputs %}
+    {{ 'rd_hit_%s%s' % (input.name, '_q' if input.registered else '') if node.level else 'rd_in_range' }} when "{{ '{0:0{1}b}'.format(sel, node.bits) }}",
+    {%- endfor %}
+    '0' when others;
+  {%- endfor %}
+  {%- endfor %}
+
+  rd_mux <= rd_mux_{{ read_tree.root.name }};
+  rd_resp <= AXI_RESP_OKAY when rd_hit_{{ read_tree.root.name }} = '1' else AXI_RESP_SLVERR;
+  {%- else %}
+
   rd_mux <= {% for reg in regs -%}
-    {%- if reg['bits']|count_bits != data_size %}
-    "{%- for i in range(data_size - reg['bits']|count_bits) %}0{%- endfor -%}" & {% endif -%}REG_{{ reg['name'] }}_R when address_rd = REG_{{ reg['name'] }}_ADDR else {% endfor -%}
+    {%- if reg.padding %}
+    "{{ '0' * reg.padding }}" & {% endif -%}REG_{{ reg.name }}_R when {{ rd_addr }} = REG_{{ reg.name }}_ADDR else {% endfor -%}
     (others=>'0');
 
   rd_resp <= {% for reg in regs -%}
-    AXI_RESP_OKAY when address_rd = REG_{{ reg['name'] }}_ADDR else {% endfor -%}
+    AXI_RESP_OKAY when {{ rd_addr }} = REG_{{ reg.name }}_ADDR else {% endfor -%}
     AXI_RESP_SLVERR;
+  {%- endif %}
 
   read_p : process (REGS_ACLK) is
   begin
     if rising_edge(REGS_ACLK) then
       if REGS_ARESETN = '0' then
       else
-        if state_r = WAITREG then
-          REGS_RDATA <= rd_mux;
-          REGS_RRESP <= rd_resp;
+        if {{ rd_en }} then
+          REGS_RDATA <= {{ rd_data }};
+          REGS_RRESP <= {{ rd_resp }};
         end if;
       end if;
     end if;
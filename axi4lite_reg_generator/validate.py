@@ -15,51 +15,166 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
 import argparse
 import hashlib
+import mmap
 import os
 import re
 
+# Number of bytes hashed at a time
+CHUNK_SIZE = 1 << 20
 
-def validate(*args):
-    hash_pass = True
-    for file in args:
-        # Read the file
-        if not os.path.exists(file):
-            print(f'ERROR: file does not exist: {file}')
-            hash_pass = False
-            continue
-        with open(file, 'r', encoding='utf-8') as f:
-            data = f.read()
-
-        # Split the file into content and hash
-        lines = data.rsplit('\n', 1)
-
-        # Check if the hash is present and extract it
-        hash = re.search(r'SHA-256: (\w+)', lines[1])
-        if hash is None:
-            print(f'ERROR: hash not found for file {file}')
-            hash_pass = False
-            continue
-        else:
-            hash = hash.group(1)
-        file_contents = lines[0]
-
-        # Calculate the hash of the file contents
-        h = hashlib.sha256(file_contents.encode('utf-8')).hexdigest()
-
-        # Compare the calculated hash with the hash in the file
-        if hash != h:
-            print(f'ERROR: hash mismatch for file {file}')
-            print(f'\tExpected: {hash}')
-            print(f'\tActual: {h}')
-            hash_pass = False
+TRAILER_RE = re.compile(rb'SHA-256: (\w+)')
+
+# Number of bytes read from the end of a file to find its trailer
+TRAILER_SIZE = 256
+
+
+def check_file(file: str) -> dict:
+    """Check the SHA-256 trailer of a generated file.
+
+    The file is memory-mapped, the trailer is found by scanning backwards for the
+    last line break, and the content before it is hashed in chunks. Line breaks
+    are normalized to \\n before hashing, so files written with Windows line
+    endings still validate.
+
+    Args:
+        file: Path to generated file
+
+    Returns:
+        Dictionary with the file path, a status of 'valid', 'mismatch',
+        'missing_hash', or 'missing_file', and the expected and actual hashes
+        when they are known
+    """
+    result = dict(file=file, status='missing_file', expected=None, actual=None)
+    if not os.path.exists(file):
+        return result
+
+    result['status'] = 'missing_hash'
+    with open(file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return result
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The trailer is the text after the last line break
+            split = max(mm.rfind(b'\n'), mm.rfind(b'\r'))
+            if split < 0:
+                return result
+            match = TRAILER_RE.search(mm, split + 1)
+            if match is None:
+                return result
+            result['expected'] = match.group(1).decode()
+
+            end = split
+            if mm[split : split + 1] == b'\n' and mm[split - 1 : split] == b'\r':
+                end -= 1
+            result['actual'] = _hash_text(mm, end)
+
+    if result['actual'] == result['expected']:
+        result['status'] = 'valid'
+    else:
+        result['status'] = 'mismatch'
+    return result
+
+
+def read_hash(file: str | os.PathLike) -> str | None:
+    """Read the hash recorded in the SHA-256 trailer of a generated file.
+
+    Only the end of the file is read and the content is not hashed, so this is a
+    cheap way to compare a generated file with new output for the same target.
+
+    Args:
+        file: Path to generated file
+
+    Returns:
+        Hash from the trailer, or None if the file is missing or has no trailer
+    """
+    try:
+        with open(file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - TRAILER_SIZE))
+            tail = f.read()
+    except OSError:
+        return None
+    split = max(tail.rfind(b'\n'), tail.rfind(b'\r'))
+    if split < 0:
+        return None
+    match = TRAILER_RE.search(tail, split + 1)
+    return None if match is None else match.group(1).decode()
+
+
+def _hash_text(data: mmap.mmap, end: int) -> str:
+    """Hash the start of a buffer in chunks with line breaks normalized to \\n.
+
+    Args:
+        data: Buffer to hash
+        end: Number of bytes to hash
+
+    Returns:
+        SHA-256 hex digest
+    """
+    h = hashlib.sha256()
+    carry = b''
+    for start in range(0, end, CHUNK_SIZE):
+        chunk = carry + data[start : min(start + CHUNK_SIZE, end)]
+        # Hold back a trailing \r in case the next chunk starts with \n
+        carry = b''
+        if chunk.endswith(b'\r'):
+            carry = b'\r'
+            chunk = chunk[:-1]
+        h.update(chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n'))
+    if carry:
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def validate(*args, jobs: int | None = None, json_output: bool = False):
+    """Check the SHA-256 trailer of generated files.
+
+    Files are checked concurrently in a thread pool and reported in the order
+    they were given. A single file, or jobs=1, is checked without starting a
+    pool.
+
+    Args:
+        *args: Paths to generated files
+        jobs: Maximum number of files checked at once. Defaults to the thread
+          pool's default worker count.
+        json_output: Print a JSON summary instead of one line per file
+
+    Returns:
+        True if any file is missing or has a missing or invalid hash
+    """
+    if len(args) <= 1 or jobs == 1:
+        results = [check_file(file) for file in args]
+    else:
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check_file, args))
+    hash_pass = all(r['status'] == 'valid' for r in results)
+
+    if json_output:
+        import json
+
+        print(json.dumps(dict(valid=hash_pass, files=results), indent=2))
+        return not hash_pass
+
+    for r in results:
+        if r['status'] == 'missing_file':
+            print(f'ERROR: file does not exist: {r["file"]}')
+        elif r['status'] == 'missing_hash':
+            print(f'ERROR: hash not found for file {r["file"]}')
+        elif r['status'] == 'mismatch':
+            print(f'ERROR: hash mismatch for file {r["file"]}')
+            print(f'\tExpected: {r["expected"]}')
+            print(f'\tActual: {r["actual"]}')
         else:
-            print(f'Hash for file {file} is valid')
+            print(f'Hash for file {r["file"]} is valid')
     return not hash_pass
 
 
-if __name__ == '__main__':
+def main():
     parser = argparse.ArgumentParser(
         prog='AXI4Lite Register Generator Hash Validator',
         description='Verify hash of generated output',
@@ -68,7 +183,23 @@ if __name__ == '__main__':
     parser.add_argument(
         'files', type=str, nargs='+', help='Path(s) to generated file(s)'
     )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of files to check in parallel',
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print a machine-readable JSON summary',
+    )
 
     args = parser.parse_args()
 
-    exit(validate(*args.files))
+    return validate(*args.files, jobs=args.jobs, json_output=args.json)
+
+
+if __name__ == '__main__':
+    exit(main())
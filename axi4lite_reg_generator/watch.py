@@ -0,0 +1,294 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import functools
+import hashlib
+import io
+import os
+import sys
+import time
+from typing import BinaryIO, Callable
+from axi4lite_reg_generator.include_cache import IncludeCache
+from axi4lite_reg_generator.regdef import TARGETS, RegDef, write_file
+from axi4lite_reg_generator.register import Bits
+
+# Seconds between checks of the watched files
+POLL_INTERVAL = 0.05
+
+# Targets that show register and field descriptions. The HDL outputs do not, so
+# they are not rendered again when only descriptions change.
+DESCRIPTION_TARGETS = frozenset(('md',))
+
+
+class _RecordingCache(IncludeCache):
+    """Include cache that records the files loaded by each build."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaded: set[str] = set()
+
+    def load(self, file: str) -> list:
+        self.loaded.add(file)
+        return super().load(file)
+
+
+class Watcher:
+    """Regenerate outputs when a register map or any file it includes changes.
+
+    The watcher keeps its include cache and the process-wide template cache warm
+    between builds, so only included files that changed are parsed and validated
+    again. Watched files are polled for changes in modification time or size, and
+    a file whose content is unchanged does not trigger a build. After a build,
+    only outputs whose content changed are rewritten; the generation timestamp is
+    ignored when comparing, so editing a description only rewrites the Markdown
+    documentation.
+    """
+
+    def __init__(
+        self,
+        json_file: str,
+        outputs: dict[str, str],
+        entity_name: str | None = None,
+        log: Callable[[str], None] = print,
+        reproducible: bool | None = None,
+    ) -> None:
+        """Create watcher.
+
+        Args:
+            json_file: Path to top level JSON configuration file
+            outputs: Dictionary mapping each output target to the file it is
+              written to
+            entity_name: Optional override name for HDL entity name
+            log: Function called with each progress message
+            reproducible: Generate byte-identical output for identical inputs. If
+              not specified, enabled when SOURCE_DATE_EPOCH is set.
+        """
+        for target in outputs:
+            if target not in TARGETS:
+                raise KeyError(target)
+        self._json_file = json_file
+        self._outputs = outputs
+        self._entity_name = entity_name
+        self._log = log
+        self._reproducible = reproducible
+        self._include_cache = _RecordingCache()
+        # Modification stamp and content hash of each watched file
+        self._files: dict[str, tuple[tuple[int, int] | None, str | None]] = {}
+        # Generation timestamp and hash of the last output written for each target
+        self._outputs_written: dict[str, tuple[str, str]] = {}
+        # Fingerprint of the register map each target was last rendered from
+        self._fingerprints: dict[str, str] = {}
+
+    @property
+    def files(self) -> list[str]:
+        """Paths of the watched files."""
+        return list(self._files)
+
+    def changed(self) -> bool:
+        """Check whether the content of a watched file changed since the last build.
+
+        Returns:
+            True if a watched file was modified, created, or removed
+        """
+        changed = False
+        for file, (stamp, digest) in self._files.items():
+            new_stamp = _stamp(file)
+            if new_stamp == stamp:
+                continue
+            # Saving a file without changes updates its stamp only
+            new_digest = _digest(file) if new_stamp is not None else None
+            self._files[file] = (new_stamp, new_digest)
+            changed = changed or new_digest != digest
+        return changed
+
+    def build(self) -> list[str]:
+        """Build the register map and write the outputs that changed.
+
+        Returns:
+            Paths of output files that were written
+
+        Raises:
+            FileNotFoundError: If a JSON file is not found
+            JSONDecodeError: If a JSON file is invalid
+            SchemaError: If configuration doesn't match schema
+            ValueError: If configuration is invalid or contains duplicates
+        """
+        # Stamps are taken before reading, so changes made during the build are
+        # picked up by the next check
+        files = [self._json_file]
+        self._include_cache.loaded.clear()
+        try:
+            self._watch(self._json_file)
+            regs = RegDef.from_json_file(
+                self._json_file,
+                entity_name=self._entity_name,
+                include_cache=self._include_cache,
+                reproducible=self._reproducible,
+            )
+        finally:
+            # Keep watching every file of the last build until this one succeeds,
+            # so fixing a broken include triggers a rebuild
+            loaded = self._include_cache.loaded
+            for file in loaded:
+                self._watch(file)
+            files.extend(sorted(loaded))
+
+        for file in [f for f in self._files if f not in files]:
+            del self._files[file]
+
+        # Outputs rendered from the same register map cannot change
+        fingerprints = _fingerprints(regs)
+        buffers = {}
+        for target, file in self._outputs.items():
+            fingerprint = fingerprints[target in DESCRIPTION_TARGETS]
+            if self._fingerprints.get(target) != fingerprint or not os.path.exists(
+                file
+            ):
+                self._fingerprints[target] = fingerprint
+                buffers[target] = io.BytesIO()
+        hashes = regs.render_all_to_files(buffers)
+
+        written = []
+        for target, buffer in buffers.items():
+            file = self._outputs[target]
+            data = buffer.getvalue()
+            if self._unchanged(
+                target, regs.id_timestamp, hashes[target], data
+            ) and os.path.exists(file):
+                continue
+            write_file(file, functools.partial(_write, data, hashes[target]))
+            self._outputs_written[target] = (regs.id_timestamp, hashes[target])
+            written.append(file)
+        return written
+
+    def _unchanged(self, target: str, timestamp: str, hash: str, data: bytes) -> bool:
+        """Check whether an output matches the last one written for its target.
+
+        The outputs are compared as if they had been generated at the same time,
+        so a new generation timestamp alone does not count as a change.
+        """
+        last = self._outputs_written.get(target)
+        if last is None:
+            return False
+        last_timestamp, last_hash = last
+        if timestamp != last_timestamp:
+            body = data[: data.rfind(b'\n')]
+            body = body.replace(timestamp.encode(), last_timestamp.encode(), 1)
+            hash = hashlib.sha256(body).hexdigest()
+        return hash == last_hash
+
+    def run(
+        self,
+        interval: float = POLL_INTERVAL,
+        stop: Callable[[], bool] | None = None,
+    ) -> None:
+        """Build the outputs and rebuild them whenever a watched file changes.
+
+        Errors are reported and the watcher waits for the next change.
+
+        Args:
+            interval: Seconds between checks of the watched files
+            stop: Optional function that ends the watch when it returns True
+        """
+        self._rebuild()
+        self._log(f'Watching {len(self._files)} files for changes')
+        while stop is None or not stop():
+            time.sleep(interval)
+            if self.changed():
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        start = time.perf_counter()
+        try:
+            written = self.build()
+        except Exception as e:
+            print(f'ERROR: {e}', file=sys.stderr)
+            return
+        elapsed = (time.perf_counter() - start) * 1e3
+        for file in written:
+            self._log(f'Wrote: {file}')
+        if not written:
+            self._log('Outputs unchanged')
+        self._log(f'Build finished in {elapsed:.0f} ms')
+
+    def _watch(self, file: str) -> None:
+        if file not in self._files:
+            stamp = _stamp(file)
+            self._files[file] = (stamp, _digest(file) if stamp is not None else None)
+
+
+def _write(data: bytes, hash: str, f: BinaryIO) -> str:
+    """Write rendered output to a file and return its hash, for write_file."""
+    f.write(data)
+    return hash
+
+
+def _stamp(file: str) -> tuple[int, int] | None:
+    """Get the modification time and size of a file, or None if it is missing."""
+    try:
+        st = os.stat(file)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(file: str) -> str | None:
+    """Hash the content of a file, or None if it cannot be read."""
+    try:
+        with open(file, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _fingerprints(regs: RegDef) -> tuple[str, str]:
+    """Hash the configuration and flattened registers that outputs are rendered from.
+
+    Args:
+        regs: Register definition
+
+    Returns:
+        Tuple containing:
+            - SHA-256 hex digest of everything except descriptions
+            - SHA-256 hex digest of everything including descriptions
+    """
+    values = [sorted(regs._reg_cfg.items())]
+    descriptions = []
+    for reg in regs._cfg:
+        bits = reg.bits
+        field_descriptions = None
+        if isinstance(bits, Bits):
+            bits = (bits.num_bits, bits.default_value)
+        elif isinstance(bits, tuple):
+            field_descriptions = [f.description for f in bits]
+            bits = [(f.field_name, f.num_bits, f.default_value) for f in bits]
+        values.append(
+            (
+                reg.name,
+                reg.reg_type,
+                reg.use_upd_pulse,
+                reg.addr_offset,
+                reg.get('instance'),
+                bits,
+            )
+        )
+        descriptions.append((reg.get('description'), field_descriptions))
+    without = hashlib.sha256(repr(values).encode()).hexdigest()
+    return without, hashlib.sha256((without + repr(descriptions)).encode()).hexdigest()
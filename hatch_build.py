@@ -0,0 +1,53 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+"""Wheel build hook that ships the templates compiled to Python modules."""
+
+import shutil
+import sys
+import tempfile
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Compile the templates and add them to the wheel.
+
+    Editable installs load the templates from the source tree instead, so edits
+    to the templates take effect without a rebuild.
+    """
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if version == 'editable':
+            return
+
+        sys.path.insert(0, self.root)
+        try:
+            from axi4lite_reg_generator import template_cache
+        finally:
+            sys.path.remove(self.root)
+
+        self._compiled_dir = tempfile.mkdtemp(prefix='axi4lite_templates_')
+        template_cache.compile_templates(self._compiled_dir)
+        build_data['force_include'][self._compiled_dir] = (
+            'axi4lite_reg_generator/templates_compiled'
+        )
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        compiled_dir = getattr(self, '_compiled_dir', None)
+        if compiled_dir is not None:
+            shutil.rmtree(compiled_dir, ignore_errors=True)
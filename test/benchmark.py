@@ -0,0 +1,333 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+#
+"""Generator benchmark suite with synthetic register maps.
+
+Each map is written to a temporary directory and run through the same phases as
+RegDef: JSON load, schema validation, hierarchy flattening, duplicate checks, and
+a render of every output target. Each phase is timed and its peak memory is
+measured with tracemalloc in a separate pass.
+
+Usage:
+    python -m test.benchmark                      # compare against the baseline
+    python -m test.benchmark --update             # rewrite the baseline
+    python -m test.benchmark --maps flat_10 deep  # run some maps only
+"""
+
+# future import required for 3.8 and 3.9 support
+from __future__ import annotations
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+import axi4lite_reg_generator
+from axi4lite_reg_generator.address_map import AddressAllocator
+from axi4lite_reg_generator.include_cache import IncludeCache
+from axi4lite_reg_generator.regdef import TARGETS, RegDef
+from axi4lite_reg_generator.regmap import RegMap
+from axi4lite_reg_generator.schema import validate as validate_schema
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+
+PHASES = ('load', 'validate', 'flatten', 'checks', *TARGETS)
+
+# Slowdown over the baseline that fails the run
+DEFAULT_THRESHOLD = 1.5
+
+# Differences below these are treated as noise
+MIN_TIME_DELTA = 0.005
+MIN_PEAK_DELTA = 64 * 1024
+
+
+def _config() -> dict:
+    return dict(config=dict(data_size=32, entity_name='bench'))
+
+
+def _reg(idx: int) -> dict:
+    reg = dict(name=f'Reg_{idx}', description=f'Register {idx}', bits=32)
+    if idx % 3 == 1:
+        reg.update(reg_type='rw', use_upd_pulse=True)
+    return reg
+
+
+def _write(directory: str, name: str, cfg: list) -> str:
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        json.dump(cfg, f)
+    return path
+
+
+def _flat(num_regs: int, directory: str) -> str:
+    return _write(
+        directory, 'top.json', [_config(), *(_reg(i) for i in range(num_regs))]
+    )
+
+
+def _fields(num_regs: int, num_fields: int, directory: str) -> str:
+    regs = [
+        dict(
+            name=f'Reg_{i}',
+            description=f'Register {i}',
+            reg_type='custom',
+            use_upd_pulse=True,
+            bits=[
+                dict(
+                    field_name=f'field_{j}',
+                    num_bits=32 // num_fields,
+                    default_value=j % 2,
+                    description=f'Field {j}',
+                )
+                for j in range(num_fields)
+            ],
+        )
+        for i in range(num_regs)
+    ]
+    return _write(directory, 'top.json', [_config(), *regs])
+
+
+def _deep(depth: int, regs_per_level: int, directory: str) -> str:
+    # Each level holds some registers and includes the next level
+    for level in reversed(range(1, depth)):
+        cfg = [_reg(i) for i in range(regs_per_level)]
+        if level + 1 < depth:
+            cfg.append(dict(name=f'L{level + 1}', file=f'level_{level + 1}.json'))
+        _write(directory, f'level_{level}.json', cfg)
+    cfg = [_config(), *(_reg(i) for i in range(regs_per_level))]
+    if depth > 1:
+        cfg.append(dict(name='L1', file='level_1.json'))
+    return _write(directory, 'top.json', cfg)
+
+
+def _wide(num_instances: int, regs_per_instance: int, directory: str) -> str:
+    _write(directory, 'block.json', [_reg(i) for i in range(regs_per_instance)])
+    cfg = [dict(name=f'Block_{i}', file='block.json') for i in range(num_instances)]
+    return _write(directory, 'top.json', [_config(), *cfg])
+
+
+# Map name and a function that writes the map into a directory and returns the
+# path of its top level JSON file
+MAPS: dict[str, Callable[[str], str]] = {
+    'flat_10': functools.partial(_flat, 10),
+    'flat_1k': functools.partial(_flat, 1000),
+    'flat_10k': functools.partial(_flat, 10_000),
+    'flat_100k': functools.partial(_flat, 100_000),
+    'fields': functools.partial(_fields, 1000, 16),
+    'deep': functools.partial(_deep, 32, 16),
+    'wide': functools.partial(_wide, 256, 16),
+}
+
+
+def measure(json_file: str, repeat: int = 1) -> dict[str, dict[str, float]]:
+    """Measure each generator phase for a register map.
+
+    Included files are parsed and validated during the flatten phase, the same
+    as in RegDef, so a fresh include cache is used every time it runs.
+
+    Args:
+        json_file: Path to top level JSON configuration file
+        repeat: Number of timed runs. The fastest run is reported.
+
+    Returns:
+        Dictionary mapping each phase to its time in seconds and peak memory in
+        bytes
+    """
+    path_to_cfg = os.path.dirname(json_file)
+    regs = RegDef.from_json_file(json_file, include_cache=IncludeCache())
+    state = {}
+
+    def load():
+        with open(json_file, 'r') as f:
+            state['cfg'] = json.load(f)
+
+    def validate():
+        _, cfg = RegDef._split_config(list(state['cfg']))
+        state['regs'] = validate_schema(cfg)
+
+    def flatten():
+        regs._allocator = AddressAllocator(regs._addr_incr)
+        regs._include_cache = IncludeCache()
+        regs._cfg = RegMap(regs._flatten_heirarchy(state['regs'], path_to_cfg))
+
+    def checks():
+        errors = [
+            *regs._find_duplicate_addresses(),
+            *regs._find_duplicate_names(),
+            *regs._check_regs_too_large(),
+            *regs._check_address_ranges(),
+            *regs._check_interface_options(),
+        ]
+        assert not errors, errors
+
+    phases = dict(load=load, validate=validate, flatten=flatten, checks=checks)
+    for target in TARGETS:
+        phases[target] = functools.partial(regs._render_target, target)
+
+    results = {phase: dict(time=float('inf'), peak=0) for phase in phases}
+    for _ in range(repeat):
+        for phase, fn in phases.items():
+            # Start each phase without garbage left over from the previous one
+            gc.collect()
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            results[phase]['time'] = min(results[phase]['time'], elapsed)
+
+    tracemalloc.start()
+    try:
+        for phase, fn in phases.items():
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            fn()
+            results[phase]['peak'] = tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def run(maps: list[str], repeat: int = 1, log: Callable | None = None) -> dict:
+    """Run the benchmark on synthetic register maps.
+
+    Args:
+        maps: Names of maps from MAPS to run
+        repeat: Number of timed runs per phase
+        log: Optional function called with each map name before it runs
+
+    Returns:
+        Dictionary mapping each map name to its phase measurements
+    """
+    results = {}
+    for name in maps:
+        if log is not None:
+            log(name)
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = measure(MAPS[name](directory), repeat)
+    return results
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """Find phases that regressed against a baseline.
+
+    A phase regresses when its time or peak memory exceeds the baseline by more
+    than the threshold ratio and by more than the noise floor. Maps and phases
+    missing from the baseline are ignored.
+
+    Args:
+        results: Measurements returned by run
+        baseline: Baseline measurements in the same format
+        threshold: Allowed ratio over the baseline
+
+    Returns:
+        Description of each regression
+    """
+    regressions = []
+    for name, phases in results.items():
+        for phase, result in phases.items():
+            base = baseline.get(name, {}).get(phase)
+            if base is None:
+                continue
+            for metric, floor in (('time', MIN_TIME_DELTA), ('peak', MIN_PEAK_DELTA)):
+                value, ref = result[metric], base[metric]
+                if value > ref * threshold and value - ref > floor:
+                    regressions.append(
+                        f'{name} {phase} {metric}: {value:.6g} > '
+                        f'{threshold:g} x baseline {ref:.6g}'
+                    )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m test.benchmark',
+        description='Benchmark the register generator on synthetic register maps',
+    )
+    parser.add_argument(
+        '--maps',
+        nargs='+',
+        choices=list(MAPS),
+        default=list(MAPS),
+        help='Maps to run (default: all)',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3, help='Timed runs per phase (default: 3)'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=BASELINE_FILE,
+        help='Baseline JSON file (default: test/benchmark_baseline.json)',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f'Allowed ratio over the baseline (default: {DEFAULT_THRESHOLD:g})',
+    )
+    parser.add_argument(
+        '--update',
+        action='store_true',
+        help='Write the results to the baseline file instead of comparing',
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.maps, args.repeat, log=lambda name: print(f'Running {name}'))
+
+    print(f'{"map":<10} {"phase":<14} {"time (ms)":>12} {"peak (KiB)":>12}')
+    for name, phases in results.items():
+        for phase, result in phases.items():
+            print(
+                f'{name:<10} {phase:<14} {result["time"] * 1e3:>12.3f} '
+                f'{result["peak"] / 1024:>12.1f}'
+            )
+
+    if args.update:
+        baseline = dict(
+            python=platform.python_version(),
+            version=axi4lite_reg_generator.__version__,
+            results=results,
+        )
+        if os.path.exists(args.baseline):
+            # Keep results of maps that were not run
+            with open(args.baseline, 'r') as f:
+                baseline['results'] = {**json.load(f)['results'], **results}
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f'Baseline written to: {args.baseline}')
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION: {regression}')
+    if not regressions:
+        print('No regressions')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
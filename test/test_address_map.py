@@ -0,0 +1,113 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import random
+from axi4lite_reg_generator.address_map import (
+    RESERVED,
+    AddressAllocator,
+    Interval,
+    find_overlaps,
+)
+
+
+def test_find_overlaps():
+    """Verify overlapping intervals are found in one sorted sweep.
+
+    Tests:
+        1. Verifies disjoint and touching intervals do not overlap
+        2. Verifies an interval inside another is paired with the outer one
+        3. Matches a brute force check on random intervals
+    """
+    assert find_overlaps([(8, 12, 'b', 'register'), (0, 8, 'a', 'block')]) == []
+    outer = (0, 100, 'outer', 'block')
+    inner = (40, 44, 'inner', 'register')
+    after = (96, 120, 'after', 'block')
+    assert find_overlaps([after, inner, outer]) == [(outer, inner), (outer, after)]
+
+    rng = random.Random(0)
+    for _ in range(20):
+        intervals = []
+        for i in range(50):
+            start = rng.randrange(0, 4000, 4)
+            intervals.append((start, start + rng.choice((4, 4, 64)), str(i), 'x'))
+        overlapping = {
+            b
+            for a in intervals
+            for b in intervals
+            if a is not b and a[0] < b[1] and b[0] < a[1]
+        }
+        found = {i for pair in find_overlaps(intervals) for i in pair}
+        assert found == overlapping
+
+
+def test_automatic_placement():
+    """Verify registers and blocks are placed around reserved holes.
+
+    Tests:
+        1. Places registers up to a reserved hole and verifies the next one
+           skips it
+        2. Verifies an aligned block is moved to its alignment
+        3. Verifies explicit addresses are used as given, relative to the base
+    """
+    allocator = AddressAllocator(4)
+    allocator.reserve([dict(addr_offset=8, size=8), dict(addr_offset=12, size=8)])
+    assert [allocator.place_register(f'r{i}') for i in range(3)] == [0, 4, 20]
+
+    assert allocator.begin_block('blk', align=64) == 64
+    assert allocator.place_register('blk_r0') == 64
+    assert allocator.place_register('blk_r1', force=16, base=64) == 80
+    allocator.end_block()
+    assert allocator.place_register('r3') == 84
+    assert allocator.begin_block('blk2', force=100, align=8) == 100
+    allocator.end_block()
+
+    assert allocator.misaligned == [('blk2', 100, 8)]
+    assert allocator.overlaps() == []
+
+
+def test_overlaps():
+    """Verify overlaps between blocks, registers, and holes are reported.
+
+    Tests:
+        1. Places a register in a reserved hole and a block inside another block
+        2. Verifies each overlap is reported with its block range
+        3. Verifies registers at the same address are left to the duplicate check
+    """
+    allocator = AddressAllocator(4)
+    allocator.reserve([dict(addr_offset=0x100, size=0x10)])
+    allocator.place_register('in_hole', force=0x104)
+    allocator.place_register('dup', force=0x104)
+
+    allocator.begin_block('a')
+    for i in range(4):
+        allocator.place_register(f'a_{i}', force=16 * i, base=0x200)
+    allocator.end_block()
+    allocator.begin_block('b', force=0x204)
+    allocator.place_register('b_0')
+    allocator.end_block()
+
+    assert allocator.overlaps() == [
+        (
+            Interval(0x100, 0x110, RESERVED, 'reserved'),
+            Interval(0x104, 0x108, 'dup', 'register'),
+        ),
+        (
+            Interval(0x100, 0x110, RESERVED, 'reserved'),
+            Interval(0x104, 0x108, 'in_hole', 'register'),
+        ),
+        (Interval(0x200, 0x234, 'a', 'block'), Interval(0x204, 0x208, 'b', 'block')),
+    ]
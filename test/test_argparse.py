@@ -120,3 +120,49 @@ def test_custom_entity_name():
     assert re_search.group(1) == entity_name, (
         f'Markdown title should be {entity_name}, but is {re_search.group(1)}'
     )
+
+
+def test_parallel_jobs(capsys):
+    """
+    Test that rendering outputs in parallel gives the same files and messages as
+    rendering them one after another.
+    """
+    outputs = {}
+    for jobs in ('1', '4'):
+        out_file_base = os.path.join(test_dir, f'_test_parallel_jobs{jobs}')
+        sys.argv = ['', json_file_path, '-o', out_file_base, '--jobs', jobs]
+        main()
+
+        messages = capsys.readouterr().out.replace(out_file_base, '<output>')
+        contents = []
+        for ext in ('.vhd', '.v', '.sv', '.md'):
+            with open(out_file := out_file_base + ext, 'r') as f:
+                # Drop the timestamp line which differs between runs
+                contents.append(
+                    [line for line in f.read().split('\n') if ' at ' not in line]
+                )
+            os.remove(out_file)
+        outputs[jobs] = (messages, contents)
+
+    assert outputs['1'][0].splitlines() == [
+        'Writing VHDL to: <output>.vhd',
+        'Writing Verilog to: <output>.v',
+        'Writing SystemVerilog to: <output>.sv',
+        'Writing Documentation to: <output>.md',
+    ]
+    assert outputs['1'][0] == outputs['4'][0]
+    for serial, parallel in zip(outputs['1'][1], outputs['4'][1]):
+        # Entity names differ because they come from the output name
+        assert [line.replace('jobs1', 'jobs4') for line in serial[:-1]] == parallel[:-1]
+
+
+def test_bad_jobs():
+    """
+    Test that a job count below one is rejected.
+    """
+    sys.argv = ['', json_file_path, '-o', '_this_should_not_exist', '--jobs', '0']
+
+    with pytest.raises(SystemExit):
+        main()
+
+    assert not os.path.exists('_this_should_not_exist.vhd')
@@ -0,0 +1,128 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import json
+import os
+import shutil
+import sys
+import pytest
+from axi4lite_reg_generator import batch
+from axi4lite_reg_generator.validate import check_file
+
+test_dir = os.path.dirname(__file__)
+EXTENSIONS = ('.vhd', '.v', '.sv', '.md')
+
+
+def _setup(tmp_path) -> list:
+    for name in ('test_heir_top.json', 'test_json.json'):
+        shutil.copy(os.path.join(test_dir, name), tmp_path / name)
+    (tmp_path / 'bad.json').write_text('[{"name": "No_Bits"}]')
+    return [
+        dict(input='test_heir_top.json', output='out/top'),
+        dict(input='bad.json', output='out/bad'),
+        dict(input='test_json.json', output='out/leaf', entity_name='leaf_regs'),
+    ]
+
+
+def test_load_manifest(tmp_path):
+    """Verify JSON and TOML manifests are loaded.
+
+    Tests:
+        1. Loads a JSON list and a TOML "maps" table
+        2. Verifies paths are resolved against the manifest directory
+        3. Verifies the entity name defaults to the output base name
+        4. Verifies invalid manifests raise ValueError
+    """
+    (tmp_path / 'batch.json').write_text(json.dumps(_setup(tmp_path)))
+    items = batch.load_manifest(str(tmp_path / 'batch.json'))
+    assert items[0] == dict(
+        input=str(tmp_path / 'test_heir_top.json'),
+        output=str(tmp_path / 'out/top'),
+        entity_name='top',
+    )
+    assert items[2]['entity_name'] == 'leaf_regs'
+
+    if sys.version_info >= (3, 11):
+        (tmp_path / 'batch.toml').write_text(
+            '[[maps]]\ninput = "test_json.json"\noutput = "/abs/leaf"\n'
+        )
+        assert batch.load_manifest(str(tmp_path / 'batch.toml')) == [
+            dict(
+                input=str(tmp_path / 'test_json.json'),
+                output='/abs/leaf',
+                entity_name='leaf',
+            )
+        ]
+
+    for manifest in (
+        {'maps': 1},
+        [dict(input='a.json')],
+        [dict(input='a', output='b', x=1)],
+    ):
+        (tmp_path / 'bad_batch.json').write_text(json.dumps(manifest))
+        with pytest.raises(ValueError):
+            batch.load_manifest(str(tmp_path / 'bad_batch.json'))
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_run(tmp_path, jobs):
+    """Verify every map is generated and failures are reported per map.
+
+    Tests:
+        1. Runs a manifest with two valid maps and one invalid map
+        2. Verifies the valid maps are generated with valid hashes
+        3. Verifies the invalid map is reported without stopping the others
+    """
+    (tmp_path / 'batch.json').write_text(json.dumps(_setup(tmp_path)))
+    (tmp_path / 'out').mkdir()
+    items = batch.load_manifest(str(tmp_path / 'batch.json'))
+    results = batch.run(items, jobs=jobs)
+
+    assert [r['status'] for r in results] == ['ok', 'error', 'ok']
+    assert results[1]['error'].startswith('ValueError: ')
+    for name in ('top', 'leaf'):
+        for ext in EXTENSIONS:
+            assert check_file(str(tmp_path / 'out' / (name + ext)))['status'] == 'valid'
+    assert not any(f.startswith('bad') for f in os.listdir(tmp_path / 'out'))
+    with open(tmp_path / 'out' / 'leaf.vhd', 'r') as f:
+        assert 'entity leaf_regs is' in f.read()
+
+
+def test_main(tmp_path, capsys):
+    """Verify the command line summary and exit code.
+
+    Tests:
+        1. Runs the command with a text and a JSON summary
+        2. Verifies the exit code is non-zero when a map fails
+        3. Verifies a missing manifest is reported
+    """
+    (tmp_path / 'batch.json').write_text(json.dumps(_setup(tmp_path)))
+    (tmp_path / 'out').mkdir()
+    manifest = str(tmp_path / 'batch.json')
+
+    assert batch.main([manifest, '-j', '1']) == 1
+    out = capsys.readouterr().out
+    assert 'ERROR: ' + str(tmp_path / 'bad.json') in out
+    assert out.endswith('2 of 3 register maps generated\n')
+
+    assert batch.main([manifest, '-j', '1', '--json']) == 1
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['failed'] == 1
+    assert [m['status'] for m in summary['maps']] == ['ok', 'error', 'ok']
+
+    assert batch.main([str(tmp_path / 'missing.json')]) == 1
+    assert 'ERROR' in capsys.readouterr().err
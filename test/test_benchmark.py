@@ -0,0 +1,87 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import json
+from axi4lite_reg_generator import RegDef
+from test import benchmark
+
+
+def test_synthetic_maps(tmp_path):
+    """Verify every synthetic map is a valid register configuration.
+
+    Tests:
+        1. Writes each small map to a temporary directory
+        2. Verifies RegDef accepts it and has the expected number of registers
+    """
+    expected = dict(flat_10=10, flat_1k=1000, fields=1000, deep=32 * 16, wide=4096)
+    for name, num_regs in expected.items():
+        (directory := tmp_path / name).mkdir()
+        json_file = benchmark.MAPS[name](str(directory))
+        assert len(RegDef.from_json_file(json_file)._cfg) == num_regs
+
+
+def test_measure(tmp_path):
+    """Verify every phase is measured.
+
+    Tests:
+        1. Runs the benchmark on the small flat and hierarchy maps
+        2. Verifies a time and peak memory is reported for each phase
+    """
+    results = benchmark.run(['flat_10', 'deep'])
+    for phases in results.values():
+        assert tuple(phases) == benchmark.PHASES
+        for result in phases.values():
+            assert 0 < result['time'] < float('inf')
+            assert result['peak'] >= 0
+
+
+def test_compare():
+    """Verify regressions over the threshold are reported.
+
+    Tests:
+        1. Results within the threshold or the noise floor pass
+        2. Slower and larger phases are reported
+        3. Maps missing from the baseline are ignored
+    """
+    baseline = dict(flat_10=dict(vhdl=dict(time=0.1, peak=1 << 20)))
+    ok = dict(flat_10=dict(vhdl=dict(time=0.14, peak=1 << 20)))
+    noise = dict(flat_10=dict(vhdl=dict(time=0.1, peak=(1 << 20) * 2)))
+    noise['flat_10']['load'] = dict(time=1e-4, peak=0)
+    slow = dict(flat_10=dict(vhdl=dict(time=0.2, peak=(1 << 20) * 2)))
+    new = dict(deep=dict(vhdl=dict(time=100, peak=1 << 30)))
+
+    assert benchmark.compare(ok, baseline, 1.5) == []
+    assert benchmark.compare(new, baseline, 1.5) == []
+    assert len(benchmark.compare(noise, baseline, 1.5)) == 1
+    assert len(benchmark.compare(noise, baseline, 3)) == 0
+    regressions = benchmark.compare(slow, baseline, 1.5)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('flat_10 vhdl time')
+
+
+def test_baseline():
+    """Verify the stored baseline covers every map and phase.
+
+    Tests:
+        1. Loads the baseline JSON file
+        2. Verifies a measurement is stored for each map and phase
+    """
+    with open(benchmark.BASELINE_FILE, 'r') as f:
+        baseline = json.load(f)['results']
+    assert set(baseline) == set(benchmark.MAPS)
+    for phases in baseline.values():
+        assert tuple(phases) == benchmark.PHASES
@@ -0,0 +1,100 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import os
+import shutil
+import sys
+import pytest
+import axi4lite_reg_generator.build_cache as build_cache
+from axi4lite_reg_generator.__main__ import main
+
+test_dir = os.path.dirname(__file__)
+expected_extensions = ('.vhd', '.v', '.sv', '.md')
+
+
+@pytest.fixture
+def heir_files(tmp_path):
+    """Copy the hierarchy example and its included file to a temporary directory."""
+    for name in ('test_heir_top.json', 'test_json.json'):
+        shutil.copy(os.path.join(test_dir, name), tmp_path / name)
+    return tmp_path / 'test_heir_top.json', tmp_path / 'test_json.json'
+
+
+def test_find_includes(heir_files):
+    """Verify included files are found once each.
+
+    Tests:
+        1. Finds the files referenced by the hierarchy example
+        2. Verifies a file referenced several times is only listed once
+    """
+    top, sub = heir_files
+    assert build_cache.find_includes(str(top)) == [str(sub)]
+    assert build_cache.find_includes(str(sub)) == []
+
+
+def test_key_covers_inputs(heir_files):
+    """Verify the key changes when any input changes.
+
+    Tests:
+        1. Verifies the key is stable for unchanged inputs
+        2. Verifies the key changes with an included file, version, and options
+    """
+    top, sub = heir_files
+    key = build_cache.compute_key(str(top), '1.0.0')
+    assert build_cache.compute_key(str(top), '1.0.0') == key
+    assert build_cache.compute_key(str(top), '1.0.1') != key
+    assert build_cache.compute_key(str(top), '1.0.0', dict(entity_name='x')) != key
+
+    sub.write_text(sub.read_text().replace('Test_Register', 'New_Register'))
+    assert build_cache.compute_key(str(top), '1.0.0') != key
+
+
+def test_incremental_cli(heir_files, capsys):
+    """Verify the CLI skips generation when nothing changed.
+
+    Tests:
+        1. Generates outputs with --incremental
+        2. Verifies a second run is skipped and leaves the outputs untouched
+        3. Verifies changing an included file regenerates the outputs
+        4. Verifies deleting an output regenerates the outputs
+    """
+    top, sub = heir_files
+    out_file_base = str(top.parent / 'regs')
+    sys.argv = ['', str(top), '-o', out_file_base, '--incremental']
+
+    main()
+    assert 'Writing VHDL' in capsys.readouterr().out
+    mtimes = [os.stat(out_file_base + ext).st_mtime_ns for ext in expected_extensions]
+
+    main()
+    assert capsys.readouterr().out == f'Outputs are up to date: {out_file_base}\n'
+    assert mtimes == [
+        os.stat(out_file_base + ext).st_mtime_ns for ext in expected_extensions
+    ]
+
+    sub.write_text(sub.read_text().replace('Test_Register', 'New_Register'))
+    main()
+    assert 'Writing VHDL' in capsys.readouterr().out
+    with open(out_file_base + '.vhd', 'r') as f:
+        assert 'Heirarchy_One_New_Register' in f.read()
+
+    main()
+    assert 'up to date' in capsys.readouterr().out
+    os.remove(out_file_base + '.md')
+    main()
+    assert 'Writing VHDL' in capsys.readouterr().out
+    assert os.path.exists(out_file_base + '.md')
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import os
+import shutil
+import axi4lite_reg_generator
+from axi4lite_reg_generator.include_cache import IncludeCache
+
+test_dir = os.path.dirname(__file__)
+heir_file_path = os.path.join(test_dir, 'test_heir_top.json')
+
+
+def test_included_file_parsed_once():
+    """Verify a file included several times is only parsed once.
+
+    Tests:
+        1. Loads the hierarchy example which includes test_json.json three times
+        2. Verifies the file was parsed once and reused for the other instances
+        3. Verifies a second build reuses the cached file
+    """
+    cache = IncludeCache()
+    axi4lite_reg_generator.RegDef.from_json_file(heir_file_path, include_cache=cache)
+    assert (cache.misses, cache.hits, len(cache)) == (1, 2, 1)
+
+    axi4lite_reg_generator.RegDef.from_json_file(heir_file_path, include_cache=cache)
+    assert (cache.misses, cache.hits, len(cache)) == (1, 5, 1)
+
+
+def test_instances_are_independent():
+    """Verify instances of a cached file do not share register definitions.
+
+    Tests:
+        1. Loads the hierarchy example
+        2. Verifies each instance has its own name prefix and address
+        3. Verifies the cached configuration was not modified
+    """
+    cache = IncludeCache()
+    reg = axi4lite_reg_generator.RegDef.from_json_file(
+        heir_file_path, include_cache=cache
+    )
+
+    instances = reg._cfg.by_address(128) + reg._cfg.by_address(196)
+    assert [r['name'] for r in instances] == [
+        'Heirarchy_One_Test_Register',
+        'Heirarchy_Two_Test_Register',
+    ]
+    assert instances[0] is not instances[1]
+
+    cached = cache.load(os.path.join(test_dir, 'test_json.json'))
+    assert cached[1]['name'] == 'Test_Register'
+    assert 'addr_offset' not in cached[1]
+
+
+def test_modified_file_reloaded(tmp_path):
+    """Verify a cached file is reloaded after it changes.
+
+    Tests:
+        1. Loads the hierarchy example from a temporary directory
+        2. Renames a register in the included file
+        3. Verifies the next build picks up the new name
+    """
+    for name in ('test_heir_top.json', 'test_json.json'):
+        shutil.copy(os.path.join(test_dir, name), tmp_path / name)
+    cache = IncludeCache()
+    top = str(tmp_path / 'test_heir_top.json')
+
+    axi4lite_reg_generator.RegDef.from_json_file(top, include_cache=cache)
+
+    sub = tmp_path / 'test_json.json'
+    sub.write_text(sub.read_text().replace('Test_Register', 'New_Register'))
+    reg = axi4lite_reg_generator.RegDef.from_json_file(top, include_cache=cache)
+
+    assert cache.misses == 2
+    assert reg._cfg.by_name('Heirarchy_Three_New_Register')
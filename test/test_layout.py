@@ -0,0 +1,190 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import os
+import time
+import axi4lite_reg_generator
+import axi4lite_reg_generator.filters as filters
+import axi4lite_reg_generator.layout as layout
+
+test_dir = os.path.dirname(__file__)
+json_file_path = os.path.join(test_dir, 'test_json.json')
+heir_file_path = os.path.join(test_dir, 'test_heir_top.json')
+
+
+def make_regdef(num_regs, num_fields, data_size=32):
+    """Create a register definition of custom registers with one bit fields."""
+    regs = [
+        dict(
+            name=f'reg_{i}',
+            reg_type=('ro', 'rw', 'custom')[i % 3],
+            use_upd_pulse=i % 2 == 0,
+            bits=[
+                dict(field_name=f'field_{j}', num_bits=1, default_value=j % 2)
+                for j in range(num_fields)
+            ],
+        )
+        for i in range(num_regs)
+    ]
+    return axi4lite_reg_generator.RegDef(
+        [dict(config=dict(data_size=data_size)), *regs]
+    )
+
+
+def test_matches_filters():
+    """Verify precomputed values match the template filters they replace.
+
+    Tests:
+        1. Builds layouts for the example register files
+        2. Verifies widths, field positions, and reset literals match the filters
+    """
+    for json_file in (json_file_path, heir_file_path):
+        reg = axi4lite_reg_generator.RegDef.from_json_file(json_file)
+        data_size = reg._reg_cfg['data_size']
+        regs = layout.build(reg._cfg, data_size)['regs']
+        assert len(regs) == len(reg._cfg)
+
+        for info, cfg in zip(regs, reg._cfg):
+            assert info.name == cfg['name']
+            assert info.width == filters.count_bits(cfg['bits'])
+            assert info.padding == data_size - info.width
+            assert info.default_vhdl == filters.default_val(cfg)
+            assert info.default_verilog == filters.default_val_v(cfg)
+            for field in info.fields or ():
+                low = filters.get_offset(cfg['bits'], field.field_name)
+                assert (field.low, field.high) == (low, low + field.num_bits - 1)
+
+
+def test_field_positions():
+    """Verify field positions, including fields that share a name.
+
+    Tests:
+        1. Builds the layout of a register with a repeated field name
+        2. Verifies each field is placed like the get_offset filter places it
+    """
+    reg = axi4lite_reg_generator.RegDef(
+        [
+            dict(config=dict(data_size=32)),
+            dict(
+                name='reg',
+                bits=[
+                    dict(field_name='a', num_bits=3),
+                    dict(field_name='b', num_bits=4),
+                    dict(field_name='a', num_bits=1),
+                ],
+            ),
+        ]
+    )
+    info = layout.build(reg._cfg, 32)['regs'][0]
+    assert [(f.field_name, f.high, f.low) for f in info.fields] == [
+        ('a', 2, 0),
+        ('b', 4, 1),
+        ('a', 0, 0),
+    ]
+    assert info.width == 8
+    assert info.strobes == ((0, 7, 0),)
+
+
+def test_subsets():
+    """Verify the register subsets used by the templates.
+
+    Tests:
+        1. Builds layouts for registers of every type
+        2. Verifies each subset holds the matching registers in order
+    """
+    reg = make_regdef(12, 4)
+    context = layout.build(reg._cfg, 32)
+
+    def names(key):
+        return [r.name for r in context[key]]
+
+    assert names('regs') == [f'reg_{i}' for i in range(12)]
+    assert names('regs_in') == [f'reg_{i}' for i in range(12) if i % 3 != 1]
+    assert names('regs_out') == [f'reg_{i}' for i in range(12) if i % 3 != 0]
+    assert names('regs_rw') == [f'reg_{i}' for i in range(12) if i % 3 == 1]
+    assert names('regs_upd') == [
+        f'reg_{i}' for i in range(12) if i % 3 != 0 and i % 2 == 0
+    ]
+
+
+def test_render_scales_with_fields():
+    """Verify render time grows linearly with the number of fields.
+
+    Tests:
+        1. Renders registers with 64 fields and with 1024 fields, with the same
+           total number of fields
+        2. Verifies wide registers do not take much longer per field, which
+           they would if field positions were found with a quadratic search
+    """
+
+    def render_time(num_regs, num_fields):
+        reg = make_regdef(num_regs, num_fields, data_size=num_fields)
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            reg.to_md()
+            reg.to_vhdl()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    narrow = render_time(16, 64)
+    wide = render_time(1, 1024)
+
+    assert wide < 3 * narrow, (
+        f'Render time is not linear in fields (64: {narrow:.4f}s, 1024: {wide:.4f}s)'
+    )
+
+
+def test_read_mux_tree():
+    """Verify the read mux tree levels and pipeline stage placement.
+
+    Tests:
+        1. Builds trees for the example register files
+        2. Verifies each level selects on two address bits and every register
+           is an input of exactly one node at the first level
+        3. Verifies pipeline stages are spread between the levels and capped at
+           one stage between each pair of levels
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(heir_file_path)
+    regs = layout.build(reg._cfg, 32)['regs']
+    tree = layout.ReadMuxTree(regs, 32, 0)
+    assert tree.low == 2
+    assert tree.width == 10
+    assert [len(nodes) for nodes in tree.levels] == [6, 6, 3, 1]
+    assert tree.root is tree.levels[-1][0]
+    inputs = [
+        (node.key << node.bits | sel) << node.low
+        for node in tree.levels[0]
+        for sel, _ in node.inputs
+    ]
+    assert sorted(inputs) == sorted(r.addr_offset for r in regs)
+    assert all(node.bits == 2 for nodes in tree.levels for node in nodes)
+    assert tree.registered == []
+
+    def placement(stages):
+        tree = layout.ReadMuxTree(regs, 32, stages)
+        registered = [nodes[0].registered for nodes in tree.levels]
+        return tree.stages, registered, [nodes[0].stage for nodes in tree.levels]
+
+    assert placement(1) == (1, [False, True, False, False], [0, 0, 1, 1])
+    assert placement(2) == (2, [True, False, True, False], [0, 1, 1, 2])
+    assert placement(3) == (3, [True, True, True, False], [0, 1, 2, 3])
+    assert placement(5) == placement(3)
+
+    tree = layout.ReadMuxTree([], 32, 2)
+    assert tree.stages == 0
+    assert tree.root.inputs == ()
@@ -0,0 +1,123 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import os
+import pickle
+import sys
+import pstats
+from axi4lite_reg_generator import RegDef
+from axi4lite_reg_generator.__main__ import main
+from axi4lite_reg_generator.phases import PhaseEvent, Timings
+
+test_dir = os.path.dirname(__file__)
+heir_file_path = os.path.join(test_dir, 'test_heir_top.json')
+
+
+def test_phase_events(tmp_path):
+    """Verify phase events are reported for loading and rendering.
+
+    Tests:
+        1. Loads the hierarchy example and renders every target to files
+        2. Verifies every start event has a matching end event
+        3. Verifies register counts and bytes written are reported
+    """
+    events = []
+    reg = RegDef.from_json_file(heir_file_path, on_phase=events.append)
+    files = {target: tmp_path / target for target in ('vhdl', 'md')}
+    reg.render_all_to_files(files)
+
+    stack = []
+    for event in events:
+        if event.end:
+            start = stack.pop()
+            assert (start.phase, start.target) == (event.phase, event.target)
+            assert start.time <= event.time
+        else:
+            stack.append(event)
+    assert stack == []
+
+    ends = {(e.phase, e.target): e for e in events if e.end}
+    assert [e.phase for e in events if e.end and e.phase != 'include'][:5] == [
+        'load',
+        'validate',
+        'flatten',
+        'checks',
+        'layout',
+    ]
+    assert ends['load', None].bytes == os.path.getsize(heir_file_path)
+    assert ends['include', 'test_json.json'].registers == 3
+    assert ends['flatten', None].registers == len(reg._cfg)
+    for target, file in files.items():
+        assert ends['render', target].bytes == os.path.getsize(file)
+        assert ends['render', target].registers == len(reg._cfg)
+
+    # The callback is not sent to other processes
+    assert pickle.loads(pickle.dumps(reg)).on_phase is None
+
+
+def test_timings():
+    """Verify timings are totalled with nested phases excluded.
+
+    Tests:
+        1. Sends a render phase with two nested write phases
+        2. Verifies the render time excludes the writes and the bytes are summed
+        3. Verifies the report lists each phase
+    """
+    timings = Timings()
+    for event in (
+        PhaseEvent('render', False, 0.0, 'vhdl'),
+        PhaseEvent('write', False, 1.0, 'vhdl'),
+        PhaseEvent('write', True, 1.5, 'vhdl', bytes=100),
+        PhaseEvent('write', False, 2.0, 'vhdl'),
+        PhaseEvent('write', True, 3.0, 'vhdl', bytes=20),
+        PhaseEvent('render', True, 4.0, 'vhdl', registers=10, bytes=120),
+    ):
+        timings(event)
+
+    assert timings.totals == {
+        ('render', 'vhdl'): dict(time=2.5, count=1, registers=10, bytes=120),
+        ('write', 'vhdl'): dict(time=1.5, count=2, registers=None, bytes=120),
+    }
+    report = timings.report().splitlines()
+    assert report[1].split() == ['render', 'vhdl', '2500.0', '1', '10', '120']
+    assert report[-1].split() == ['total', '4000.0']
+
+
+def test_cli_timings_and_profile(tmp_path, capsys):
+    """Verify the --timings and --profile command line options.
+
+    Tests:
+        1. Generates the hierarchy example with --timings and --profile
+        2. Verifies the timing table is printed
+        3. Verifies the profile can be loaded
+    """
+    profile = str(tmp_path / 'out.prof')
+    sys.argv = [
+        '',
+        heir_file_path,
+        '-o',
+        str(tmp_path / 'out'),
+        '--timings',
+        '--profile',
+        profile,
+    ]
+    main()
+
+    out = capsys.readouterr().out
+    for phase in ('load', 'flatten', 'render', 'write', 'total'):
+        assert f'\n{phase} ' in out
+    assert pstats.Stats(profile).total_calls > 0
@@ -15,7 +15,10 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
+import copy
+import io
 import os
+import tracemalloc
 import axi4lite_reg_generator
 import json
 import pytest
@@ -197,6 +200,86 @@ def test_duplicate_name_detection():
     )
 
 
+def test_all_conflicts_reported():
+    """Test that every conflict is reported in a single error.
+
+    Tests:
+        1. Adds registers with two duplicate addresses, a duplicate name, and too
+           many bits
+        2. Verifies a single ValueError lists every conflict
+
+    Raises:
+        AssertionError: If any conflict is missing from the error
+    """
+    with open(json_file_path, 'r') as f:
+        cfg = json.load(f)
+    cfg.append(dict(name='dup_addr0', addr_offset=4, bits=32))
+    cfg.append(dict(name='dup_addr1', addr_offset=64, bits=32))
+    cfg.append(dict(name='Scratch_Register', addr_offset=8, bits=32))
+    cfg.append(dict(name='too_long', addr_offset=12, bits=33))
+
+    with pytest.raises(ValueError) as e_info:
+        axi4lite_reg_generator.RegDef(cfg)
+
+    assert str(e_info.value).split('\n') == [
+        'Multiple registers have the same address (addresses: [4, 64])',
+        "Multiple registers have the same name (names: ['Scratch_Register'])",
+        'Register contains too many bits (name: too_long, bits: 33 > 32)',
+    ]
+
+
+def test_address_ranges(tmp_path):
+    """Test reserved holes, block alignment, and address range checks.
+
+    Tests:
+        1. Verifies automatic addresses skip reserved holes and aligned blocks
+           are moved to their alignment
+        2. Verifies a block placed inside another block's range is reported
+           even though no addresses are equal
+        3. Verifies misaligned registers and blocks, registers outside the
+           address aperture, and registers in reserved holes are reported
+
+    Raises:
+        AssertionError: If addresses or errors are not as expected
+    """
+    block = [dict(name='Reg_0', bits=32), dict(name='Reg_1', addr_offset=16, bits=32)]
+    with open(tmp_path / 'block.json', 'w') as f:
+        json.dump(block, f)
+
+    config = dict(config=dict(data_size=32, reserved=[dict(addr_offset=4, size=8)]))
+    cfg = [
+        config,
+        dict(name='Reg_A', bits=32),
+        dict(name='Reg_B', bits=32),
+        dict(name='Blk', file='block.json', addr_align=64),
+    ]
+    regs = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg), str(tmp_path))
+    assert [(r['name'], r['addr_offset']) for r in regs._cfg] == [
+        ('Reg_A', 0),
+        ('Reg_B', 12),
+        ('Blk_Reg_0', 64),
+        ('Blk_Reg_1', 80),
+    ]
+
+    config['config']['address_aperture'] = 7
+    cfg += [
+        dict(name='Inside', file='block.json', addr_offset=68),
+        dict(name='Aligned', file='block.json', addr_offset=132, addr_align=8),
+        dict(name='Reg_C', bits=32, addr_offset=6),
+    ]
+    with pytest.raises(ValueError) as e_info:
+        axi4lite_reg_generator.RegDef(copy.deepcopy(cfg), str(tmp_path))
+
+    assert str(e_info.value).split('\n') == [
+        "Register addresses are not aligned to the data size (names: ['Reg_C'])",
+        'Block addresses are not aligned (blocks: Aligned at 132 not aligned to 8)',
+        'Register addresses are outside the 7 bit address aperture '
+        "(names: ['Aligned_Reg_0', 'Aligned_Reg_1'])",
+        'Address ranges overlap (<reserved> 4-11 and Reg_C 6-9, '
+        'Blk 64-83 and Inside 68-87)',
+    ]
+
+
 def test_address_too_large():
     """Test detection of registers exceeding maximum bit width.
 
@@ -409,6 +492,75 @@ def test_missing_config():
     assert str(e_info.value) == r'Could not find configuration'
 
 
+@pytest.mark.parametrize('method', ['to_vhdl', 'to_verilog', 'to_systemverilog'])
+def test_interface_options(method):
+    """Test the bus interface options of the HDL outputs.
+
+    Tests:
+        1. Verifies the basic mode is the default and its output is unchanged
+        2. Verifies independent write channels replace the write state machine
+        3. Verifies the full mode replaces both handshake state machines
+        4. Verifies a read pipeline is only added above the default read latency
+        5. Verifies a read mux tree spends the extra read latency between its
+           levels
+        6. Verifies the one-hot write decode replaces the address comparisons
+           in the write process
+        7. Verifies ordered write channels are rejected in the full mode
+
+    Raises:
+        AssertionError: If the output does not match the interface options
+    """
+    with open(json_file_path, 'r') as f:
+        cfg = json.load(f)
+    default = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg))
+    outputs = {}
+    for name, options in (
+        ('basic', dict(throughput='basic', write_channels='ordered', read_latency=2)),
+        ('independent', dict(write_channels='independent')),
+        ('full', dict(throughput='full')),
+        ('basic_latency', dict(read_latency=4)),
+        ('full_latency', dict(throughput='full', read_latency=3)),
+        ('flat', dict(read_mux='flat')),
+        ('tree', dict(read_mux='tree')),
+        ('tree_latency', dict(throughput='full', read_mux='tree', read_latency=4)),
+        ('priority', dict(write_decode='priority')),
+        ('onehot', dict(write_decode='onehot')),
+        ('full_onehot', dict(throughput='full', write_decode='onehot')),
+    ):
+        cfg[0]['config'] = dict(data_size=32, **options)
+        regs = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg))
+        regs.id_timestamp = default.id_timestamp
+        outputs[name] = getattr(regs, method)()
+
+    assert outputs['basic'] == getattr(default, method)()
+    assert 'state_w' in outputs['basic'] and 'state_r' in outputs['basic']
+    assert 'state_w' not in outputs['independent']
+    assert 'state_r' in outputs['independent']
+    assert 'wr_en' in outputs['independent']
+    assert 'state_w' not in outputs['full'] and 'state_r' not in outputs['full']
+    assert 'rd_en' in outputs['full']
+    assert 'rd_valid' not in outputs['basic'] and 'rd_valid' not in outputs['full']
+    assert 'rd_valid' in outputs['basic_latency']
+    assert 'rd_data_2' in outputs['basic_latency']
+    assert 'rd_valid' in outputs['full_latency']
+    assert 'rd_data_1' in outputs['full_latency']
+    assert 'rd_data_2' not in outputs['full_latency']
+    assert outputs['flat'] == outputs['basic']
+    assert 'rd_mux_2_0' in outputs['tree'] and 'rd_tree_addr_1' not in outputs['tree']
+    assert 'rd_tree_addr_2' in outputs['tree_latency']
+    assert 'rd_mux_1_0_q' in outputs['tree_latency']
+    assert 'rd_data_1' not in outputs['tree_latency']
+    assert outputs['priority'] == outputs['basic']
+    assert 'wr_sel' not in outputs['basic']
+    assert 'wr_sel_q' in outputs['onehot'] and 'aw_held' not in outputs['onehot']
+    assert 'wr_sel(1)' in outputs['onehot'] or 'wr_sel[1]' in outputs['onehot']
+    assert 'wr_sel_in' in outputs['full_onehot'] and 'aw_held' in outputs['full_onehot']
+
+    cfg[0]['config'] = dict(data_size=32, throughput='full', write_channels='ordered')
+    with pytest.raises(ValueError, match='Write channels are always independent'):
+        axi4lite_reg_generator.RegDef(cfg)
+
+
 def test_custom_entity_name():
     """Test custom entity name
 
@@ -442,3 +594,191 @@ def test_custom_entity_name():
     assert re_search.group(1) == test_override_entity_name, (
         f'Markdown title should be {test_override_entity_name}, but is {re_search.group(1)}'
     )
+
+
+@pytest.mark.parametrize(
+    'target, method',
+    [
+        ('vhdl', 'to_vhdl'),
+        ('verilog', 'to_verilog'),
+        ('systemverilog', 'to_systemverilog'),
+        ('md', 'to_md'),
+    ],
+)
+def test_render_to_file(target, method, tmp_path):
+    """Test streaming output to a file.
+
+    Tests:
+        1. Streams each target to a path and to a binary file object
+        2. Verifies the output is byte-identical to the matching to_* method
+        3. Verifies the returned hash matches the trailer
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    expected = getattr(reg, method)().encode()
+
+    hash = reg.render_to_file(target, tmp_path / 'out')
+    assert (tmp_path / 'out').read_bytes() == expected
+    assert expected.rsplit(b'\n', 1)[1].decode().find(hash) > 0
+
+    f = io.BytesIO()
+    assert reg.render_to_file(target, f) == hash
+    assert f.getvalue() == expected
+
+
+def test_render_to_file_memory():
+    """Test that streaming output does not hold the whole output in memory.
+
+    Tests:
+        1. Measures peak memory while generating VHDL for 1000 registers as a string
+        2. Measures peak memory while streaming the same VHDL to a file
+        3. Verifies streaming uses a small fraction of the memory
+    """
+    cfg = [dict(config=dict(data_size=32))]
+    cfg.extend(dict(name=f'reg_{i}', reg_type='rw', bits=32) for i in range(1000))
+    reg = axi4lite_reg_generator.RegDef(cfg)
+    reg.to_vhdl()
+
+    tracemalloc.start()
+    try:
+        reg.to_vhdl()
+        string_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        with open(os.devnull, 'wb') as f:
+            reg.render_to_file('vhdl', f)
+        stream_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert stream_peak * 5 < string_peak
+
+
+def test_render_all(tmp_path):
+    """Test rendering several targets from one shared context.
+
+    Tests:
+        1. Renders every target as strings and to files
+        2. Verifies each output and hash matches the single target methods
+        3. Verifies the template context is built once per call
+        4. Verifies an unknown target raises KeyError before rendering
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    methods = dict(
+        vhdl=reg.to_vhdl,
+        verilog=reg.to_verilog,
+        systemverilog=reg.to_systemverilog,
+        md=reg.to_md,
+    )
+
+    calls = []
+    build_context = reg._template_context
+    reg._template_context = lambda: calls.append(None) or build_context()
+
+    rendered = reg.render_all()
+    assert len(calls) == 1
+    assert list(rendered) == list(methods)
+    for target, (code, hash) in rendered.items():
+        assert code == methods[target]()
+        assert code.endswith(f'{hash} -->' if target == 'md' else hash)
+
+    assert list(reg.render_all(['md'])) == ['md']
+
+    calls.clear()
+    files = {target: tmp_path / target for target in ('md', 'vhdl')}
+    hashes = reg.render_all_to_files(files)
+    assert len(calls) == 1
+    for target, file in files.items():
+        assert file.read_text() == rendered[target][0]
+        assert hashes[target] == rendered[target][1]
+
+    with pytest.raises(KeyError):
+        reg.render_all(['vhdl', 'c'])
+    with pytest.raises(KeyError):
+        reg.render_all_to_files({'c': tmp_path / 'c'})
+    assert len(calls) == 1
+
+
+def test_reproducible(monkeypatch):
+    """Test reproducible output.
+
+    Tests:
+        1. Verifies reproducible output leaves out the username, hostname, and time
+           and includes a hash of the register map
+        2. Verifies SOURCE_DATE_EPOCH enables reproducible output with its time
+        3. Verifies the register map hash ignores key order and header options
+           but changes with the registers
+        4. Verifies an invalid SOURCE_DATE_EPOCH raises ValueError
+    """
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    with open(json_file_path, 'r') as f:
+        cfg = json.load(f)
+
+    default = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg))
+    assert default.id_input_hash == ''
+    assert 'register map SHA-256' not in default.to_vhdl()
+
+    reg = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg), reproducible=True)
+    for target, (code, _) in reg.render_all().items():
+        assert f'register map SHA-256: {reg.id_input_hash}' in code
+        assert reg.id_timestamp not in code
+        assert f'@{reg.id_hostname}' not in code
+    assert (
+        reg.render_all()
+        == axi4lite_reg_generator.RegDef(
+            copy.deepcopy(cfg), reproducible=True
+        ).render_all()
+    )
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+    epoch = axi4lite_reg_generator.RegDef(copy.deepcopy(cfg))
+    assert epoch.reproducible
+    assert ' at 2023-11-14 22:13:20 UTC' in epoch.to_vhdl()
+    assert epoch.id_input_hash == reg.id_input_hash
+    assert not axi4lite_reg_generator.RegDef(
+        copy.deepcopy(cfg), reproducible=False
+    ).reproducible
+
+    reordered = [dict(reversed(list(item.items()))) for item in cfg]
+    assert axi4lite_reg_generator.RegDef(reordered).id_input_hash == reg.id_input_hash
+    changed = copy.deepcopy(cfg)
+    changed[1]['name'] = 'Renamed_Register'
+    assert axi4lite_reg_generator.RegDef(changed).id_input_hash != reg.id_input_hash
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', 'yesterday')
+    with pytest.raises(ValueError):
+        axi4lite_reg_generator.RegDef(copy.deepcopy(cfg))
+
+
+def test_write_file(tmp_path):
+    """Test that unchanged outputs are not rewritten.
+
+    Tests:
+        1. Verifies a second identical render leaves the file and its modification
+           time untouched
+        2. Verifies a changed output replaces the file and keeps its mode
+        3. Verifies a failed write leaves the existing file and no temporary files
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(
+        json_file_path, reproducible=True
+    )
+    file = tmp_path / 'out.vhd'
+    hash = reg.render_to_file('vhdl', file)
+    os.utime(file, ns=(1, 1))
+    assert reg.render_to_file('vhdl', file) == hash
+    assert os.stat(file).st_mtime_ns == 1
+
+    os.chmod(file, 0o600)
+    written = axi4lite_reg_generator.regdef.write_file(
+        file, lambda f: f.write(b'new') and 'other'
+    )
+    assert written == ('other', True)
+    assert file.read_bytes() == b'new'
+    assert os.stat(file).st_mode & 0o777 == 0o600
+
+    def fail(f):
+        f.write(b'partial')
+        raise RuntimeError('render failed')
+
+    with pytest.raises(RuntimeError):
+        axi4lite_reg_generator.regdef.write_file(file, fail)
+    assert file.read_bytes() == b'new'
+    assert os.listdir(tmp_path) == ['out.vhd']
@@ -0,0 +1,135 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import gc
+import os
+import pickle
+import tracemalloc
+import pytest
+import axi4lite_reg_generator
+from axi4lite_reg_generator.register import Bits, Field, Register
+from axi4lite_reg_generator.schema import validate as validate_schema
+
+test_dir = os.path.dirname(__file__)
+json_file_path = os.path.join(test_dir, 'test_json.json')
+
+
+def make_regs(num_regs, num_fields=0):
+    """Create validated register dictionaries with optional bit fields."""
+    regs = []
+    for i in range(num_regs):
+        bits = 32
+        if num_fields:
+            bits = [
+                dict(field_name=f'field_{j}', num_bits=32 // num_fields)
+                for j in range(num_fields)
+            ]
+        regs.append(dict(name=f'reg_{i}', description=f'Register {i}', bits=bits))
+    return validate_schema(regs)
+
+
+def test_mapping_view():
+    """Verify registers behave like the validated dictionaries they replace.
+
+    Tests:
+        1. Creates registers with each form of bits
+        2. Verifies keys, values, and missing optional keys match the dictionary
+        3. Verifies unknown keys are rejected
+    """
+    cfg = validate_schema(
+        [
+            dict(name='a', bits=8),
+            dict(name='b', description='B', bits=dict(num_bits=4, default_value=3)),
+            dict(name='c', bits=[dict(field_name='f', num_bits=2)]),
+        ]
+    )
+    for addr, item in enumerate(cfg):
+        reg = Register.from_dict(item, addr_offset=4 * addr)
+        expected = dict(item, addr_offset=4 * addr)
+        assert reg.to_dict() == expected
+        assert dict(reg) == dict(expected, bits=reg['bits'])
+        assert 'instance' not in reg
+        with pytest.raises(KeyError):
+            reg['instance']
+        with pytest.raises(KeyError):
+            reg['to_dict']
+
+    reg = Register.from_dict(cfg[2], addr_offset=0)
+    assert isinstance(reg['bits'], tuple)
+    assert reg['bits'][0] == Field('f', 2)
+    assert reg['bits'][0]['description'] == ''
+    assert Register.from_dict(cfg[1], addr_offset=0)['bits'] == Bits(4, 3)
+
+    with pytest.raises(AttributeError):
+        Register.from_dict(dict(cfg[0], unknown=1))
+
+
+def test_pickle():
+    """Verify registers survive pickling for parallel rendering.
+
+    Tests:
+        1. Pickles a register definition with every form of bits
+        2. Verifies the registers and generated output are unchanged
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    copy = pickle.loads(pickle.dumps(reg))
+    assert copy._cfg == reg._cfg
+    assert copy.to_md() == reg.to_md()
+
+
+def test_memory_reduction():
+    """Verify compact registers use a fraction of the memory of dictionaries.
+
+    Tests:
+        1. Measures registers stored as copies of the validated dictionaries
+        2. Measures the same registers stored as compact records
+        3. Verifies the records use less than half the memory, with and without
+           bit fields
+    """
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            regs = build()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del regs
+        return size
+
+    for num_fields in (0, 16):
+        cfg = make_regs(2000, num_fields)
+        plain = measure(
+            lambda: [
+                dict(
+                    item,
+                    addr_offset=4 * i,
+                    bits=(
+                        [dict(f) for f in item['bits']] if num_fields else item['bits']
+                    ),
+                )
+                for i, item in enumerate(cfg)
+            ]
+        )
+        compact = measure(
+            lambda: [
+                Register.from_dict(item, addr_offset=4 * i)
+                for i, item in enumerate(cfg)
+            ]
+        )
+        assert compact * 2 < plain, (num_fields, compact, plain)
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import gc
+import time
+from axi4lite_reg_generator.regmap import RegMap
+
+
+def make_regs(num_regs, data_size=32):
+    """Create a flattened register list with unique names and addresses."""
+    return [
+        dict(name=f'reg_{i}', addr_offset=i * data_size // 8, bits=data_size)
+        for i in range(num_regs)
+    ]
+
+
+def test_indexes():
+    """Verify registers can be found by name and by address.
+
+    Tests:
+        1. Looks up registers by name and address
+        2. Verifies missing names and addresses return no registers
+        3. Verifies insertion order is preserved
+    """
+    regs = make_regs(10)
+    reg_map = RegMap(regs)
+
+    assert len(reg_map) == 10
+    assert list(reg_map) == regs
+    assert reg_map == regs
+    assert reg_map[3] is regs[3]
+    assert reg_map.by_name('reg_3') == [regs[3]]
+    assert reg_map.by_address(12) == [regs[3]]
+    assert reg_map.by_name('missing') == []
+    assert reg_map.by_address(2) == []
+
+
+def test_all_duplicates_reported():
+    """Verify every duplicate name and address is reported at once.
+
+    Tests:
+        1. Adds several registers that collide by name or address
+        2. Verifies each conflict is reported with all of its registers
+    """
+    reg_map = RegMap(make_regs(10))
+    reg_map.append(dict(name='reg_1', addr_offset=100, bits=32))
+    reg_map.append(dict(name='reg_5', addr_offset=104, bits=32))
+    reg_map.append(dict(name='dup_addr0', addr_offset=8, bits=32))
+    reg_map.append(dict(name='dup_addr1', addr_offset=8, bits=32))
+    reg_map.append(dict(name='dup_addr2', addr_offset=36, bits=32))
+
+    names = reg_map.duplicate_names()
+    assert list(names) == ['reg_1', 'reg_5']
+    assert [len(v) for v in names.values()] == [2, 2]
+
+    addresses = reg_map.duplicate_addresses()
+    assert list(addresses) == [8, 36]
+    assert [r['name'] for r in addresses[8]] == ['reg_2', 'dup_addr0', 'dup_addr1']
+
+
+def test_duplicate_order():
+    """Verify duplicates are reported in the order they first appear.
+
+    Tests:
+        1. Adds a duplicate of a later register before one of an earlier register
+        2. Verifies duplicates are ordered by the first register with each key
+        3. Verifies the same register added twice is reported
+    """
+    reg_map = RegMap(make_regs(4))
+    reg_map.append(dict(name='reg_3', addr_offset=100, bits=32))
+    reg_map.append(dict(name='reg_0', addr_offset=104, bits=32))
+    reg_map.append(reg_map[1])
+
+    assert list(reg_map.duplicate_names()) == ['reg_0', 'reg_1', 'reg_3']
+    assert list(reg_map.duplicate_addresses()) == [4]
+    assert reg_map.by_name('reg_1') == [reg_map[1], reg_map[1]]
+    assert reg_map.by_name('reg_2') == [reg_map[2]]
+
+
+def test_duplicate_checks_scale_linearly():
+    """Verify duplicate checks scale linearly up to 100k registers.
+
+    Tests:
+        1. Times indexing and both duplicate checks for 10k and 100k registers
+        2. Verifies 10x the registers takes well under the 100x expected from a
+           quadratic check
+
+    Garbage collection is paused while timing since collections over many small
+    objects add noise that grows faster than the checks themselves.
+    """
+
+    def check_time(num_regs):
+        regs = make_regs(num_regs)
+        best = float('inf')
+        for _ in range(3):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                reg_map = RegMap(regs)
+                assert not reg_map.duplicate_names()
+                assert not reg_map.duplicate_addresses()
+                best = min(best, time.perf_counter() - start)
+            finally:
+                gc.enable()
+        return best
+
+    small = check_time(10_000)
+    large = check_time(100_000)
+
+    assert large < 40 * small, (
+        f'Duplicate checks do not scale linearly (10k: {small:.4f}s, 100k: {large:.4f}s)'
+    )
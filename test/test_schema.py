@@ -0,0 +1,191 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import copy
+import json
+import os
+import time
+import pytest
+import schema
+from axi4lite_reg_generator.schema import SCHEMA, validate
+
+test_dir = os.path.dirname(__file__)
+example_dir = os.path.join(test_dir, os.pardir, 'example', 'inputs')
+json_files = [
+    os.path.join(test_dir, 'test_json.json'),
+    os.path.join(test_dir, 'test_heir_top.json'),
+    os.path.join(example_dir, 'example.json'),
+]
+
+# Items that the schema rejects, covering each kind of item and key
+invalid_items = [
+    1,
+    'register',
+    dict(config=dict(data_size=12)),
+    dict(config=dict(data_size=True)),
+    dict(config=dict(data_size=32, entity_name=1)),
+    dict(config=dict(data_size=32, include_username=1)),
+    dict(config=dict(data_size=32, extra=1)),
+    dict(config=dict(data_size=32), name='x'),
+    dict(config=32),
+    dict(name='x'),
+    dict(name=1, bits=32),
+    dict(name='x', bits=0),
+    dict(name='x', bits=True),
+    dict(name='x', bits=1.0),
+    dict(name='x', bits=32, reg_type='wo'),
+    dict(name='x', bits=32, use_upd_pulse=1),
+    dict(name='x', bits=32, addr_offset='0x4'),
+    dict(name='x', bits=32, addr_offset=False),
+    dict(name='x', bits=32, description=None),
+    dict(name='x', bits=32, extra=1),
+    dict(name='x', bits=dict(default_value=1)),
+    dict(name='x', bits=dict(num_bits=4, default_value='hello')),
+    dict(name='x', bits=dict(num_bits=4, default_value=(1,))),
+    dict(name='x', bits=dict(num_bits=4, description='')),
+    dict(name='x', bits=[dict(num_bits=4)]),
+    dict(name='x', bits=[dict(field_name='a', num_bits=0)]),
+    dict(name='x', bits=[dict(field_name='a', num_bits=4, default_value=1.5)]),
+    dict(name='x', bits=[4]),
+    dict(name='x', bits=32, file='a.json'),
+    dict(name='x', file=1),
+    dict(name='x', file='a.json', addr_offset='4'),
+    dict(name='x', file='a.json', addr_align=0),
+    dict(config=dict(data_size=32, address_aperture=0)),
+    dict(config=dict(data_size=32, reserved=dict(addr_offset=0, size=4))),
+    dict(config=dict(data_size=32, reserved=[dict(addr_offset=0)])),
+    dict(config=dict(data_size=32, reserved=[dict(addr_offset='0', size=4)])),
+    dict(config=dict(data_size=32, reserved=[dict(addr_offset=0, size=0)])),
+    dict(config=dict(data_size=32, reserved=[4])),
+    dict(config=dict(data_size=32, throughput='fast')),
+    dict(config=dict(data_size=32, throughput=1)),
+    dict(config=dict(data_size=32, write_channels='any')),
+    dict(config=dict(data_size=32, read_latency=0)),
+    dict(config=dict(data_size=32, read_latency=True)),
+    dict(config=dict(data_size=32, read_mux='any')),
+    dict(config=dict(data_size=32, write_decode='parallel')),
+]
+
+
+@pytest.mark.parametrize('json_file', json_files)
+def test_matches_schema(json_file):
+    """Verify the fast validator gives the same result as SCHEMA.
+
+    Tests:
+        1. Validates each example JSON file with both validators
+        2. Verifies defaults and converted values match
+        3. Verifies the input is not modified
+    """
+    with open(json_file, 'r') as f:
+        cfg = json.load(f)
+    original = copy.deepcopy(cfg)
+
+    assert validate(cfg) == SCHEMA.validate(copy.deepcopy(cfg))
+    assert cfg == original
+
+
+@pytest.mark.parametrize('item', invalid_items)
+def test_rejects_like_schema(item):
+    """Verify the fast validator rejects the same items as SCHEMA.
+
+    Tests:
+        1. Verifies SCHEMA rejects the item
+        2. Verifies the fast validator raises SchemaError for the item
+    """
+    with pytest.raises(schema.SchemaError):
+        SCHEMA.validate([copy.deepcopy(item)])
+    with pytest.raises(schema.SchemaError):
+        validate([item])
+
+
+def test_rejects_non_list():
+    """Verify a configuration that is not a list is rejected."""
+    with pytest.raises(schema.SchemaError):
+        validate(dict(name='x', bits=32))
+
+
+def test_coercion():
+    """Verify default values are converted like SCHEMA.
+
+    Tests:
+        1. Verifies hex and binary strings are converted to integers
+        2. Verifies missing optional keys get their defaults
+    """
+    cfg = [
+        dict(
+            config=dict(
+                data_size=32,
+                address_aperture=12,
+                reserved=[dict(addr_offset=16, size=32)],
+                throughput='full',
+                write_channels='independent',
+                read_latency=3,
+                read_mux='tree',
+                write_decode='onehot',
+            )
+        ),
+        dict(name='blk', file='a.json', addr_align=256),
+        dict(name='a', bits=dict(num_bits=8, default_value='0xff')),
+        dict(name='b', bits=[dict(field_name='f', num_bits=4, default_value='0b11')]),
+    ]
+    result = validate(cfg)
+
+    assert result == SCHEMA.validate(copy.deepcopy(cfg))
+    assert result[0]['config']['instance_separator'] == '_'
+    assert result[0]['config']['reserved'] == [dict(addr_offset=16, size=32)]
+    assert result[2]['bits']['default_value'] == 255
+    assert result[2]['reg_type'] == 'ro'
+    assert result[3]['bits'][0] == dict(
+        field_name='f', num_bits=4, default_value=3, description=''
+    )
+
+
+def test_validator_speedup():
+    """Benchmark the fast validator against SCHEMA on a large map.
+
+    Tests:
+        1. Validates a map of 5k registers with fields using both validators
+        2. Verifies the results match
+        3. Verifies the fast validator is at least 5x faster
+    """
+    cfg = [dict(config=dict(data_size=32))]
+    for i in range(5000):
+        cfg.append(
+            dict(
+                name=f'reg_{i}',
+                reg_type='rw',
+                bits=[
+                    dict(field_name='a', num_bits=4, default_value='0x3'),
+                    dict(field_name='b', num_bits=8, description='field'),
+                ],
+            )
+        )
+
+    start = time.perf_counter()
+    expected = SCHEMA.validate(copy.deepcopy(cfg))
+    schema_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = validate(cfg)
+    fast_time = time.perf_counter() - start
+
+    print(
+        f'SCHEMA: {schema_time:.3f}s, fast: {fast_time:.3f}s, '
+        f'speedup: {schema_time / fast_time:.1f}x'
+    )
+    assert result == expected
+    assert fast_time * 5 < schema_time
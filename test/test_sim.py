@@ -18,7 +18,7 @@
 import os
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import Timer, RisingEdge, ClockCycles, with_timeout
+from cocotb.triggers import Timer, RisingEdge, ReadOnly, ClockCycles, with_timeout
 from cocotb_bus.drivers.amba import AXI4LiteMaster, AXIProtocolError, AXIxRESP
 
 CLK_PERIOD_NS = 10
@@ -28,6 +28,16 @@ MODULE_PATH = os.path.abspath(MODULE_PATH)
 
 TIMEOUT = (10 * CLK_PERIOD_NS, 'ns')
 
+# Interface options the register file was generated with
+THROUGHPUT = os.environ.get('THROUGHPUT', 'basic')
+WRITE_CHANNELS = os.environ.get('WRITE_CHANNELS', 'ordered')
+INDEPENDENT_WRITES = THROUGHPUT == 'full' or WRITE_CHANNELS == 'independent'
+READ_LATENCY = int(os.environ.get('READ_LATENCY') or (1 if THROUGHPUT == 'full' else 2))
+
+# Clock cycles per write and per read when transactions are issued back to back
+WRITE_CYCLES = 1 if INDEPENDENT_WRITES else 3
+READ_CYCLES = 1 if THROUGHPUT == 'full' else READ_LATENCY + 1
+
 
 def setup_dut(dut):
     cocotb.start_soon(Clock(dut.regs_aclk, CLK_PERIOD_NS, units='ns').start())
@@ -288,6 +298,293 @@ async def upd_pulse(dut):
     dut._log.info('Test complete')
 
 
+@cocotb.test()
+async def back_to_back(dut):
+    """Issue writes and reads back to back and measure the throughput.
+
+    Writes alone, reads alone, and writes and reads together are each issued
+    with valid held high, so a new transaction is offered every clock cycle.
+
+    Expected Results:
+        The cycles per transaction match the interface options, and the last
+        value written is read back.
+    """
+    num = 32
+
+    setup_dut(dut)
+    dut.R_Test_Register_I.setimmediatevalue(0xFEEDBACE)
+    dut.regs_awvalid.value = 0
+    dut.regs_wvalid.value = 0
+    dut.regs_arvalid.value = 0
+    dut.regs_bready.value = 1
+    dut.regs_rready.value = 1
+    await reset(dut.regs_aresetn, 5 * CLK_PERIOD_NS, units='ns')
+    await ClockCycles(dut.regs_aclk, 5)
+
+    async def measure(writes, reads):
+        responses = dict(b=[], r=[])
+        monitors = [
+            cocotb.start_soon(
+                record_handshakes(
+                    dut.regs_aclk, dut.regs_bvalid, dut.regs_bready, responses['b']
+                )
+            ),
+            cocotb.start_soon(
+                record_handshakes(
+                    dut.regs_aclk,
+                    dut.regs_rvalid,
+                    dut.regs_rready,
+                    responses['r'],
+                    (dut.regs_rdata, dut.regs_rresp),
+                )
+            ),
+        ]
+        drivers = []
+        if writes:
+            drivers += [
+                cocotb.start_soon(
+                    drive_channel(
+                        dut.regs_aclk,
+                        dut.regs_awvalid,
+                        dut.regs_awready,
+                        [{dut.regs_awaddr: 4}] * num,
+                    )
+                ),
+                cocotb.start_soon(
+                    drive_channel(
+                        dut.regs_aclk,
+                        dut.regs_wvalid,
+                        dut.regs_wready,
+                        [{dut.regs_wdata: i, dut.regs_wstrb: 0xF} for i in range(num)],
+                    )
+                ),
+            ]
+        if reads:
+            drivers.append(
+                cocotb.start_soon(
+                    drive_channel(
+                        dut.regs_aclk,
+                        dut.regs_arvalid,
+                        dut.regs_arready,
+                        [{dut.regs_araddr: 0}] * num,
+                    )
+                )
+            )
+        for driver in drivers:
+            await with_timeout(driver, 10 * num * CLK_PERIOD_NS, 'ns')
+        await ClockCycles(dut.regs_aclk, 10)
+        for monitor in monitors:
+            monitor.kill()
+
+        results = []
+        for channel, enabled in (('b', writes), ('r', reads)):
+            cycles = responses[channel]
+            if enabled:
+                assert len(cycles) == num
+                results.append((cycles[-1][0] - cycles[0][0]) / (num - 1))
+        return results, responses
+
+    (writes,), _ = await measure(writes=True, reads=False)
+    dut._log.info(f'Write cycles per transaction: {writes:.2f}')
+    (reads,), responses = await measure(writes=False, reads=True)
+    dut._log.info(f'Read cycles per transaction: {reads:.2f}')
+    assert all(data == 0xFEEDBACE for _, data, _ in responses['r'])
+    both, _ = await measure(writes=True, reads=True)
+    dut._log.info(
+        f'Write and read cycles per transaction together: {both[0]:.2f}, {both[1]:.2f}'
+    )
+    assert [writes, reads, *both] == [WRITE_CYCLES, READ_CYCLES] * 2
+
+    dut.regs_arvalid.value = 0
+    axim = AXI4LiteMaster(dut, 'regs', dut.regs_aclk)
+    assert await with_timeout(axim.read(0x0004), *TIMEOUT) == num - 1
+
+
+@cocotb.test()
+async def write_channel_order(dut):
+    """Write with the address first, the data first, and both together.
+
+    Expected Results:
+        With independent write channels, the data is accepted before the
+        address and the write response follows one cycle after the later of
+        the two in every order. Otherwise the data waits for the address, and
+        the response takes two cycles unless the address comes first.
+    """
+    setup_dut(dut)
+    dut.regs_awvalid.value = 0
+    dut.regs_wvalid.value = 0
+    dut.regs_arvalid.value = 0
+    dut.regs_bready.value = 1
+    await reset(dut.regs_aresetn, 5 * CLK_PERIOD_NS, units='ns')
+    await ClockCycles(dut.regs_aclk, 5)
+
+    async def delayed(delay, coro):
+        if delay:
+            await ClockCycles(dut.regs_aclk, delay)
+        await coro
+
+    # Address and data delays in clock cycles, and the cycles from the later
+    # of the two to the write response with ordered and independent channels
+    orders = [(0, 0, 2, 1), (2, 0, 2, 1), (0, 2, 1, 1)]
+    for value, (aw_delay, w_delay, ordered, independent) in enumerate(orders):
+        handshakes = dict(aw=[], w=[], b=[])
+        monitors = [
+            cocotb.start_soon(
+                record_handshakes(dut.regs_aclk, valid, ready, handshakes[channel])
+            )
+            for channel, valid, ready in (
+                ('aw', dut.regs_awvalid, dut.regs_awready),
+                ('w', dut.regs_wvalid, dut.regs_wready),
+                ('b', dut.regs_bvalid, dut.regs_bready),
+            )
+        ]
+        await RisingEdge(dut.regs_aclk)
+        drivers = [
+            cocotb.start_soon(
+                delayed(
+                    aw_delay,
+                    drive_channel(
+                        dut.regs_aclk,
+                        dut.regs_awvalid,
+                        dut.regs_awready,
+                        [{dut.regs_awaddr: 4}],
+                    ),
+                )
+            ),
+            cocotb.start_soon(
+                delayed(
+                    w_delay,
+                    drive_channel(
+                        dut.regs_aclk,
+                        dut.regs_wvalid,
+                        dut.regs_wready,
+                        [{dut.regs_wdata: value, dut.regs_wstrb: 0xF}],
+                    ),
+                )
+            ),
+        ]
+        for driver in drivers:
+            await with_timeout(driver, *TIMEOUT)
+        await ClockCycles(dut.regs_aclk, 5)
+        for monitor in monitors:
+            monitor.kill()
+
+        (aw,), (w,), (b,) = handshakes['aw'], handshakes['w'], handshakes['b']
+        latency = b[0] - 1 - max(aw_delay, w_delay)
+        dut._log.info(
+            f'Address delay {aw_delay}, data delay {w_delay}: '
+            f'write response after {latency} cycles'
+        )
+        assert latency == (independent if INDEPENDENT_WRITES else ordered)
+        if w_delay < aw_delay:
+            assert (w[0] < aw[0]) == INDEPENDENT_WRITES
+        assert dut.R_Scratch_Register_O.value == value
+
+
+@cocotb.test()
+async def read_latency(dut):
+    """Measure the read latency, then read while the read data is stalled.
+
+    Expected Results:
+        The read data is valid the configured number of cycles after the read
+        address is accepted. Reads of different addresses issued back to back
+        return their own data and response in order when the read data channel
+        is not always ready.
+    """
+    setup_dut(dut)
+    dut.R_Test_Register_I.setimmediatevalue(0xFEEDBACE)
+    axim = AXI4LiteMaster(dut, 'regs', dut.regs_aclk)
+    await reset(dut.regs_aresetn, 5 * CLK_PERIOD_NS, units='ns')
+    await ClockCycles(dut.regs_aclk, 5)
+    await with_timeout(axim.write(0x0004, 0x12345678), *TIMEOUT)
+
+    async def read(addresses, rready):
+        handshakes = dict(ar=[], r=[])
+        monitors = [
+            cocotb.start_soon(
+                record_handshakes(
+                    dut.regs_aclk, dut.regs_arvalid, dut.regs_arready, handshakes['ar']
+                )
+            ),
+            cocotb.start_soon(
+                record_handshakes(
+                    dut.regs_aclk,
+                    dut.regs_rvalid,
+                    dut.regs_rready,
+                    handshakes['r'],
+                    (dut.regs_rdata, dut.regs_rresp),
+                )
+            ),
+        ]
+        await RisingEdge(dut.regs_aclk)
+        driver = cocotb.start_soon(
+            drive_channel(
+                dut.regs_aclk,
+                dut.regs_arvalid,
+                dut.regs_arready,
+                [{dut.regs_araddr: address} for address in addresses],
+            )
+        )
+        for cycle in range(20 * len(addresses)):
+            dut.regs_rready.value = rready[cycle % len(rready)]
+            await RisingEdge(dut.regs_aclk)
+        await with_timeout(driver, *TIMEOUT)
+        for monitor in monitors:
+            monitor.kill()
+        dut.regs_rready.value = 0
+        return handshakes
+
+    handshakes = await read([0x0000], [1])
+    latency = handshakes['r'][0][0] - handshakes['ar'][0][0]
+    dut._log.info(f'Read data valid {latency} cycles after the address')
+    assert latency == READ_LATENCY
+
+    expected = [(0xFEEDBACE, 0), (0x12345678, 0), (0, AXIxRESP.SLVERR)]
+    handshakes = await read([0x0000, 0x0004, 0x0008] * 4, [1, 0, 0, 1, 1, 0, 1])
+    assert [tuple(r[1:]) for r in handshakes['r']] == expected * 4
+
+
+async def drive_channel(clk, valid, ready, transfers):
+    """Drive each transfer on a channel, offering the next one immediately.
+
+    Args:
+        clk: Clock signal
+        valid: Valid signal of the channel
+        ready: Ready signal of the channel
+        transfers: List of dictionaries mapping signals to their values
+    """
+    for transfer in transfers:
+        for signal, value in transfer.items():
+            signal.value = value
+        valid.value = 1
+        while True:
+            await ReadOnly()
+            accepted = ready.value == 1
+            await RisingEdge(clk)
+            if accepted:
+                break
+    valid.value = 0
+
+
+async def record_handshakes(clk, valid, ready, handshakes, signals=()):
+    """Record the clock cycle and signal values of each handshake on a channel.
+
+    Args:
+        clk: Clock signal
+        valid: Valid signal of the channel
+        ready: Ready signal of the channel
+        handshakes: List that (cycle, *values) tuples are appended to
+        signals: Signals whose values are recorded with each handshake
+    """
+    cycle = 0
+    while True:
+        await RisingEdge(clk)
+        await ReadOnly()
+        cycle += 1
+        if valid.value == 1 and ready.value == 1:
+            handshakes.append((cycle, *(int(signal.value) for signal in signals)))
+
+
 async def verify_handshake_single(clk, valid, ready, monitor_name=None):
     if monitor_name is None:
         monitor_name = ''
@@ -0,0 +1,120 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import subprocess
+import sys
+import pytest
+import axi4lite_reg_generator
+
+# Budget in milliseconds for the imports of each command, as reported by
+# python -X importtime. Before imports were made lazy, both commands spent over
+# 170 ms importing Jinja2, the schema library, and the package metadata.
+VALIDATE_BUDGET_MS = 100
+VERSION_BUDGET_MS = 150
+
+# Modules that are only needed to generate register files
+HEAVY_MODULES = ('jinja2', 'schema', 'axi4lite_reg_generator.regdef')
+
+
+def _import_time(*args: str) -> list[tuple[str, int]]:
+    """Run a Python command with -X importtime.
+
+    Args:
+        *args: Command line arguments for the interpreter
+
+    Returns:
+        Name and cumulative time in microseconds of each import, in the order
+        reported. Names of nested imports keep their leading indentation.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cumulative, name = line.split('|')
+            imports.append((name[1:], int(cumulative)))
+    return imports
+
+
+def _imported(*args: str) -> set[str]:
+    return {name.strip() for name, _ in _import_time(*args)}
+
+
+def _total_ms(*args: str) -> float:
+    # Nested imports are already included in their parent's cumulative time
+    return sum(t for name, t in _import_time(*args) if name[0] != ' ') / 1000
+
+
+def test_validate_imports():
+    """Verify the validate command does not import generator dependencies.
+
+    Tests:
+        1. Runs the validate command with -X importtime
+        2. Verifies Jinja2, the schema library, and the package metadata are not
+           imported
+    """
+    imports = _imported('-m', 'axi4lite_reg_generator.validate', '--help')
+    for module in (*HEAVY_MODULES, 'importlib.metadata'):
+        assert module not in imports
+
+
+def test_version_imports():
+    """Verify --version does not import generator dependencies.
+
+    Tests:
+        1. Runs the generator with --version and -X importtime
+        2. Verifies Jinja2 and the schema library are not imported
+    """
+    imports = _imported('-m', 'axi4lite_reg_generator', '--version')
+    for module in HEAVY_MODULES:
+        assert module not in imports
+
+
+def test_startup_budget():
+    """Verify startup import time stays under budget.
+
+    Tests:
+        1. Sums the import time of validate and --version, keeping the fastest of
+           three runs to reduce noise
+        2. Verifies each is under its fixed budget
+    """
+    for args, budget in (
+        (('-m', 'axi4lite_reg_generator.validate', '--help'), VALIDATE_BUDGET_MS),
+        (('-m', 'axi4lite_reg_generator', '--version'), VERSION_BUDGET_MS),
+    ):
+        total = min(_total_ms(*args) for _ in range(3))
+        assert total < budget, f'{" ".join(args)}: {total:.1f} ms > {budget} ms'
+
+
+def test_lazy_attributes():
+    """Verify lazily loaded package attributes.
+
+    Tests:
+        1. Verifies RegDef and __version__ load on first access
+        2. Verifies an unknown attribute raises AttributeError
+    """
+    from axi4lite_reg_generator.regdef import RegDef
+
+    assert axi4lite_reg_generator.RegDef is RegDef
+    assert isinstance(axi4lite_reg_generator.__version__, str)
+    assert 'RegDef' in dir(axi4lite_reg_generator)
+    with pytest.raises(AttributeError):
+        axi4lite_reg_generator.not_an_attribute
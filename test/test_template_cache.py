@@ -0,0 +1,147 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import os
+import threading
+import axi4lite_reg_generator
+import axi4lite_reg_generator.template_cache as template_cache
+
+test_dir = os.path.dirname(__file__)
+json_file_path = os.path.join(test_dir, 'test_json.json')
+
+
+def test_shared_environment():
+    """Verify the environment and compiled templates are shared across renders.
+
+    Tests:
+        1. Same environment is returned for the same template directory
+        2. Same compiled template object is returned on repeated lookups
+        3. Register filters are installed on the shared environment
+    """
+    j2env = template_cache.get_environment()
+    assert template_cache.get_environment() is j2env
+    assert 'count_bits' in j2env.filters
+
+    template = template_cache.get_template('axi4lite_template.vhd')
+    assert template_cache.get_template('axi4lite_template.vhd') is template
+
+
+def test_template_reload(tmp_path):
+    """Verify a cached template is recompiled when the file changes.
+
+    Tests:
+        1. Renders a template from a temporary directory
+        2. Rewrites the template with a newer modification time
+        3. Verifies the new template content is rendered
+    """
+    template_file = tmp_path / 'test.txt'
+    template_file.write_text('first {{ value }}')
+    assert (
+        template_cache.get_template('test.txt', str(tmp_path)).render(value=1)
+        == 'first 1'
+    )
+
+    template_file.write_text('second {{ value }}')
+    mtime = os.stat(template_file).st_mtime + 10
+    os.utime(template_file, (mtime, mtime))
+    assert (
+        template_cache.get_template('test.txt', str(tmp_path)).render(value=1)
+        == 'second 1'
+    )
+
+
+def test_bytecode_cache(tmp_path):
+    """Verify the optional on-disk bytecode cache is populated.
+
+    Tests:
+        1. Loads a template with a bytecode cache directory
+        2. Verifies compiled bytecode was written to the directory
+        3. Verifies a fresh environment renders the same output from the cache
+    """
+    cache_dir = tmp_path / 'cache'
+    template = template_cache.get_template('doc.md', bytecode_cache_dir=str(cache_dir))
+    assert len(os.listdir(cache_dir)) == 1
+
+    template_cache.clear()
+    cached = template_cache.get_template('doc.md', bytecode_cache_dir=str(cache_dir))
+    assert cached is not template
+    assert cached.render(regs=[]) == template.render(regs=[])
+
+
+def test_threaded_render():
+    """Verify renders from several threads produce identical output.
+
+    Tests:
+        1. Clears the cache so threads race to create the environment
+        2. Renders VHDL from several threads at once
+        3. Verifies every thread produced the same output
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    template_cache.clear()
+
+    results = []
+
+    def render():
+        results.append(reg.to_vhdl())
+
+    threads = [threading.Thread(target=render) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 8
+    assert len(set(results)) == 1
+
+
+def test_compiled_templates(tmp_path, monkeypatch):
+    """Verify precompiled templates are used only when they are current.
+
+    Tests:
+        1. Compiles the package templates into a temporary directory
+        2. Verifies they are loaded as modules and render the same output
+        3. Verifies other template directories still load from files
+        4. Verifies templates compiled from other sources are not used
+    """
+    import json
+    import jinja2
+
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    template_cache.clear()
+    expected = reg.render_all()
+
+    template_cache.compile_templates(str(tmp_path))
+    monkeypatch.setattr(template_cache, 'COMPILED_DIR', str(tmp_path))
+    template_cache.clear()
+    try:
+        assert isinstance(template_cache.get_environment().loader, jinja2.ModuleLoader)
+        assert reg.render_all() == expected
+        assert isinstance(
+            template_cache.get_environment(str(tmp_path)).loader,
+            jinja2.FileSystemLoader,
+        )
+
+        manifest_file = tmp_path / template_cache.COMPILED_MANIFEST
+        manifest = json.loads(manifest_file.read_text())
+        manifest['templates']['doc.md'] = '0' * 64
+        manifest_file.write_text(json.dumps(manifest))
+        template_cache.clear()
+        assert isinstance(
+            template_cache.get_environment().loader, jinja2.FileSystemLoader
+        )
+    finally:
+        template_cache.clear()
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import axi4lite_reg_generator
@@ -82,3 +83,128 @@ def test_missing_hash():
             'Hash should be missing'
         )
         os.remove(out_file)
+
+
+def test_line_endings():
+    """
+    Test that files with converted line endings are still valid.
+    """
+    out_file_base = os.path.join(test_dir, '_test_line_endings')
+
+    sys.argv = ['', json_file_path, '-o', out_file_base]
+    main_reg()
+
+    for newline in ('\r\n', '\r'):
+        for ext in ('.vhd', '.v', '.sv', '.md'):
+            with open(out_file_base + ext, 'r') as f:
+                content = f.read()
+            with open(out_file := out_file_base + ext, 'w', newline=newline) as f:
+                f.write(content)
+            result = axi4lite_reg_generator.validate.check_file(out_file)
+            assert result['status'] == 'valid', result
+
+    for ext in ('.vhd', '.v', '.sv', '.md'):
+        os.remove(out_file_base + ext)
+
+
+def test_chunk_boundaries(monkeypatch):
+    """
+    Test that hashing in small chunks matches hashing in one pass.
+    """
+    out_file_base = os.path.join(test_dir, '_test_chunk_boundaries')
+
+    sys.argv = ['', json_file_path, '-o', out_file_base]
+    main_reg()
+
+    # Windows line endings put \r\n pairs across chunk boundaries
+    with open(out_file_base + '.vhd', 'r') as f:
+        content = f.read()
+    with open(out_file := out_file_base + '.vhd', 'w', newline='\r\n') as f:
+        f.write(content)
+
+    for chunk_size in (1, 2, 3, 7, 64):
+        monkeypatch.setattr(axi4lite_reg_generator.validate, 'CHUNK_SIZE', chunk_size)
+        result = axi4lite_reg_generator.validate.check_file(out_file)
+        assert result['status'] == 'valid', result
+
+    for ext in ('.vhd', '.v', '.sv', '.md'):
+        os.remove(out_file_base + ext)
+
+
+def test_empty_file():
+    """
+    Test that an empty file is reported as missing its hash.
+    """
+    out_file = os.path.join(test_dir, '_test_empty_file.vhd')
+    open(out_file, 'w').close()
+
+    result = axi4lite_reg_generator.validate.check_file(out_file)
+    assert result['status'] == 'missing_hash'
+    assert axi4lite_reg_generator.validate.validate(out_file)
+    os.remove(out_file)
+
+
+def test_json_summary(capsys):
+    """
+    Test the machine-readable summary of many files checked in parallel.
+    """
+    out_file_base = os.path.join(test_dir, '_test_json_summary')
+    extensions = ('.vhd', '.v', '.sv', '.md')
+
+    sys.argv = ['', json_file_path, '-o', out_file_base]
+    main_reg()
+    capsys.readouterr()
+
+    files = [out_file_base + ext for ext in extensions] * 8
+    assert not axi4lite_reg_generator.validate.validate(
+        *files, jobs=4, json_output=True
+    )
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['valid']
+    assert [r['file'] for r in summary['files']] == files
+    assert all(r['status'] == 'valid' for r in summary['files'])
+    assert all(r['expected'] == r['actual'] for r in summary['files'])
+
+    # Report a missing file and a modified file
+    with open(out_file_base + '.md', 'r+') as f:
+        content = f.read()
+        f.seek(0)
+        f.write('Z' + content)
+
+    sys.argv = [
+        '',
+        '--json',
+        out_file_base + '.vhd',
+        out_file_base + '.md',
+        '_missing_',
+    ]
+    assert axi4lite_reg_generator.validate.main()
+    summary = json.loads(capsys.readouterr().out)
+    assert not summary['valid']
+    assert [r['status'] for r in summary['files']] == [
+        'valid',
+        'mismatch',
+        'missing_file',
+    ]
+
+    for ext in extensions:
+        os.remove(out_file_base + ext)
+
+
+def test_read_hash(tmp_path):
+    """
+    Test reading the trailer hash without hashing the file.
+    """
+    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    for target in ('vhdl', 'md'):
+        file = tmp_path / target
+        hash = reg.render_to_file(target, file)
+        assert axi4lite_reg_generator.validate.read_hash(file) == hash
+
+        file.write_bytes(file.read_bytes().replace(b'\n', b'\r\n'))
+        assert axi4lite_reg_generator.validate.read_hash(file) == hash
+
+    (tmp_path / 'no_trailer').write_text('no trailer\n')
+    (tmp_path / 'empty').write_text('')
+    for name in ('no_trailer', 'empty', 'missing'):
+        assert axi4lite_reg_generator.validate.read_hash(tmp_path / name) is None
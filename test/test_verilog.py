@@ -15,6 +15,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #
 # See LICENSE file for full license details.
+import json
 import os
 import axi4lite_reg_generator
 import subprocess
@@ -26,6 +27,34 @@ test_dir = os.path.dirname(__file__)
 json_file_path = os.path.join(test_dir, 'test_json.json')
 
 
+# Bus interface options, passed to the simulation as environment variables
+interface_options = [
+    dict(throughput='basic'),
+    dict(write_channels='independent'),
+    dict(throughput='full'),
+    dict(read_latency=1),
+    dict(read_latency=3),
+    dict(throughput='full', read_latency=3),
+    dict(read_mux='tree'),
+    dict(read_mux='tree', read_latency=1),
+    dict(throughput='full', read_mux='tree', read_latency=4),
+    dict(write_decode='onehot'),
+    dict(throughput='full', write_decode='onehot'),
+]
+
+
+def option_id(options: dict) -> str:
+    return '-'.join(f'{key}={value}' for key, value in options.items())
+
+
+def load_regs(options: dict) -> axi4lite_reg_generator.RegDef:
+    """Load the test register map with bus interface options."""
+    with open(json_file_path, 'r') as f:
+        cfg = json.load(f)
+    cfg[0]['config'].update(options)
+    return axi4lite_reg_generator.RegDef(cfg, test_dir)
+
+
 def test_check_verilator_installed():
     """Verify Verilator compiler is installed and accessible.
 
@@ -44,7 +73,8 @@ def test_check_verilator_installed():
         assert False, 'Icarus not found in path'
 
 
-def test_basic_verilog():
+@pytest.mark.parametrize('options', interface_options, ids=option_id)
+def test_basic_verilog(options):
     """Verify generated Verilog code compiles with Verilator.
 
     Tests:
@@ -55,7 +85,7 @@ def test_basic_verilog():
     Cleanup:
         Removes temporary Verilog file
     """
-    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    reg = load_regs(options)
     test_file = os.path.join(test_dir, f'_test_{uuid.uuid4().hex}.v')
     with open(test_file, 'w') as f:
         f.write(reg.to_verilog())
@@ -71,17 +101,18 @@ def test_basic_verilog():
     )
 
 
+@pytest.mark.parametrize('options', interface_options, ids=option_id)
 @pytest.mark.parametrize('hdl_type', ['v', 'sv'])
 @pytest.mark.parametrize('register_inputs', [0, 1])
-def test_verilogsim(hdl_type, register_inputs):
+def test_verilogsim(hdl_type, register_inputs, options):
     """Test Verilog RTL simulation of generated register file.
 
     Tests:
-        1. Generates Verilog code
+        1. Generates Verilog code with the given interface options
         2. Runs cocotb simulation
         3. Verifies simulation completes successfully
     """
-    reg = axi4lite_reg_generator.RegDef.from_json_file(json_file_path)
+    reg = load_regs(options)
     test_file = os.path.join(test_dir, f'_test.{hdl_type}')
     with open(test_file, 'w') as f:
         if hdl_type == 'sv':
@@ -96,5 +127,6 @@ def test_verilogsim(hdl_type, register_inputs):
         module='test.test_sim',
         simulator='icarus',
         parameters=dict(REGISTER_INPUTS=register_inputs),
+        extra_env={key.upper(): str(value) for key, value in options.items()},
         timescale='1ns/1ns',
     )
@@ -0,0 +1,146 @@
+# Copyright (C) 2025 KEELFW
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+#
+# See LICENSE file for full license details.
+import json
+import os
+import shutil
+import pytest
+from axi4lite_reg_generator import RegDef
+from axi4lite_reg_generator.validate import check_file
+from axi4lite_reg_generator.watch import Watcher
+
+test_dir = os.path.dirname(__file__)
+TARGETS = ('vhdl', 'verilog', 'systemverilog', 'md')
+
+
+def _setup(tmp_path, log=lambda _: None) -> Watcher:
+    for name in ('test_heir_top.json', 'test_json.json'):
+        shutil.copy(os.path.join(test_dir, name), tmp_path / name)
+    outputs = {target: str(tmp_path / f'out.{target}') for target in TARGETS}
+    return Watcher(str(tmp_path / 'test_heir_top.json'), outputs, log=log)
+
+
+def _edit(path, edit) -> None:
+    """Edit a JSON file and move its modification time forward."""
+    with open(path, 'r') as f:
+        cfg = json.load(f)
+    edit(cfg)
+    mtime = os.stat(path).st_mtime_ns
+    with open(path, 'w') as f:
+        json.dump(cfg, f)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def test_watched_files(tmp_path):
+    """Verify the top level file and its includes are watched.
+
+    Tests:
+        1. Builds the hierarchy example
+        2. Verifies every output is written with a valid hash
+        3. Verifies the top level and included files are watched
+    """
+    watcher = _setup(tmp_path)
+    assert len(watcher.build()) == len(TARGETS)
+    for target in TARGETS:
+        assert check_file(str(tmp_path / f'out.{target}'))['status'] == 'valid'
+    assert [os.path.basename(f) for f in watcher.files] == [
+        'test_heir_top.json',
+        'test_json.json',
+    ]
+    assert not watcher.changed()
+
+
+def test_only_changed_outputs_written(tmp_path):
+    """Verify only outputs whose content changed are rewritten.
+
+    Tests:
+        1. Touching a file without changing it is not a change
+        2. Changing a description in an include only rewrites the documentation
+        3. Changing register bits rewrites every output
+        4. Each output matches a fresh build apart from its generation time
+    """
+    watcher = _setup(tmp_path)
+    watcher.build()
+    include = tmp_path / 'test_json.json'
+
+    os.utime(include, ns=(1, 1))
+    assert not watcher.changed()
+
+    _edit(include, lambda cfg: cfg[1].update(description='New description'))
+    assert watcher.changed()
+    assert watcher.build() == [str(tmp_path / 'out.md')]
+
+    _edit(include, lambda cfg: cfg[1].update(bits=16))
+    assert watcher.changed()
+    assert len(watcher.build()) == len(TARGETS)
+
+    regs = RegDef.from_json_file(str(tmp_path / 'test_heir_top.json'))
+    for target in TARGETS:
+        with open(tmp_path / f'out.{target}', 'r') as f:
+            lines = f.read().splitlines()
+        expected = regs._render_target(target).splitlines()
+        # The header line with the generation time and the hash trailer differ
+        diff = [i for i, (a, b) in enumerate(zip(lines, expected)) if a != b]
+        assert len(lines) == len(expected)
+        assert len(diff) <= 2
+
+
+def test_error_recovery(tmp_path):
+    """Verify the watcher recovers once a broken file is fixed.
+
+    Tests:
+        1. Breaks the included file and verifies the build fails
+        2. Verifies the broken file is still watched
+        3. Fixes the file and verifies the next build succeeds
+    """
+    watcher = _setup(tmp_path)
+    watcher.build()
+    include = tmp_path / 'test_json.json'
+    good = include.read_text()
+
+    include.write_text('[')
+    assert watcher.changed()
+    with pytest.raises(ValueError):
+        watcher.build()
+    assert str(include) in watcher.files
+
+    include.write_text(good.replace('Test_Register', 'Fixed_Register'))
+    assert watcher.changed()
+    assert len(watcher.build()) == len(TARGETS)
+
+
+def test_run(tmp_path):
+    """Verify the watch loop rebuilds after a change.
+
+    Tests:
+        1. Runs the loop, editing the top level file after the first check
+        2. Verifies the outputs are built and then rebuilt once
+    """
+    messages = []
+    watcher = _setup(tmp_path, messages.append)
+    top = tmp_path / 'test_heir_top.json'
+    checks = []
+
+    def stop():
+        checks.append(None)
+        if len(checks) == 2:
+            _edit(top, lambda cfg: cfg[1].update(bits=8))
+        return len(checks) > 3
+
+    watcher.run(interval=0, stop=stop)
+    written = [m for m in messages if m.startswith('Wrote: ')]
+    assert len(written) == 2 * len(TARGETS)